@@ -1,13 +1,47 @@
-"""Python-first UI component library for StarHTML applications."""
+"""Python-first UI component library for StarHTML applications.
+
+Exports resolve on first access so ``from starui import Button`` only loads the
+button module. Components take precedence over the ``rusty_tags`` HTML tags of
+the same name, as they did when both were star-imported here.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.1.0"
 
-# Import rusty_tags first so components can access it
-from rusty_tags import *
+_SUBMODULES = {"cli", "config", "css", "dev", "registry", "render", "templates"}
+
+if TYPE_CHECKING:
+    from rusty_tags import *  # noqa: F403
+
+    from .registry.components import *  # noqa: F403
+
+
+def _all() -> list[str]:
+    components = import_module(".registry.components", __name__).__all__
+    taken = set(components)
+    tags = import_module("rusty_tags").__all__
+    return [*components, *(name for name in tags if name not in taken)]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__all__":
+        value = _all()
+    elif name in _SUBMODULES:
+        return import_module(f".{name}", __name__)
+    elif (
+        name in (components := import_module(".registry.components", __name__)).__all__
+    ):
+        value = getattr(components, name)
+    elif name in (tags := import_module("rusty_tags")).__all__:
+        value = getattr(tags, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Import all components from the components module
-from .registry.components import *
+    globals()[name] = value
+    return value
 
-# Import utilities
-from .registry.components.utils import cn, cva
 
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_all()})
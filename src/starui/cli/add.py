@@ -1,14 +1,20 @@
+import importlib.metadata
+import importlib.util
 import re
 import subprocess
+import tomllib
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
 from starui.config import get_project_config
-from starui.registry.component_metadata import get_component_metadata
-from starui.registry.loader import ComponentLoader
 
 from .utils import confirm, console, error, info, status_context, success, warning
 
+if TYPE_CHECKING:
+    from starui.registry.loader import InstallPlan
+
 
 def _setup_code_highlighting(config, theme: str | None) -> None:
     try:
@@ -92,11 +98,113 @@ def _setup_css_imports(config, css_imports: list[str]) -> None:
         input_css.write_text(content)
 
 
+def _normalize(package: str) -> str:
+    return re.sub(r"[-_.]+", "-", package).lower()
+
+
+def _declared_packages(project_root: Path) -> set[str]:
+    """Normalized names of the packages pyproject.toml depends on."""
+    try:
+        with open(project_root / "pyproject.toml", "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return set()
+
+    project = data.get("project", {})
+    requirements = list(project.get("dependencies", []))
+    for group in [
+        *project.get("optional-dependencies", {}).values(),
+        *data.get("dependency-groups", {}).values(),
+    ]:
+        requirements.extend(r for r in group if isinstance(r, str))
+
+    return {
+        _normalize(match.group())
+        for requirement in requirements
+        if (match := re.match(r"[A-Za-z0-9][A-Za-z0-9._-]*", requirement.strip()))
+    }
+
+
+def _is_installed(package: str) -> bool:
+    try:
+        importlib.metadata.distribution(package)
+        return True
+    except importlib.metadata.PackageNotFoundError:
+        return importlib.util.find_spec(package.replace("-", "_")) is not None
+
+
+def _install_packages(packages: set[str], project_root: Path) -> None:
+    """Install the packages that aren't available yet with a single `uv add`."""
+    declared = _declared_packages(project_root)
+    skipped = sorted(
+        p for p in packages if _normalize(p) in declared or _is_installed(p)
+    )
+    missing = sorted(packages - set(skipped))
+
+    if skipped:
+        info(f"Already available: {', '.join(skipped)}")
+    if not missing:
+        return
+
+    info(f"Installing packages: {', '.join(missing)}")
+    try:
+        subprocess.run(
+            ["uv", "add", *missing],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=project_root,
+        )
+        success(f"Installed: {', '.join(missing)}")
+    except FileNotFoundError:
+        warning(f"uv not found. Install manually: uv add {' '.join(missing)}")
+    except subprocess.CalledProcessError as e:
+        warning(f"Failed to install {', '.join(missing)}: {e.stderr}")
+
+
+def _show_plan(
+    plan: "InstallPlan",
+    existing: list[Path],
+    packages: set[str],
+    css_imports: list[str],
+    shaken: dict[str, list[str] | None] | None = None,
+) -> None:
+    existing_names = {path.stem for path in existing}
+
+    console.print("[bold]Install plan:[/bold]")
+    for i, name in enumerate(plan.order, 1):
+        note = (
+            " [yellow](overwrites existing file)[/yellow]"
+            if name in existing_names
+            else ""
+        )
+        if shaken is not None:
+            if name not in shaken:
+                note += " [dim](unused, skipped)[/dim]"
+            elif names := shaken[name]:
+                note += f" [dim](only {', '.join(names)})[/dim]"
+        console.print(f"  {i}. {name} [dim]{plan.reason(name)}[/dim]{note}")
+
+    if packages:
+        console.print(f"Packages: {', '.join(sorted(packages))}")
+    if css_imports:
+        console.print(f"CSS imports: {', '.join(css_imports)}")
+    info("Dry run: no files were changed")
+
+
 def add_command(
     components: list[str] = typer.Argument(..., help="Components to add"),
     force: bool = typer.Option(False, "--force", help="Overwrite existing files"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show details"),
     theme: str = typer.Option(None, "--theme", help="Theme for code highlighting"),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show the install plan without writing files"
+    ),
+    shake: bool = typer.Option(
+        False,
+        "--shake",
+        help="Vendor only the functions your project uses (re-run as usage grows)",
+    ),
 ) -> None:
     """Add components to your project."""
 
@@ -104,6 +212,14 @@ def add_command(
         error(f"Invalid component names: {', '.join(invalid)}")
         raise typer.Exit(1)
 
+    from starui.registry.loader import ComponentLoader
+    from starui.registry.lockfile import (
+        Lockfile,
+        text_hash,
+        vendored_source,
+        write_atomic,
+    )
+
     try:
         config = get_project_config()
         loader = ComponentLoader()
@@ -112,20 +228,61 @@ def add_command(
         raise typer.Exit(1) from e
 
     try:
-        resolved = {}
-        for component in components:
-            normalized = component.replace("-", "_")
-            if verbose:
-                info(f"Resolving {component} -> {normalized}...")
-            resolved.update(loader.load_component_with_dependencies(normalized))
+        normalized = [component.replace("-", "_") for component in components]
+        if verbose:
+            for component, name in zip(components, normalized, strict=True):
+                info(f"Resolving {component} -> {name}...")
+        plan = loader.plan(normalized)
+        resolved = {
+            name: vendored_source(source)
+            for name, source in loader.load_plan(plan).items()
+        }
 
         component_dir = config.component_dir_absolute
-        existing = [
-            component_dir / f"{name}.py"
-            for name in resolved
-            if (component_dir / f"{name}.py").exists()
+        shaken_names: dict[str, list[str] | None] = {}
+        if shake:
+            from starui.registry.shaker import project_usage, shake_components
+
+            usage = project_usage(
+                config.project_root, set(plan.order), exclude=component_dir
+            )
+            for name in plan.requested:
+                if name not in usage:
+                    warning(f"No usages of {name} found, vendoring all of it")
+                    usage[name] = None
+            shaken = shake_components(resolved, usage)
+            resolved = {name: content for name, (content, _) in shaken.items()}
+            shaken_names = {name: names for name, (_, names) in shaken.items()}
+
+        # Files that are already identical are left alone, as are files still
+        # as last installed; others need consent
+        lock = Lockfile.load(config.project_root)
+        changed = {}
+        existing = []
+        for name, content in resolved.items():
+            path = component_dir / f"{name}.py"
+            if not path.exists():
+                changed[path] = content
+                continue
+            local = path.read_text(encoding="utf-8")
+            if local != content:
+                changed[path] = content
+                locked = lock.components.get(name)
+                if not locked or text_hash(local) != locked["installed"]:
+                    existing.append(path)
+
+        index = loader.client.index
+        packages = {pkg for name in resolved for pkg in index[name]["packages"]}
+        css_imports = [
+            css_import for name in resolved for css_import in index[name]["css_imports"]
         ]
 
+        if dry_run:
+            _show_plan(
+                plan, existing, packages, css_imports, shaken_names if shake else None
+            )
+            return
+
         if existing and not force:
             warning(f"Found {len(existing)} existing files:")
             for path in existing:
@@ -133,32 +290,8 @@ def add_command(
             if not confirm("Overwrite?", default=False):
                 raise typer.Exit(0)
 
-        packages = {
-            pkg
-            for name in resolved
-            if (metadata := get_component_metadata(name))
-            for pkg in metadata.packages
-        }
-
-        css_imports = [
-            css_import
-            for name in resolved
-            if (metadata := get_component_metadata(name))
-            for css_import in metadata.css_imports
-        ]
-
-        for package in packages:
-            info(f"Installing package: {package}")
-            try:
-                subprocess.run(
-                    ["uv", "add", package],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-                success(f"Installed: {package}")
-            except subprocess.CalledProcessError as e:
-                warning(f"Failed to install {package}: {e.stderr}")
+        if packages:
+            _install_packages(packages, config.project_root)
 
         if "code_block" in resolved:
             _setup_code_highlighting(config, theme)
@@ -170,11 +303,9 @@ def add_command(
             component_dir.mkdir(parents=True, exist_ok=True)
             (component_dir / "__init__.py").touch()
 
-            for name, source in resolved.items():
-                source = re.sub(
-                    r"from\s+\.utils\s+import", "from starui import", source
-                )
-                (component_dir / f"{name}.py").write_text(source)
+            for name, content in resolved.items():
+                lock.record(name, index[name]["hash"], content, shaken_names.get(name))
+            write_atomic({**changed, lock.path: lock.dumps()})
 
         success(f"Installed components: {', '.join(resolved.keys())}")
 
@@ -4,7 +4,6 @@ import typer
 from rich.table import Table
 
 from ..config import detect_project_config
-from ..css.builder import BuildMode, CSSBuilder
 from .utils import console, error, info, success
 
 
@@ -22,6 +21,7 @@ def build_command(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show details"),
 ) -> None:
     """Build production CSS."""
+    from ..css.builder import BuildMode, CSSBuilder
 
     try:
         config = detect_project_config()
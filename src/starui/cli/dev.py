@@ -1,22 +1,27 @@
 """Development server with hot reload and Tailwind CSS."""
 
-import asyncio
-import tempfile
 import time
-from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 from ..config import detect_project_config
-from ..css.binary import TailwindBinaryManager
-from ..dev.analyzer import resolve_port
-from ..dev.process_manager import ProcessManager
 from ..templates.css_input import generate_css_input
 from .utils import console, error, success
 
+if TYPE_CHECKING:
+    from ..dev.process_manager import ProcessManager
+    from ..dev.resources import ResourceMonitor
+
+GENERATED_INPUT_CSS = ".starui-input.css"
+
 
 def get_or_create_css_input(config) -> Path:
     if (existing := config.project_root / "static" / "css" / "input.css").exists():
@@ -25,44 +30,48 @@ def get_or_create_css_input(config) -> Path:
     css_dir = config.css_output_absolute.parent
     css_dir.mkdir(parents=True, exist_ok=True)
 
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".css", dir=css_dir, delete=False
-    ) as tmp:
-        tmp.write(generate_css_input(config))
-        return Path(tmp.name)
+    # Kept across runs and only rewritten when it changes, so Tailwind's cache holds
+    input_css = css_dir / GENERATED_INPUT_CSS
+    content = generate_css_input(config)
+    if not input_css.exists() or input_css.read_text() != content:
+        input_css.write_text(content)
+    return input_css
 
 
-def setup_tailwind(manager: ProcessManager, config, enable_hot_reload: bool = True):
-    from ..dev.unified_reload import DevReloadHandler
+def setup_tailwind(manager: "ProcessManager", config):
+    from ..css.binary import TailwindBinaryManager
 
     input_css = get_or_create_css_input(config)
     binary = Path(TailwindBinaryManager("latest").get_binary())
 
-    async def notify(path: Path):
-        with suppress(Exception):
-            await DevReloadHandler.notify_css_update(path, time.time())
-
+    # CSS hot reload runs inside the app worker, where the browsers are connected
     manager.start_tailwind_watcher(
         binary,
         input_css,
         config.css_output_absolute,
         config.project_root,
-        lambda p: asyncio.run(notify(p)) if enable_hot_reload else None,
     )
     return input_css
 
 
-def wait_for_css(css_path: Path, timeout: int = 10):
+def wait_for_css(
+    css_path: Path, timeout: int = 10, manager: "ProcessManager | None" = None
+):
     if css_path.exists():
         return success("CSS ready")
 
     console.print("[cyan]Building CSS...[/cyan]")
 
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        if css_path.exists():
+    if manager is not None:
+        # Tailwind prints "Done in ..." once its first build is written
+        if manager.wait_ready("tailwind", timeout) and css_path.exists():
             return success("CSS built")
-        time.sleep(0.5)
+    else:
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if css_path.exists():
+                return success("CSS built")
+            time.sleep(0.5)
 
     error("CSS build timed out")
     raise typer.Exit(1)
@@ -89,15 +98,56 @@ def show_status(config, port: int, hot_reload: bool, app_file: str):
     console.print(Panel(table, border_style="green"))
 
 
+def show_latency(latency_file: Path):
+    from ..dev.latency import LatencyLog
+
+    if (log := LatencyLog.load(latency_file)).samples:
+        console.print(log.table())
+
+
+def resource_status(monitor: "ResourceMonitor | None"):
+    """Live status line under the process output, on terminals only."""
+    if monitor is None or not console.is_terminal:
+        return nullcontext()
+
+    return Live(
+        console=console,
+        get_renderable=lambda: Text(monitor.status_line(), style="dim"),
+        refresh_per_second=1,
+        transient=True,
+        redirect_stdout=True,
+        redirect_stderr=True,
+    )
+
+
 def dev_command(
     app_file: str = typer.Argument(..., help="StarHTML app file to run"),
     port: int = typer.Option(5000, "--port", "-p"),
     css_hot_reload: bool = typer.Option(True, "--css-hot/--no-css-hot"),
+    graph_reload: bool = typer.Option(
+        True,
+        "--graph-reload/--no-graph-reload",
+        help="Only reload when files imported by the app change",
+    ),
+    hmr: bool = typer.Option(
+        False,
+        "--hmr/--no-hmr",
+        help="Patch changed elements instead of reloading the page",
+    ),
+    monitor_resources: bool = typer.Option(
+        True,
+        "--monitor/--no-monitor",
+        help="Sample CPU, memory and open files of the dev processes",
+    ),
     strict: bool = typer.Option(False, "--strict"),
     debug: bool = typer.Option(True, "--debug/--no-debug"),
     verbose: bool = typer.Option(False, "--verbose", "-v"),
 ):
     """Start development server with hot reload."""
+    from ..dev.analyzer import resolve_port
+    from ..dev.process_manager import ProcessManager
+    from ..dev.resources import ResourceMonitor
+    from ..dev.startup import StartupTimeline
 
     app_path = Path(app_file)
     if not app_path.exists():
@@ -106,49 +156,82 @@ def dev_command(
 
     config = detect_project_config()
     manager = ProcessManager()
+    timeline = StartupTimeline()
+    monitor = None
     temp_files = []
 
     try:
-        app_port, msg = resolve_port(port, strict, app_path)
+        with timeline.step("port"):
+            app_port, msg = resolve_port(port, strict, app_path)
         if msg:
             console.print(f"[blue]{msg}[/blue]")
     except RuntimeError as e:
         error(str(e))
         raise typer.Exit(1) from e
 
+    def start_tailwind():
+        with timeline.step("tailwind start"):
+            setup_tailwind(manager, config)
+
     try:
-        console.print("[cyan]Starting tailwind...[/cyan]")
-        input_css = setup_tailwind(manager, config, css_hot_reload)
-        if input_css.name.startswith("tmp"):
-            temp_files.append(input_css)
-        wait_for_css(config.css_output_absolute)
-
-        console.print("[cyan]Starting uvicorn...[/cyan]")
-        manager.start_uvicorn(
-            app_path,
-            app_port,
-            ["*.py", "*.html"],
-            css_hot_reload,
-            debug,
-        )
-
-        # Collect wrapper files for cleanup (now in temp dir)
-        temp_dir = Path(tempfile.gettempdir())
-        temp_files.extend(temp_dir.glob(f"starui_dev_{app_path.stem}_*.py"))
+        # Tailwind and uvicorn don't depend on each other, so both start at once
+        console.print("[cyan]Starting tailwind and uvicorn...[/cyan]")
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            tailwind = pool.submit(start_tailwind)
+            with timeline.step("uvicorn start"):
+                manager.start_uvicorn(
+                    app_path,
+                    app_port,
+                    ["*.py", "*.html"],
+                    css_hot_reload,
+                    debug,
+                    graph_reload,
+                    hmr,
+                    config.css_output_absolute if css_hot_reload else None,
+                )
+            tailwind.result()
+
+        # The wrapper module is reused across runs; per-run files, its owner mark
+        # included, are not
+        temp_files.append(manager.graph_file(app_path))
+        temp_files.append(manager.latency_file(app_path))
+        temp_files.append(manager.restart_file(app_path))
+        temp_files.append(manager.wrapper_owner)
         temp_files.extend(config.css_output_absolute.parent.glob("tmp*.css"))
 
+        with timeline.step("css"):
+            wait_for_css(config.css_output_absolute, manager=manager)
+        if not manager.wait_ready("uvicorn"):
+            error("uvicorn failed to start")
+            raise typer.Exit(1)
+        timeline.mark("tailwind build", manager.ready_at.get("tailwind"))
+        timeline.mark("uvicorn ready", manager.ready_at.get("uvicorn"))
+
         success(f"Server running at http://localhost:{app_port}")
         show_status(config, app_port, css_hot_reload, app_file)
+        console.print(f"[dim]{timeline.summary()}[/dim]")
+        if verbose:
+            console.print(timeline.table())
         console.print("[dim]Press Ctrl+C to stop[/dim]\n")
 
+        if monitor_resources:
+            monitor = ResourceMonitor(manager, manager.resources_file(app_path))
+            monitor.start()
+
         try:
-            manager.wait_for_any_exit()
+            with resource_status(monitor):
+                manager.wait_for_any_exit()
         except KeyboardInterrupt:
             console.print("\n[yellow]Shutting down...[/yellow]")
 
+    except typer.Exit:
+        raise
     except Exception as e:
         error(f"Dev server error: {e}")
         raise typer.Exit(1) from e
     finally:
         manager.stop_all()
+        show_latency(manager.latency_file(app_path))
+        if monitor and monitor.log_file and monitor.log_file.exists():
+            console.print(f"[dim]Resource samples: {monitor.log_file}[/dim]")
         cleanup(*temp_files)
@@ -4,8 +4,7 @@ import typer
 from rich.progress import track
 
 from ..config import ProjectConfig, detect_project_config
-from ..registry.client import RegistryClient
-from ..registry.loader import ComponentLoader
+from ..registry.client import get_registry_client
 from ..templates.app_starter import generate_app_starter
 from ..templates.css_input import generate_css_input
 from .utils import confirm, console, error, info
@@ -63,8 +62,10 @@ def create_css_input(config: ProjectConfig, verbose: bool = False) -> None:
 
 
 def add_default_components(config: ProjectConfig, verbose: bool = False) -> None:
+    from ..registry.loader import ComponentLoader
+
     try:
-        client = RegistryClient()
+        client = get_registry_client()
         loader = ComponentLoader(client)
 
         # Utils needed by all components
@@ -5,7 +5,7 @@ import typer
 from rich.table import Table
 from rich.text import Text
 
-from starui.registry.client import RegistryClient
+from starui.registry.client import get_registry_client
 
 from .utils import console, error, info
 
@@ -20,14 +20,13 @@ CATEGORY_KEYWORDS = {
 }
 
 
-def is_installed(name: str) -> bool:
+def installed_components() -> set[str]:
     cwd = Path.cwd()
-    paths = [
-        cwd / "components" / "ui" / f"{name}.py",
-        cwd / "components" / f"{name}.py",
-        cwd / "ui" / f"{name}.py",
-    ]
-    return any(p.exists() for p in paths)
+    installed = set()
+    for directory in (cwd / "components" / "ui", cwd / "components", cwd / "ui"):
+        if directory.is_dir():
+            installed.update(path.stem for path in directory.glob("*.py"))
+    return installed
 
 
 def get_category(component: dict[str, Any]) -> str | None:
@@ -49,7 +48,7 @@ def list_command(
     """List available components."""
 
     try:
-        client = RegistryClient()
+        client = get_registry_client()
         names = client.list_components()
 
         if not names:
@@ -57,11 +56,12 @@ def list_command(
             return
 
         # Get metadata
+        installed_names = installed_components()
         components: list[dict[str, Any]] = []
         for name in names:
             try:
                 meta = client.get_component_metadata(name)
-                meta["installed"] = is_installed(name)
+                meta["installed"] = name in installed_names
                 components.append(meta)
             except Exception as e:
                 error(f"Failed to load {name}: {e}")
@@ -8,6 +8,7 @@ from .build import build_command
 from .dev import dev_command
 from .init import init_command
 from .list import list_command
+from .update import update_command
 
 app = typer.Typer(
     name="star",
@@ -41,6 +42,7 @@ app.command("init")(init_command)
 app.command("dev")(dev_command)
 app.command("build")(build_command)
 app.command("list")(list_command)
+app.command("update")(update_command)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+from pathlib import Path
+
+import typer
+
+from starui.config import get_project_config
+
+from .utils import confirm, console, error, info, success, warning
+
+
+def update_command(
+    components: list[str] | None = typer.Argument(
+        None, help="Components to update (default: all vendored components)"
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Overwrite locally modified files"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show what would change without writing files"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show details"),
+) -> None:
+    """Update vendored components from the registry."""
+    from rich.syntax import Syntax
+
+    from starui.registry.loader import ComponentLoader
+    from starui.registry.lockfile import Lockfile, plan_updates, write_atomic
+    from starui.registry.shaker import project_usage
+
+    try:
+        config = get_project_config()
+        loader = ComponentLoader()
+        lock = Lockfile.load(config.project_root)
+        names = [c.replace("-", "_") for c in components] if components else None
+        component_dir = config.component_dir_absolute
+        shaken = {name for name, entry in lock.components.items() if "names" in entry}
+        usage = (
+            project_usage(config.project_root, shaken, exclude=component_dir)
+            if shaken
+            else None
+        )
+        updates = plan_updates(loader, lock, component_dir, names, usage)
+    except Exception as e:
+        error(f"Update failed: {e}")
+        raise typer.Exit(1) from e
+
+    if not updates:
+        info("No vendored components found")
+        return
+
+    files: dict[Path, str] = {}
+    for update in updates:
+        if update.status == "unchanged":
+            if verbose:
+                console.print(f"  [dim]{update.name}: up to date[/dim]")
+            if update.content is not None:
+                lock.record(
+                    update.name, update.registry_hash, update.content, update.names
+                )
+            continue
+
+        if update.content is None:
+            error(f"Update failed: no registry source for {update.name}")
+            raise typer.Exit(1)
+        if update.status == "modified":
+            warning(f"{update.name} has local changes:")
+            console.print(Syntax(update.diff(), "diff", theme="ansi_dark"))
+            if dry_run or not (
+                force or confirm(f"Overwrite {update.path.name}?", default=False)
+            ):
+                console.print(f"  [yellow]Kept[/yellow] {update.path}")
+                continue
+        else:
+            label = "Update" if update.status == "update" else "Restore"
+            console.print(f"  [green]{label}[/green] {update.path}")
+
+        files[update.path] = update.content
+        lock.record(update.name, update.registry_hash, update.content, update.names)
+
+    unchanged = sum(update.status == "unchanged" for update in updates)
+    if dry_run:
+        info(f"Dry run: {len(files)} to write, {unchanged} unchanged")
+        return
+
+    written = len(files)
+    lock_text = lock.dumps()
+    if not lock.path.exists() or lock.path.read_text(encoding="utf-8") != lock_text:
+        files[lock.path] = lock_text
+    if files:
+        write_atomic(files)
+
+    if written:
+        success(f"Updated {written} components ({unchanged} unchanged)")
+    else:
+        success(f"All {unchanged} components are up to date")
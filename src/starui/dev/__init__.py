@@ -1,6 +1,7 @@
 """StarUI development tools."""
 
 from .analyzer import detect_app_port, find_port, port_available, resolve_port
+from .import_graph import ImportGraph, build_import_graph
 from .unified_reload import DevReloadHandler, DevReloadJs, create_dev_reload_route
 
 __all__ = [
@@ -8,6 +9,8 @@ __all__ = [
     "find_port",
     "port_available",
     "resolve_port",
+    "ImportGraph",
+    "build_import_graph",
     "DevReloadHandler",
     "DevReloadJs",
     "create_dev_reload_route",
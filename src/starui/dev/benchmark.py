@@ -0,0 +1,262 @@
+"""Headless benchmark for the dev reload loop.
+
+Runs the ``star dev`` uvicorn worker on a generated sample app, applies scripted
+edits, and answers reload notifications with a WebSocket client standing in for
+the browser. Per-hop timings come from the worker's latency log; the client adds
+its own save-to-applied measurement.
+
+With ``--restart`` the edits go to the app module instead, so each one restarts
+the worker. The client then reconnects as soon as the port is back, where a
+browser tab waits out its reconnect interval first.
+
+    python -m starui.dev.benchmark --edits 20 --hmr --css
+"""
+
+import asyncio
+import json
+import tempfile
+import time
+import urllib.request
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import typer
+import websockets
+from rich.console import Console
+
+from .analyzer import find_port
+from .latency import LatencyLog
+from .process_manager import ProcessManager
+
+SAMPLE_APP = """from starhtml import *
+from views import content
+
+app, rt = star_app(live=False)
+
+
+@rt("/")
+def home():
+    return Div(H1("Benchmark", cls="w-[{width}px]"), Div(content(), id="content"), id="main")
+"""
+
+SAMPLE_VIEW = """from starhtml import *
+
+
+def content():
+    return P("Edit {edit}", cls="w-[{width}px]")
+"""
+
+# Which watcher produced an update, so each edit waits for one of each
+UPDATE_SOURCES = {
+    "reload": "python",
+    "restart": "python",
+    "hmr": "python",
+    "css-delta": "css",
+    "css-update": "css",
+}
+
+
+@dataclass
+class BenchmarkResult:
+    worker: LatencyLog
+    client: LatencyLog
+    missed: int = 0
+
+
+def write_view(root: Path, edit: int) -> None:
+    # A new arbitrary width on every edit forces a Tailwind rebuild as well
+    (root / "views.py").write_text(SAMPLE_VIEW.format(edit=edit, width=edit + 1))
+
+
+def write_app(root: Path, edit: int) -> None:
+    # The app module imports the view, so editing it restarts the worker
+    (root / "app.py").write_text(SAMPLE_APP.format(width=edit + 1))
+
+
+def write_sample_app(root: Path) -> Path:
+    write_app(root, 0)
+    write_view(root, 0)
+    return root / "app.py"
+
+
+def fetch(url: str) -> bool:
+    try:
+        with urllib.request.urlopen(url, timeout=2) as response:
+            response.read()
+            return True
+    except OSError:
+        return False
+
+
+def wait_until(ready: Callable[[], bool], timeout: float, what: str) -> None:
+    deadline = time.time() + timeout
+    while not ready():
+        if time.time() > deadline:
+            raise TimeoutError(f"Timed out waiting for {what}")
+        time.sleep(0.1)
+
+
+async def acknowledge(ws, message: dict, url: str) -> None:
+    """Apply an update the way the browser would, then report it back."""
+    if message["type"] in ("reload", "restart"):
+        await asyncio.to_thread(fetch, url)
+
+    if isinstance(timing := message.get("timing"), dict):
+        await ws.send(
+            json.dumps(
+                {
+                    "type": "applied",
+                    "kind": message["type"],
+                    "timing": timing,
+                    "applied": time.time(),
+                }
+            )
+        )
+
+
+async def connect(port: int, restarted: bool = False):
+    """Open the reload socket and say hello, retrying until the worker accepts."""
+    while True:
+        try:
+            ws = await websockets.connect(f"ws://localhost:{port}/live-reload")
+            break
+        except (OSError, websockets.InvalidHandshake):
+            await asyncio.sleep(0.1)
+
+    await ws.send(json.dumps({"type": "hello", "path": "/", "restarted": restarted}))
+    return ws
+
+
+async def next_message(ws, port: int) -> tuple[Any, dict]:
+    """The next message, reconnecting like the browser if the worker restarted."""
+    try:
+        return ws, json.loads(await ws.recv())
+    except websockets.ConnectionClosed:
+        return await connect(port, restarted=True), {}
+
+
+async def run_edits(
+    root: Path,
+    port: int,
+    edits: int,
+    sources: set[str],
+    settle: float = 0.6,
+    timeout: float = 10.0,
+    restart: bool = False,
+) -> tuple[LatencyLog, int]:
+    """Edit the sample app ``edits`` times, waiting for an update from each source."""
+    client, missed = LatencyLog(), 0
+    url = f"http://localhost:{port}/"
+    write = write_app if restart else write_view
+
+    ws = await asyncio.wait_for(connect(port), timeout)
+    try:
+        for edit in range(1, edits + 1):
+            # Let the watchers poll past the previous edit before saving again
+            await asyncio.sleep(settle)
+            saved = time.time()
+            write(root, edit)
+
+            pending = set(sources)
+            while pending:
+                try:
+                    ws, message = await asyncio.wait_for(
+                        next_message(ws, port), saved + timeout - time.time()
+                    )
+                except TimeoutError:
+                    missed += len(pending)
+                    break
+
+                if (source := UPDATE_SOURCES.get(message.get("type"))) is None:
+                    continue
+                await acknowledge(ws, message, url)
+                client.record(message["type"], {"saved": saved, "applied": time.time()})
+                pending.discard(source)
+    finally:
+        await ws.close()
+
+    return client, missed
+
+
+def run_benchmark(
+    edits: int = 10,
+    hmr: bool = False,
+    css: bool = False,
+    settle: float = 0.6,
+    timeout: float = 10.0,
+    port: int | None = None,
+    restart: bool = False,
+) -> BenchmarkResult:
+    """Start the dev worker on a sample app and measure ``edits`` scripted edits."""
+    with tempfile.TemporaryDirectory(prefix="starui_bench_") as tmp:
+        root = Path(tmp)
+        app_file = write_sample_app(root)
+        port = port or find_port(5900)
+        manager = ProcessManager()
+        css_file = None
+
+        try:
+            if css:
+                from ..css.binary import TailwindBinaryManager
+
+                css_file = root / "static" / "css" / "starui.css"
+                css_file.parent.mkdir(parents=True)
+                input_css = root / "input.css"
+                input_css.write_text('@import "tailwindcss";\n')
+                binary = Path(TailwindBinaryManager("latest").get_binary())
+                manager.start_tailwind_watcher(binary, input_css, css_file, root)
+                if not manager.wait_ready("tailwind", timeout):
+                    raise TimeoutError("Timed out waiting for Tailwind")
+
+            manager.start_uvicorn(
+                app_file, port, ["*.py"], True, False, True, hmr, css_file
+            )
+            if not manager.wait_ready("uvicorn", timeout):
+                raise TimeoutError("Timed out waiting for uvicorn")
+            wait_until(manager.graph_file(app_file).exists, timeout, "import graph")
+
+            # A restart reloads the page, which picks up the stylesheet as well
+            sources = {"python", "css"} if css and not restart else {"python"}
+            client, missed = asyncio.run(
+                run_edits(root, port, edits, sources, settle, timeout, restart)
+            )
+            # The worker logs the last acknowledgement asynchronously
+            time.sleep(0.2)
+            worker = LatencyLog.load(manager.latency_file(app_file))
+            return BenchmarkResult(worker, client, missed)
+        finally:
+            manager.stop_all()
+            for path in (
+                manager.wrapper,
+                manager.wrapper_owner,
+                manager.graph_file(app_file),
+                manager.latency_file(app_file),
+                manager.restart_file(app_file),
+            ):
+                if path:
+                    path.unlink(missing_ok=True)
+
+
+def main(
+    edits: int = typer.Option(10, "--edits", "-n", help="Number of scripted edits"),
+    hmr: bool = typer.Option(False, "--hmr/--no-hmr", help="Patch instead of reload"),
+    css: bool = typer.Option(False, "--css/--no-css", help="Run Tailwind as well"),
+    settle: float = typer.Option(0.6, help="Seconds to wait between edits"),
+    restart: bool = typer.Option(
+        False, "--restart/--no-restart", help="Edit the app module to force restarts"
+    ),
+):
+    """Benchmark save-to-applied latency of the dev reload loop."""
+    console = Console()
+    result = run_benchmark(edits, hmr, css, settle, restart=restart)
+
+    console.print(result.worker.table("Worker hops"))
+    console.print(result.client.table("Client save → applied"))
+    if result.missed:
+        console.print(f"[yellow]⚠ {result.missed} update(s) timed out[/yellow]")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,162 @@
+"""Rule-level stylesheet diffs for incremental CSS hot reload.
+
+Old and new stylesheets are split into top-level rules, and the children of
+grouping rules (``@layer``, ``@media``, ...) are diffed one level down, since
+Tailwind puts almost every utility inside ``@layer utilities``. The result is a
+list of ``deleteRule``/``insertRule`` operations the client applies through
+CSSOM, in order.
+"""
+
+import re
+from difflib import SequenceMatcher
+from typing import Any
+
+MAX_DELTA_RATIO = 0.5
+GROUPING_RULES = ("@layer", "@media", "@supports", "@container")
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def split_rules(css: str) -> list[str]:
+    """Split a stylesheet (or a grouping rule body) into top-level rules."""
+    css = _COMMENT.sub("", css)
+    rules: list[str] = []
+    depth, start, quote, escaped = 0, 0, "", False
+
+    for i, char in enumerate(css):
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif quote:
+            if char == quote:
+                quote = ""
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append(css[start : i + 1].strip())
+                start = i + 1
+        elif char == ";" and depth == 0:
+            rules.append(css[start : i + 1].strip())
+            start = i + 1
+
+    return [rule for rule in rules if rule]
+
+
+def is_group(rule: str) -> bool:
+    return rule.startswith(GROUPING_RULES) and rule.endswith("}")
+
+
+def _key(rule: str) -> str:
+    """Grouping rules match by prelude so their bodies can be diffed."""
+    if is_group(rule):
+        return _WHITESPACE.sub(" ", rule[: rule.index("{")]).strip()
+    return rule
+
+
+def _children(rule: str) -> list[str]:
+    return split_rules(rule[rule.index("{") + 1 : rule.rindex("}")])
+
+
+def _ops(
+    old: list[str],
+    new: list[str],
+    opcodes: list[tuple[str, int, int, int, int]],
+    group: int | None,
+) -> list[dict[str, Any]]:
+    # Applied from the end backwards so earlier indices stay valid
+    ops: list[dict[str, Any]] = []
+    for tag, i1, i2, j1, j2 in reversed(opcodes):
+        if tag == "equal":
+            continue
+        ops.extend(
+            {"op": "delete", "group": group, "index": i}
+            for i in reversed(range(i1, i2))
+        )
+        ops.extend(
+            {"op": "insert", "group": group, "index": i1 + k, "rule": new[j]}
+            for k, j in enumerate(range(j1, j2))
+        )
+    return ops
+
+
+def diff_css(
+    old: str, new: str, max_ratio: float = MAX_DELTA_RATIO
+) -> dict[str, Any] | None:
+    """Return ``{"rules", "groups", "ops"}`` turning ``old`` into ``new``.
+
+    ``rules`` is the expected top-level rule count before applying, and
+    ``groups`` the expected child count of each grouping rule the ops patch, so
+    clients whose stylesheet is out of sync (say, a browser dropped a rule it
+    didn't support) can fall back to a full refetch. Returns ``None`` when the
+    delta is larger than ``max_ratio`` of the new stylesheet.
+    """
+    old_rules, new_rules = split_rules(old), split_rules(new)
+    opcodes = SequenceMatcher(
+        None,
+        [_key(r) for r in old_rules],
+        [_key(r) for r in new_rules],
+        autojunk=False,
+    ).get_opcodes()
+
+    # Group bodies first: their indices refer to the stylesheet before top-level ops
+    ops: list[dict[str, Any]] = []
+    groups: dict[int, int] = {}
+    for tag, i1, i2, j1, _ in opcodes:
+        if tag != "equal":
+            continue
+        for k in range(i2 - i1):
+            a, b = old_rules[i1 + k], new_rules[j1 + k]
+            if a != b:
+                old_children, new_children = _children(a), _children(b)
+                groups[i1 + k] = len(old_children)
+                matcher = SequenceMatcher(
+                    None, old_children, new_children, autojunk=False
+                )
+                ops.extend(
+                    _ops(old_children, new_children, matcher.get_opcodes(), i1 + k)
+                )
+    ops.extend(_ops(old_rules, new_rules, opcodes, None))
+
+    if sum(len(op.get("rule", "")) for op in ops) > max_ratio * len(new):
+        return None
+    return {"rules": len(old_rules), "groups": groups, "ops": ops}
+
+
+def parse_sheet(css: str) -> list[str | list[str]]:
+    """Parse rules, expanding grouping rules into ``[prelude, *children]``."""
+    return [
+        [_key(rule), *_children(rule)] if is_group(rule) else rule
+        for rule in split_rules(css)
+    ]
+
+
+def apply_delta(css: str, delta: dict[str, Any]) -> list[str | list[str]]:
+    """Apply a delta to a parsed stylesheet the way the client does through CSSOM.
+
+    Raises ValueError where the client would refetch: the rule counts differ.
+    """
+    sheet = parse_sheet(css)
+    # Group children are offset by one for the prelude
+    if len(sheet) != delta["rules"] or any(
+        not isinstance(group := sheet[int(index)], list) or len(group) - 1 != count
+        for index, count in delta["groups"].items()
+    ):
+        raise ValueError("stylesheet is out of sync with the delta")
+    for op in delta["ops"]:
+        group = op["group"]
+        target, offset = (sheet, 0) if group is None else (sheet[group], 1)
+        if op["op"] == "delete":
+            del target[op["index"] + offset]
+        else:
+            rule = op["rule"]
+            target.insert(
+                op["index"] + offset,
+                [_key(rule), *_children(rule)] if is_group(rule) else rule,
+            )
+    return sheet
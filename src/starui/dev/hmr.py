@@ -0,0 +1,251 @@
+"""Fragment-level hot module replacement for the development server.
+
+After modules are reloaded in place, the current route of each connected client
+is rendered again inside the worker and diffed against the HTML the client was
+served. Changed elements are addressed by their nearest ``id`` and sent as
+Datastar morph patches; anything else falls back to a full page reload.
+
+Renders run inside ``id_scope`` and have their attributes sorted, so two renders
+of an unchanged page are identical. With ``--hmr`` the dev wrapper serves pages
+through ``scoped_ids`` as well, so the page in the browser carries the same IDs
+and signal names as the renders it is diffed against.
+
+Datastar has no public API for patching elements from a script, so the client
+dispatches the ``datastar-fetch`` event its backend actions use internally
+(Datastar release-candidate, the version starhtml loads). If a Datastar update
+changes that event, patches stop applying; run ``star dev`` without ``--hmr``
+to reload pages instead.
+"""
+
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any
+
+from ..render.html import sort_attributes
+from ..render.ids import id_scope
+
+MAX_PATCH_RATIO = 0.5
+VOID_ELEMENTS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "source",
+    "track",
+    "wbr",
+}
+
+
+@dataclass
+class Node:
+    tag: str
+    start: int
+    open_end: int
+    end: int = -1
+    id: str | None = None
+    attrs: tuple[tuple[str, str], ...] = ()
+    children: list["Node"] = field(default_factory=list)
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self, source: str):
+        super().__init__(convert_charrefs=False)
+        self.source = source
+        self.lines = [0]
+        for i, char in enumerate(source):
+            if char == "\n":
+                self.lines.append(i + 1)
+        self.root = Node("#document", 0, 0, len(source))
+        self.stack = [self.root]
+
+    def _offset(self) -> int:
+        line, col = self.getpos()
+        return self.lines[line - 1] + col
+
+    def _open(self, tag: str, attrs: list[tuple[str, str | None]]) -> Node:
+        start = self._offset()
+        node = Node(
+            tag,
+            start,
+            start + len(self.get_starttag_text() or ""),
+            id=dict(attrs).get("id"),
+            # rusty_tags writes attributes in hash order, so compare them sorted
+            attrs=tuple(sorted((name, value or "") for name, value in attrs)),
+        )
+        self.stack[-1].children.append(node)
+        return node
+
+    def handle_starttag(self, tag, attrs):
+        node = self._open(tag, attrs)
+        if tag in VOID_ELEMENTS:
+            node.end = node.open_end
+        else:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        node = self._open(tag, attrs)
+        node.end = node.open_end
+
+    def handle_endtag(self, tag):
+        if not any(node.tag == tag for node in self.stack[1:]):
+            return
+        end = self.source.find(">", self._offset()) + 1
+        while (node := self.stack.pop()).tag != tag:
+            node.end = end
+        node.end = end
+
+    def close(self):
+        super().close()
+        for node in self.stack[1:]:
+            node.end = len(self.source)
+
+
+def parse_html(source: str) -> Node:
+    builder = _TreeBuilder(source)
+    builder.feed(source)
+    builder.close()
+    return builder.root
+
+
+class FullReload(Exception):
+    """Raised when a change cannot be expressed as element patches."""
+
+
+def _text(source: str, node: Node) -> str:
+    """Node content with child elements cut out."""
+    parts, cursor = [], node.open_end
+    for child in node.children:
+        parts.append(source[cursor : child.start])
+        cursor = child.end
+    parts.append(source[cursor : node.end])
+    return "".join(parts)
+
+
+def _changed_ids(old: str, new: str, a: Node, b: Node, owner: str | None) -> set[str]:
+    if old[a.start : a.end] == new[b.start : b.end]:
+        return set()
+    if a.tag == "head":
+        raise FullReload("document head changed")
+
+    owner = b.id if b.id and b.id == a.id else owner
+    same_shape = (
+        a.tag == b.tag
+        and a.attrs == b.attrs
+        and [c.tag for c in a.children] == [c.tag for c in b.children]
+        and [c.id for c in a.children] == [c.id for c in b.children]
+        and _text(old, a) == _text(new, b)
+    )
+    if not same_shape:
+        if owner is None:
+            raise FullReload(f"<{b.tag}> changed outside an element with an id")
+        return {owner}
+
+    changed: set[str] = set()
+    for x, y in zip(a.children, b.children, strict=True):
+        changed |= _changed_ids(old, new, x, y, owner)
+    return changed
+
+
+def _index(node: Node, parents: tuple[str, ...], out: dict) -> None:
+    if node.id:
+        out.setdefault(node.id, (node, parents))
+        parents = (*parents, node.id)
+    for child in node.children:
+        _index(child, parents, out)
+
+
+def diff_html(
+    old: str, new: str, max_ratio: float = MAX_PATCH_RATIO
+) -> list[dict[str, Any]] | None:
+    """Return ``[{"id", "html"}]`` patches turning ``old`` into ``new``.
+
+    Returns ``None`` when a full reload is needed: the head changed, an element
+    without an id ancestor changed, or the patches exceed ``max_ratio`` of the page.
+    """
+    if old == new:
+        return []
+
+    try:
+        changed = _changed_ids(old, new, parse_html(old), parse_html(new), None)
+    except FullReload:
+        return None
+
+    index: dict[str, tuple[Node, tuple[str, ...]]] = {}
+    _index(parse_html(new), (), index)
+
+    patches = [
+        {"id": id, "html": new[node.start : node.end]}
+        for id, (node, parents) in index.items()
+        if id in changed and not changed.intersection(parents)
+    ]
+    if sum(len(p["html"]) for p in patches) > max_ratio * len(new):
+        return None
+    return patches
+
+
+def scoped_ids(app: Any) -> Any:
+    """Wrap an ASGI app so each page request numbers its IDs like ``render_route``.
+
+    Datastar requests are left unscoped: their fragments land in a page that
+    already uses the counter's IDs, and random ones can't collide with them.
+    """
+
+    async def scoped(scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or any(
+            name == b"datastar-request" for name, _ in scope.get("headers", ())
+        ):
+            await app(scope, receive, send)
+            return
+        with id_scope():
+            await app(scope, receive, send)
+
+    return scoped
+
+
+async def render_route(app: Any, path: str, cookie: str | None = None) -> str | None:
+    """Render ``path`` through the ASGI app in-process, returning the HTML body.
+
+    IDs are numbered per render and attributes sorted, so unchanged markup
+    renders identically every time.
+    """
+    route, _, query = path.partition("?")
+    headers = [(b"host", b"localhost"), (b"accept", b"text/html")]
+    if cookie:
+        headers.append((b"cookie", cookie.encode()))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": route or "/",
+        "raw_path": (route or "/").encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+    }
+    response: dict[str, Any] = {"status": 0, "body": []}
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            response["body"].append(message.get("body", b""))
+
+    with id_scope():
+        await app(scope, receive, send)
+    if response["status"] != 200:
+        return None
+    return sort_attributes(b"".join(response["body"]).decode("utf-8", errors="replace"))
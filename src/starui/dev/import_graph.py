@@ -0,0 +1,357 @@
+"""Import graph tracking for scoped development reloads.
+
+The dev wrapper records which project modules and templates the app actually
+loads. Leaf modules (project modules that import no other project module) and
+vendored components are reloaded in place inside the running worker; any other
+change to a loaded file restarts uvicorn. Files the app never imported, such as
+scripts and tests, are ignored. Modules a handler imports lazily join the graph
+once the worker sees them in ``sys.modules``.
+"""
+
+import ast
+import importlib
+import json
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FunctionType, ModuleType
+
+from ..registry import local
+
+TEMPLATE_SUFFIXES = {".html", ".htm", ".jinja", ".jinja2", ".j2"}
+IGNORED_DIRS = {
+    "__pycache__",
+    ".git",
+    ".venv",
+    "venv",
+    "node_modules",
+    "site-packages",
+    "static",
+}
+
+
+@dataclass
+class ModuleNode:
+    name: str
+    file: Path
+    imports: set[str] = field(default_factory=set)
+
+
+@dataclass
+class ImportGraph:
+    """Project modules, templates and vendored components loaded by a running app."""
+
+    root: Path
+    entry: str
+    modules: dict[str, ModuleNode] = field(default_factory=dict)
+    templates: set[Path] = field(default_factory=set)
+    vendored: set[Path] = field(default_factory=set)
+
+    def files(self) -> set[Path]:
+        return {node.file for node in self.modules.values()} | self.templates
+
+    def module_for(self, path: Path) -> str | None:
+        return next(
+            (name for name, node in self.modules.items() if node.file == path), None
+        )
+
+    def importers(self, name: str) -> set[str]:
+        return {other for other, node in self.modules.items() if name in node.imports}
+
+    def is_leaf(self, name: str) -> bool:
+        node = self.modules.get(name)
+        return bool(
+            node
+            and name != self.entry
+            and node.file.name != "__init__.py"
+            and not node.imports
+        )
+
+    def leaf_files(self) -> set[Path]:
+        return {node.file for name, node in self.modules.items() if self.is_leaf(name)}
+
+    def plan(self, changed: Iterable[Path]) -> tuple[list[str], bool]:
+        """Split changed files into (leaf modules to reload, restart needed).
+
+        Vendored components reload in the worker; files outside the graph are ignored.
+        """
+        reload: list[str] = []
+        restart = False
+
+        for path in changed:
+            if path in self.templates:
+                restart = True
+            elif name := self.module_for(path):
+                if self.is_leaf(name):
+                    reload.append(name)
+                else:
+                    restart = True
+
+        return reload, restart
+
+    def changed_modules(self, changed: Iterable[Path]) -> list[str] | None:
+        """Modules among ``changed``; ``None`` when any route may render differently.
+
+        Templates aren't traced to routes, and the entry module sets up the app.
+        """
+        modules = set()
+        for path in changed:
+            if path in self.templates or (name := self.module_for(path)) == self.entry:
+                return None
+            if name:
+                modules.add(name)
+        return sorted(modules)
+
+    def to_dict(self) -> dict:
+        return {
+            "root": str(self.root),
+            "entry": self.entry,
+            "modules": {
+                name: {"file": str(node.file), "imports": sorted(node.imports)}
+                for name, node in sorted(self.modules.items())
+            },
+            "templates": sorted(str(t) for t in self.templates),
+            "vendored": sorted(str(v) for v in self.vendored),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ImportGraph":
+        return cls(
+            root=Path(data["root"]),
+            entry=data["entry"],
+            modules={
+                name: ModuleNode(name, Path(node["file"]), set(node["imports"]))
+                for name, node in data.get("modules", {}).items()
+            },
+            templates={Path(t) for t in data.get("templates", [])},
+            vendored={Path(v) for v in data.get("vendored", [])},
+        )
+
+    def save(self, path: Path) -> None:
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.to_dict(), indent=2))
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "ImportGraph":
+        return cls.from_dict(json.loads(path.read_text()))
+
+
+def in_project(path: Path, root: Path) -> bool:
+    return path.is_relative_to(root) and not IGNORED_DIRS.intersection(
+        path.relative_to(root).parts
+    )
+
+
+def _module_file(module: ModuleType) -> Path | None:
+    if not (file := getattr(module, "__file__", None)):
+        return None
+    path = Path(file).resolve()
+    return path if path.suffix == ".py" else None
+
+
+def _resolve_base(node: ModuleNode, stmt: ast.ImportFrom) -> str:
+    if not stmt.level:
+        return stmt.module or ""
+
+    parts = node.name.split(".")
+    if node.file.name != "__init__.py":
+        parts = parts[:-1]
+    parts = parts[: len(parts) - stmt.level + 1]
+    return ".".join([*parts, stmt.module] if stmt.module else parts)
+
+
+def find_imports(node: ModuleNode, known: set[str]) -> set[str]:
+    """Statically find which of the ``known`` modules a module imports."""
+    try:
+        tree = ast.parse(node.file.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return set()
+
+    found: set[str] = set()
+    for stmt in ast.walk(tree):
+        if isinstance(stmt, ast.Import):
+            names = [alias.name for alias in stmt.names]
+        elif isinstance(stmt, ast.ImportFrom):
+            base = _resolve_base(node, stmt)
+            names = [base, *(f"{base}.{alias.name}" for alias in stmt.names)]
+        else:
+            continue
+
+        for name in names:
+            while name:
+                if name in known:
+                    found.add(name)
+                name = name.rpartition(".")[0]
+
+    found.discard(node.name)
+    return found
+
+
+def has_new_modules(graph: ImportGraph) -> bool:
+    """Whether ``sys.modules`` holds project modules the graph doesn't know yet."""
+    return any(
+        name not in graph.modules
+        and (file := _module_file(module))
+        and in_project(file, graph.root)
+        for name, module in list(sys.modules.items())
+    )
+
+
+def build_import_graph(
+    root: Path, entry: str, templates: Iterable[Path] = ()
+) -> ImportGraph:
+    """Build the graph of project modules currently present in ``sys.modules``."""
+    root = root.resolve()
+    graph = ImportGraph(root=root, entry=entry, templates=set(templates))
+
+    for name, module in list(sys.modules.items()):
+        if (file := _module_file(module)) and in_project(file, root):
+            graph.modules[name] = ModuleNode(name, file)
+
+    known = set(graph.modules)
+    for node in graph.modules.values():
+        node.imports = find_imports(node, known)
+
+    return graph
+
+
+def reload_in_place(name: str, graph: ImportGraph) -> ModuleType:
+    """Reload a module and rebind its functions and classes in other project modules.
+
+    Only functions and classes defined by the reloaded module are swapped, so
+    importers using ``from module import name`` pick up the new definitions.
+    """
+    module = sys.modules[name]
+    previous = dict(vars(module))
+    module = importlib.reload(module)
+    current = vars(module)
+
+    swapped = {
+        id(old): (old, new)
+        for key, old in previous.items()
+        if isinstance(old, FunctionType | type)
+        and getattr(old, "__module__", None) == name
+        and (new := current.get(key)) is not None
+        and new is not old
+    }
+    if not swapped:
+        return module
+
+    for other in graph.modules:
+        if other == name or not (importer := sys.modules.get(other)):
+            continue
+        namespace = vars(importer)
+        for key, value in list(namespace.items()):
+            if (pair := swapped.get(id(value))) and pair[0] is value:
+                namespace[key] = pair[1]
+
+    return module
+
+
+def snapshot(paths: Iterable[Path]) -> dict[Path, float]:
+    return {path: _mtime(path) for path in paths}
+
+
+def changed_since(mtimes: dict[Path, float]) -> list[Path]:
+    """Return files whose mtime differs from the snapshot, updating it in place."""
+    changed = []
+    for path, last in mtimes.items():
+        if (current := _mtime(path)) != last:
+            mtimes[path] = current
+            changed.append(path)
+    return changed
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+class ImportGraphRecorder:
+    """Worker-side recorder installed by the dev wrapper before the app is imported."""
+
+    def __init__(self, root: str | Path, entry: str, graph_file: str | Path):
+        self.root = Path(root).resolve()
+        self.entry = entry
+        self.graph_file = Path(graph_file)
+        self.templates: set[Path] = set()
+        self.graph: ImportGraph | None = None
+        self.stop = threading.Event()
+        sys.addaudithook(self._audit)
+
+    def _audit(self, event: str, args: tuple) -> None:
+        if event != "open" or self.stop.is_set() or not isinstance(args[0], str):
+            return
+        if Path(args[0]).suffix not in TEMPLATE_SUFFIXES:
+            return
+        with suppress(OSError, ValueError):
+            if in_project(path := Path(args[0]).resolve(), self.root):
+                self.templates.add(path)
+
+    def refresh(self) -> ImportGraph:
+        self.graph = build_import_graph(self.root, self.entry, set(self.templates))
+        self.graph.vendored = local.discovered_files()
+        with suppress(OSError):
+            self.graph.save(self.graph_file)
+        return self.graph
+
+    def start(
+        self,
+        on_reload: Callable[[list[str], dict[str, float]], None] | None = None,
+        interval: float = 0.5,
+    ) -> None:
+        # Counted before the graph is built, so nothing imported since goes unseen
+        known_modules = len(sys.modules)
+        graph = self.refresh()
+
+        def run() -> None:
+            nonlocal graph, known_modules
+            mtimes = snapshot(graph.leaf_files() | graph.vendored)
+            known_templates = len(self.templates)
+
+            while not self.stop.is_set():
+                time.sleep(interval)
+                changed = changed_since(mtimes)
+                timing = {
+                    "saved": max((mtimes[path] for path in changed), default=0.0),
+                    "detected": time.time(),
+                }
+                reload, _ = graph.plan(changed)
+                reloaded = []
+                if changed:
+                    local.invalidate(changed)
+                    reloaded.extend(
+                        path.stem for path in changed if path in graph.vendored
+                    )
+                for name in reload:
+                    try:
+                        reload_in_place(name, graph)
+                        reloaded.append(name)
+                    except Exception as e:
+                        sys.stderr.write(f"[StarUI] Failed to reload {name}: {e}\n")
+
+                # Handlers may import project modules lazily, after the last refresh
+                count = len(sys.modules)
+                imported = count != known_modules and has_new_modules(graph)
+                known_modules = count
+                if reloaded or imported or len(self.templates) != known_templates:
+                    known_templates = len(self.templates)
+                    graph = self.refresh()
+                    mtimes = {**snapshot(graph.leaf_files() | graph.vendored), **mtimes}
+
+                if reloaded:
+                    sys.stdout.write(
+                        f"[StarUI] ↻ Reloaded in place: {', '.join(reloaded)}\n"
+                    )
+                    sys.stdout.flush()
+                    if on_reload:
+                        on_reload(reloaded, {**timing, "reloaded": time.time()})
+
+        threading.Thread(target=run, daemon=True).start()
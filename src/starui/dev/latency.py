@@ -0,0 +1,188 @@
+"""Dev-loop latency tracking.
+
+Reload notifications carry wall-clock timestamps for every hop they pass
+through. The browser adds ``applied`` once the update is on screen and echoes
+the timestamps back over the reload socket. The worker appends each sample to
+a JSON-lines log, which ``star dev`` and the benchmark harness summarise.
+
+A restart replaces the worker, so the dev server stashes the change, its
+timestamps and the modules it touched, in a file the new worker picks up. Tabs
+that reconnect are told to reload or that they are stale, and reloads carry the
+timestamps stamped with when the worker came up and when the tab reconnected.
+"""
+
+import json
+import time
+from collections import defaultdict
+from contextlib import suppress
+from dataclasses import dataclass, field
+from itertools import pairwise
+from pathlib import Path
+from typing import Any
+
+from rich.table import Table
+
+# In the order they happen; a sample only carries the hops its path went through
+HOPS = (
+    "saved",
+    "built",
+    "detected",
+    "restarted",
+    "reloaded",
+    "rendered",
+    "sent",
+    "reconnected",
+    "applied",
+)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Linearly interpolated percentile, ``0.0`` for no values."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _read_restart(path: Path) -> dict[str, Any] | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("timing"), dict):
+        return None
+    return data
+
+
+def stash_restart(
+    path: Path, timing: dict[str, float], modules: list[str] | None
+) -> None:
+    """Leave a restarting change for the next worker; ``None`` modules affect all.
+
+    A restart whose worker never claimed it, because it failed to start, is
+    merged in, so the tabs it affected still reload once a worker comes up.
+    """
+    if previous := _read_restart(path):
+        timing = previous["timing"]
+        if modules is not None and previous.get("modules") is not None:
+            modules = sorted({*previous["modules"], *modules})
+        else:
+            modules = None
+    with suppress(OSError):
+        path.write_text(
+            json.dumps({"timing": timing, "modules": modules}), encoding="utf-8"
+        )
+
+
+def take_restart(path: Path) -> dict[str, Any] | None:
+    """Claim a stashed restart, stamping when the worker came up."""
+    if (data := _read_restart(path)) is None:
+        return None
+    with suppress(OSError):
+        path.unlink()
+    data["timing"] = {**data["timing"], "restarted": time.time()}
+    return data
+
+
+@dataclass
+class LatencySample:
+    kind: str
+    timing: dict[str, float]
+
+    def spans(self) -> dict[str, float]:
+        """Milliseconds between consecutive hops, plus their ``total``."""
+        hops = [hop for hop in HOPS if hop in self.timing]
+        spans = {
+            f"{a} → {b}": (self.timing[b] - self.timing[a]) * 1000
+            for a, b in pairwise(hops)
+        }
+        if len(hops) > 1:
+            spans["total"] = (self.timing[hops[-1]] - self.timing[hops[0]]) * 1000
+        return spans
+
+
+@dataclass
+class LatencyLog:
+    """Latency samples, optionally appended to a JSON-lines file as they arrive."""
+
+    path: Path | None = None
+    samples: list[LatencySample] = field(default_factory=list)
+
+    def record(self, kind: str, timing: dict[str, Any]) -> LatencySample:
+        sample = LatencySample(
+            kind,
+            {
+                hop: float(value)
+                for hop, value in timing.items()
+                if hop in HOPS and isinstance(value, int | float)
+            },
+        )
+        self.samples.append(sample)
+
+        if self.path:
+            with suppress(OSError), self.path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps({"kind": kind, "timing": sample.timing}) + "\n")
+        return sample
+
+    def totals(self, kind: str) -> list[float]:
+        return [
+            total
+            for sample in self.samples
+            if sample.kind == kind
+            and (total := sample.spans().get("total")) is not None
+        ]
+
+    def report(self, sample: LatencySample) -> str:
+        """One-line console report for a freshly recorded sample."""
+        totals = self.totals(sample.kind)
+        return (
+            f"{sample.kind} applied in {sample.spans().get('total', 0):.0f}ms "
+            f"(p50 {percentile(totals, 50):.0f}ms, p95 {percentile(totals, 95):.0f}ms "
+            f"over {len(totals)})"
+        )
+
+    def summary(self) -> dict[str, dict[str, list[float]]]:
+        """Span durations grouped by sample kind."""
+        spans: dict[str, dict[str, list[float]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        for sample in self.samples:
+            for name, ms in sample.spans().items():
+                spans[sample.kind][name].append(ms)
+        return spans
+
+    def table(self, title: str = "Dev Loop Latency") -> Table:
+        table = Table(title=title)
+        for column in ("Update", "Hop", "p50", "p95", "n"):
+            table.add_column(
+                column, justify="left" if column in ("Update", "Hop") else "right"
+            )
+
+        for kind, spans in sorted(self.summary().items()):
+            names = sorted(spans, key=lambda name: name == "total")
+            if len(names) == 2:
+                names.remove("total")  # Same as the single hop
+            for name in names:
+                values = spans[name]
+                table.add_row(
+                    kind if name == names[0] else "",
+                    name,
+                    f"{percentile(values, 50):.0f}ms",
+                    f"{percentile(values, 95):.0f}ms",
+                    str(len(values)),
+                    style="bold" if name == "total" else None,
+                )
+        return table
+
+    @classmethod
+    def load(cls, path: Path) -> "LatencyLog":
+        log = cls()
+        with suppress(OSError):
+            for line in path.read_text(encoding="utf-8").splitlines():
+                with suppress(ValueError, KeyError, TypeError, AttributeError):
+                    data = json.loads(line)
+                    log.record(data["kind"], data["timing"])
+        return log
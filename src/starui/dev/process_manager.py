@@ -1,6 +1,8 @@
 """Process coordination for development server."""
 
+import hashlib
 import os
+import re
 import subprocess
 import sys
 import threading
@@ -13,22 +15,50 @@ from typing import Any
 
 from rich.console import Console
 
+from .import_graph import ImportGraph, changed_since, snapshot
+from .latency import stash_restart
+
 RELOAD_EXCLUDES = ["*.css", "static/**", "**/tmp*", "**/__pycache__/**", "*_dev.py"]
 RENDER_PROCESSES = {"uvicorn", "tailwind"}
-
-WRAPPER_TEMPLATE = """import sys
+# Output lines that mean a process is ready: Tailwind's first build, uvicorn's port bind
+READY_PATTERNS = {
+    "tailwind": re.compile(r"Done in"),
+    "uvicorn": re.compile(r"Uvicorn running on"),
+}
+# Output lines that mark a reload, used to spot resources growing across reloads
+RELOAD_PATTERN = re.compile(r"Reloaded in place|Started server process")
+GRAPH_ENV = "STARUI_DEV_GRAPH"
+LATENCY_ENV = "STARUI_DEV_LATENCY"
+RESTART_ENV = "STARUI_DEV_RESTART"
+
+# Per-run paths come from the environment so the wrapper can be reused across runs
+WRAPPER_TEMPLATE = """import os
+import sys
 import warnings
+from pathlib import Path
 sys.path.insert(0, r'{app_dir}')
 
 warnings.filterwarnings('ignore', message='live=True requires debug=True.*', category=UserWarning)
 
+from starui.dev.import_graph import ImportGraphRecorder
+_graph = ImportGraphRecorder(r'{app_dir}', '{app_stem}', os.environ['STARUI_DEV_GRAPH']) if {graph_reload} else None
+
 from {app_stem} import app as original_app
-from starui.dev.unified_reload import create_dev_reload_route, DevReloadJs
+from starui.dev.latency import LatencyLog, take_restart
+from starui.dev.unified_reload import create_dev_reload_route, DevReloadHandler, DevReloadJs, watch_css
 from starlette.routing import WebSocketRoute
 
+if 'STARUI_DEV_LATENCY' in os.environ:
+    DevReloadHandler.latency = LatencyLog(Path(os.environ['STARUI_DEV_LATENCY']))
+
 if hasattr(original_app, 'debug'):
     original_app.debug = {debug}
 
+DevReloadHandler.app = original_app
+DevReloadHandler.graph = _graph
+if {hmr}:
+    DevReloadHandler.hmr_app = original_app
+
 try:
     router = getattr(original_app, 'router', original_app)
 
@@ -65,13 +95,45 @@ except Exception as e:
     sys.stderr.write(f"[StarUI] Warning: Could not fully replace dev reload system: {{e}}\\n")
     sys.stderr.flush()
 
-app = original_app"""
+if {css_file!r}:
+    watch_css(Path({css_file!r}))
+
+if 'STARUI_DEV_RESTART' in os.environ:
+    DevReloadHandler.restart = take_restart(Path(os.environ['STARUI_DEV_RESTART']))
+
+if _graph:
+    _graph.start(lambda modules, timing: DevReloadHandler.schedule(DevReloadHandler.notify_reload(modules, timing)))
+
+if {hmr}:
+    from starui.dev.hmr import scoped_ids
+    app = scoped_ids(original_app)
+else:
+    app = original_app"""
+
+
+def pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    return True
 
 
 class ProcessManager:
     def __init__(self):
         self.processes = {}
+        self.commands = {}
         self.threads = {}
+        self.restarting = set()
+        # Exited after a restart; the graph watcher restarts them on the next change
+        self.waiting: set[str] = set()
+        self.ready: dict[str, threading.Event] = {}
+        self.ready_at: dict[str, float] = {}
+        self.reloads: dict[str, int] = {}
+        self.wrapper: Path | None = None
+        self.wrapper_owner: Path | None = None
         self.shutdown = threading.Event()
         self.console = Console()
 
@@ -96,14 +158,24 @@ class ProcessManager:
             bufsize=1,
         )
         self.processes[name] = proc
+        self.commands[name] = (cmd, cwd, env)
+        self.ready[name] = threading.Event()
+        self.ready_at.pop(name, None)
         self._monitor(name, proc)
         return proc
 
     def _monitor(self, name: str, proc: subprocess.Popen[str]) -> None:
+        pattern, ready = READY_PATTERNS.get(name), self.ready[name]
+
         def run() -> None:
             with suppress(Exception):
                 while proc.poll() is None and not self.shutdown.is_set():
                     if line := proc.stdout.readline():
+                        if pattern and not ready.is_set() and pattern.search(line):
+                            self.ready_at[name] = time.perf_counter()
+                            ready.set()
+                        if RELOAD_PATTERN.search(line):
+                            self.reloads[name] = self.reloads.get(name, 0) + 1
                         if clean := line.rstrip():
                             if name in RENDER_PROCESSES:
                                 sys.stdout.write(f"{clean}\n")
@@ -119,6 +191,17 @@ class ProcessManager:
         thread.start()
         self.threads[f"{name}_monitor"] = thread
 
+    def wait_ready(self, name: str, timeout: float = 30) -> bool:
+        """Block until ``name`` prints its ready line; False if it exits or times out."""
+        if not (ready := self.ready.get(name)):
+            return False
+
+        deadline = time.monotonic() + timeout
+        while not ready.wait(0.05):
+            if not self.is_running(name) or time.monotonic() > deadline:
+                return False
+        return True
+
     def start_uvicorn(
         self,
         app_file: Path,
@@ -126,51 +209,192 @@ class ProcessManager:
         patterns: list[str],
         hot_reload: bool = True,
         debug: bool = True,
+        graph_reload: bool = False,
+        hmr: bool = False,
+        css_file: Path | None = None,
     ) -> subprocess.Popen[str]:
-        module = self._get_app_module(app_file, hot_reload, debug)
+        # The import graph is recorded by the dev wrapper, so it needs hot reload
+        graph_reload = graph_reload and hot_reload
+        module = self._get_app_module(
+            app_file, hot_reload, debug, graph_reload, hmr, css_file
+        )
         cmd = [
             sys.executable,
             "-m",
             "uvicorn",
             module,
-            "--reload",
             "--port",
             str(port),
             "--host",
             "localhost",
-            "--reload-delay",
-            "0.1",
             "--use-colors",
         ]
 
-        for pattern in patterns:
-            cmd.extend(["--reload-include", pattern])
-        for exclude in RELOAD_EXCLUDES:
-            cmd.extend(["--reload-exclude", exclude])
+        if not graph_reload:
+            cmd.extend(["--reload", "--reload-delay", "0.1"])
+            for pattern in patterns:
+                cmd.extend(["--reload-include", pattern])
+            for exclude in RELOAD_EXCLUDES:
+                cmd.extend(["--reload-exclude", exclude])
 
         env = os.environ.copy()
         if hot_reload:
+            env[GRAPH_ENV] = str(self.graph_file(app_file))
+            env[LATENCY_ENV] = str(self.latency_file(app_file))
+            env[RESTART_ENV] = str(self.restart_file(app_file))
             temp_dir = Path(gettempdir())
             pythonpath = env.get("PYTHONPATH", "")
             env["PYTHONPATH"] = (
                 f"{temp_dir}:{pythonpath}" if pythonpath else str(temp_dir)
             )
 
-        return self.start_process("uvicorn", cmd, app_file.parent, env)
+        proc = self.start_process("uvicorn", cmd, app_file.parent, env)
+        if graph_reload:
+            self._watch_graph(
+                "uvicorn", self.graph_file(app_file), self.restart_file(app_file)
+            )
+        return proc
+
+    @staticmethod
+    def wrapper_file(app_file: Path, source: str) -> Path:
+        digest = hashlib.sha1(source.encode()).hexdigest()[:10]
+        return Path(gettempdir()) / f"starui_dev_{app_file.stem}_{digest}.py"
+
+    @staticmethod
+    def graph_file(app_file: Path) -> Path:
+        return (
+            Path(gettempdir()) / f"starui_dev_{app_file.stem}_{os.getpid()}_graph.json"
+        )
+
+    @staticmethod
+    def resources_file(app_file: Path) -> Path:
+        return (
+            Path(gettempdir())
+            / f"starui_dev_{app_file.stem}_{os.getpid()}_resources.jsonl"
+        )
+
+    @staticmethod
+    def latency_file(app_file: Path) -> Path:
+        return (
+            Path(gettempdir())
+            / f"starui_dev_{app_file.stem}_{os.getpid()}_latency.jsonl"
+        )
+
+    @staticmethod
+    def restart_file(app_file: Path) -> Path:
+        return (
+            Path(gettempdir())
+            / f"starui_dev_{app_file.stem}_{os.getpid()}_restart.json"
+        )
 
-    def _get_app_module(self, app_file: Path, hot_reload: bool, debug: bool) -> str:
+    def _get_app_module(
+        self,
+        app_file: Path,
+        hot_reload: bool,
+        debug: bool,
+        graph_reload: bool = False,
+        hmr: bool = False,
+        css_file: Path | None = None,
+    ) -> str:
         if not hot_reload:
             return f"{app_file.stem}:app"
 
+        self.graph_file(app_file).unlink(missing_ok=True)
+        self.latency_file(app_file).unlink(missing_ok=True)
+        self.restart_file(app_file).unlink(missing_ok=True)
+
+        source = WRAPPER_TEMPLATE.format(
+            app_dir=app_file.parent.resolve(),
+            app_stem=app_file.stem,
+            debug=debug,
+            graph_reload=graph_reload,
+            hmr=hmr,
+            css_file=str(css_file) if css_file else "",
+        )
+        # Named by content, so an unchanged setup reuses the file and its bytecode
+        self.wrapper = self.wrapper_file(app_file, source)
+        # Claimed before it is written, so no other run sees it unowned
+        self.wrapper_owner = self.owner_file(self.wrapper, os.getpid())
+        self.wrapper_owner.touch()
+        if not self.wrapper.exists():
+            tmp = self.wrapper.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(source)
+            tmp.replace(self.wrapper)
+        self._remove_stale_wrappers(app_file)
+        return f"{self.wrapper.stem}:app"
+
+    @staticmethod
+    def owner_file(wrapper: Path, pid: int) -> Path:
+        return wrapper.with_name(f"{wrapper.stem}.{pid}.owner")
+
+    def _remove_stale_wrappers(self, app_file: Path) -> None:
+        """Delete wrappers of this app no live run owns, and their bytecode.
+
+        Each run marks the wrapper it uses with an owner file named by its PID.
+        Wrappers of other runs that are still going, on another port or from
+        the benchmark, are kept.
+        """
         temp_dir = Path(gettempdir())
-        wrapper = temp_dir / f"starui_dev_{app_file.stem}_{os.getpid()}.py"
+        name = re.compile(rf"starui_dev_{re.escape(app_file.stem)}_[0-9a-f]{{10}}\.py")
+
+        for path in temp_dir.glob(f"starui_dev_{app_file.stem}_*.py"):
+            if path == self.wrapper or not name.fullmatch(path.name):
+                continue
+            with suppress(OSError, ValueError):
+                owners = list(temp_dir.glob(f"{path.stem}.*.owner"))
+                live = [o for o in owners if pid_alive(int(o.suffixes[-2][1:]))]
+                if live:
+                    continue
+                for stale in owners:
+                    stale.unlink(missing_ok=True)
+                path.unlink()
+                for cached in temp_dir.glob(f"__pycache__/{path.stem}.*.pyc"):
+                    cached.unlink(missing_ok=True)
+
+    def _watch_graph(
+        self, name: str, graph_file: Path, restart_file: Path | None = None
+    ) -> None:
+        """Restart ``name`` when a non-leaf file in the app's import graph changes.
+
+        The change goes to ``restart_file``, so the next worker can tell which tabs
+        to reload and report its latency.
+        """
 
-        wrapper.write_text(
-            WRAPPER_TEMPLATE.format(
-                app_dir=app_file.parent, app_stem=app_file.stem, debug=debug
-            )
-        )
-        return f"{wrapper.stem}:app"
+        def run() -> None:
+            graph, mtimes, manifest_mtime = None, {}, 0.0
+
+            while not self.shutdown.is_set():
+                with suppress(Exception):
+                    if (
+                        graph_file.exists()
+                        and (mtime := graph_file.stat().st_mtime) != manifest_mtime
+                    ):
+                        manifest_mtime = mtime
+                        graph = ImportGraph.load(graph_file)
+                        mtimes = {**snapshot(graph.files()), **mtimes}
+
+                    if graph and (changed := changed_since(mtimes)):
+                        _, restart = graph.plan(changed)
+                        # A worker that failed to start waits for any change, using
+                        # the last graph it wrote
+                        if restart or name in self.waiting:
+                            if restart_file:
+                                saved = max(mtimes[path] for path in changed)
+                                stash_restart(
+                                    restart_file,
+                                    {"saved": saved, "detected": time.time()},
+                                    graph.changed_modules(changed),
+                                )
+                            files = ", ".join(p.name for p in changed)
+                            self.console.print(
+                                f"[cyan]Change detected in {files}, restarting {name}...[/cyan]"
+                            )
+                            self.restart_process(name)
+                time.sleep(0.5)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        self.threads[f"{name}_graph"] = thread
 
     def start_tailwind_watcher(
         self,
@@ -231,6 +455,18 @@ class ProcessManager:
         self.processes.pop(name, None)
         return True
 
+    def restart_process(self, name: str) -> subprocess.Popen[str] | None:
+        if not (command := self.commands.get(name)):
+            return None
+
+        self.restarting.add(name)
+        self.waiting.discard(name)
+        try:
+            self.stop_process(name)
+            return self.start_process(name, *command)
+        finally:
+            self.restarting.discard(name)
+
     def stop_all(self, timeout: int = 2) -> None:
         if self.shutdown.is_set():
             return
@@ -246,17 +482,24 @@ class ProcessManager:
         while not self.shutdown.is_set():
             dead = [
                 name
-                for name, proc in self.processes.items()
+                for name, proc in list(self.processes.items())
                 if proc.poll() is not None
+                and name not in self.restarting
                 and not (name == "tailwind" and proc.returncode == 0)
             ]
 
-            if dead:
-                for name in dead:
+            for name in dead:
+                self.processes.pop(name, None)
+                # Without uvicorn's reloader, the graph watcher supervises the worker
+                if f"{name}_graph" in self.threads:
+                    self.waiting.add(name)
+                    self.console.print(
+                        f"[red]{name} exited[/red], waiting for a fix to restart it"
+                    )
+                else:
                     self.console.print(f"[red]{name} died unexpectedly[/red]")
-                    del self.processes[name]
 
-                if "uvicorn" in dead:
-                    break
+            if "uvicorn" in dead and "uvicorn" not in self.waiting:
+                break
 
             time.sleep(0.5)
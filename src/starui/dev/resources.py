@@ -0,0 +1,250 @@
+"""Resource sampling for ``star dev`` child processes.
+
+CPU time, RSS, open file descriptors, threads and inotify watches are read from
+``/proc`` for each managed process (including its descendants, such as the
+uvicorn worker) and for ``star dev`` itself. Samples are appended to a
+JSON-lines file, summarised in a status line and checked for runaway patterns.
+On platforms without ``/proc`` the monitor does nothing.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .process_manager import ProcessManager
+
+PROC = Path("/proc")
+SELF = "star"
+
+# Runaway thresholds
+BUSY_CPU = 80.0
+BUSY_SAMPLES = 5
+MAX_WATCHES = 5000
+LEAK_RELOADS = 5
+LEAK_RSS = 50 * 1024 * 1024
+LEAK_FDS = 20
+
+
+@dataclass
+class ResourceSample:
+    name: str
+    pid: int
+    time: float
+    cpu_time: float
+    rss: int
+    fds: int
+    threads: int
+    watches: int
+    cpu: float = 0.0
+    reloads: int = 0
+
+
+def supported() -> bool:
+    return (PROC / "self" / "stat").exists()
+
+
+def _stat(pid: int) -> list[str]:
+    """Fields after the command name of ``/proc/<pid>/stat``, from ``state`` on."""
+    text = (PROC / str(pid) / "stat").read_text()
+    return text[text.rindex(")") + 2 :].split()
+
+
+def _parents() -> dict[int, int]:
+    parents = {}
+    for entry in PROC.iterdir():
+        if entry.name.isdigit():
+            with suppress(OSError, ValueError, IndexError):
+                parents[int(entry.name)] = int(_stat(int(entry.name))[1])
+    return parents
+
+
+def descendants(pid: int, parents: dict[int, int] | None = None) -> list[int]:
+    parents = _parents() if parents is None else parents
+    children: dict[int, list[int]] = defaultdict(list)
+    for child, parent in parents.items():
+        children[parent].append(child)
+
+    found, pending = [], [pid]
+    while pending:
+        for child in children.get(pending.pop(), []):
+            found.append(child)
+            pending.append(child)
+    return found
+
+
+def _descriptors(pid: int) -> tuple[int, int]:
+    """Open file descriptors and inotify watches held through them."""
+    fd_dir = PROC / str(pid) / "fd"
+    fds, watches = 0, 0
+    for fd in os.listdir(fd_dir):
+        fds += 1
+        with suppress(OSError):
+            if os.readlink(fd_dir / fd) == "anon_inode:inotify":
+                info = (PROC / str(pid) / "fdinfo" / fd).read_text()
+                watches += sum(line.startswith("inotify") for line in info.splitlines())
+    return fds, watches
+
+
+def sample_process(
+    name: str, pid: int, parents: dict[int, int] | None = None
+) -> ResourceSample | None:
+    """Sample ``pid`` and its descendants as one entry, ``None`` if it is gone."""
+    ticks, page = os.sysconf("SC_CLK_TCK"), os.sysconf("SC_PAGE_SIZE")
+    sample = ResourceSample(name, pid, time.time(), 0.0, 0, 0, 0, 0)
+    found = False
+
+    for member in [pid, *descendants(pid, parents)]:
+        with suppress(OSError, ValueError, IndexError):
+            fields = _stat(member)
+            fds, watches = _descriptors(member)
+            sample.cpu_time += (int(fields[11]) + int(fields[12])) / ticks
+            sample.threads += int(fields[17])
+            sample.rss += int(fields[21]) * page
+            sample.fds += fds
+            sample.watches += watches
+            found = True
+    return sample if found else None
+
+
+def _mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.0f}MB"
+
+
+class ResourceMonitor:
+    """Periodically samples the processes of a ``ProcessManager``."""
+
+    def __init__(
+        self,
+        manager: "ProcessManager",
+        log_file: Path | None = None,
+        interval: float = 2.0,
+    ):
+        self.manager = manager
+        self.log_file = log_file
+        self.interval = interval
+        self.latest: dict[str, ResourceSample] = {}
+        self.busy: dict[str, int] = defaultdict(int)
+        self.at_reload: dict[str, list[ResourceSample]] = defaultdict(list)
+        self.warned: set[tuple[str, str]] = set()
+
+    def sample(self) -> list[ResourceSample]:
+        """Sample every managed process plus ``star dev`` itself."""
+        parents = _parents()
+        targets = [(SELF, os.getpid())] + [
+            (name, proc.pid) for name, proc in list(self.manager.processes.items())
+        ]
+
+        samples = []
+        for name, pid in targets:
+            # Children are sampled on their own, so don't fold them into star dev
+            if name == SELF:
+                sample = sample_process(name, pid, {})
+            else:
+                sample = sample_process(name, pid, parents)
+            if sample is None:
+                continue
+
+            sample.reloads = self.manager.reloads.get(name, 0)
+            if (last := self.latest.get(name)) and last.pid == pid:
+                elapsed = sample.time - last.time
+                if elapsed > 0:
+                    sample.cpu = (sample.cpu_time - last.cpu_time) / elapsed * 100
+            self.latest[name] = sample
+            samples.append(sample)
+
+        self._log(samples)
+        return samples
+
+    def _log(self, samples: list[ResourceSample]) -> None:
+        if not self.log_file or not samples:
+            return
+        with suppress(OSError), self.log_file.open("a", encoding="utf-8") as f:
+            for sample in samples:
+                f.write(json.dumps(asdict(sample)) + "\n")
+
+    def check(self, samples: list[ResourceSample]) -> list[str]:
+        """Warnings for runaway patterns, each reported once per process."""
+        warnings = []
+
+        def warn(name: str, kind: str, message: str) -> None:
+            if (name, kind) not in self.warned:
+                self.warned.add((name, kind))
+                warnings.append(message)
+
+        for sample in samples:
+            name = sample.name
+            self.busy[name] = self.busy[name] + 1 if sample.cpu >= BUSY_CPU else 0
+
+            if name == "tailwind":
+                hint = "make sure .venv and node_modules are in .gitignore"
+                if sample.watches > MAX_WATCHES:
+                    warn(
+                        name,
+                        "watches",
+                        f"tailwind is watching {sample.watches} directories; {hint}",
+                    )
+                if self.busy[name] >= BUSY_SAMPLES:
+                    warn(
+                        name,
+                        "busy",
+                        f"tailwind has been at {sample.cpu:.0f}% CPU for "
+                        f"{self.busy[name] * self.interval:.0f}s; {hint}",
+                    )
+
+            history = self.at_reload[name]
+            if not history or history[-1].reloads != sample.reloads:
+                history.append(sample)
+                del history[: -LEAK_RELOADS - 1]
+            if len(history) > LEAK_RELOADS:
+                first, last = history[0], history[-1]
+                rss = [s.rss for s in history]
+                fds = [s.fds for s in history]
+                if rss == sorted(rss) and last.rss - first.rss >= LEAK_RSS:
+                    warn(
+                        name,
+                        "rss",
+                        f"{name} memory grew by {_mb(last.rss - first.rss)} over "
+                        f"{LEAK_RELOADS} reloads; something may hold on to old modules",
+                    )
+                if fds == sorted(fds) and last.fds - first.fds >= LEAK_FDS:
+                    warn(
+                        name,
+                        "fds",
+                        f"{name} open files grew by {last.fds - first.fds} over "
+                        f"{LEAK_RELOADS} reloads; files or sockets may not be closed",
+                    )
+        return warnings
+
+    def status_line(self) -> str:
+        parts = []
+        for name, sample in self.latest.items():
+            part = f"{name} {sample.cpu:.0f}% {_mb(sample.rss)} {sample.fds}fd"
+            if name == SELF:
+                part += f" {sample.threads} threads"
+            elif sample.watches:
+                part += f" {sample.watches}w"
+            parts.append(part)
+        return " · ".join(parts)
+
+    def start(self) -> threading.Thread | None:
+        if not supported():
+            return None
+
+        def run() -> None:
+            while not self.manager.shutdown.is_set():
+                with suppress(Exception):
+                    for message in self.check(self.sample()):
+                        self.manager.console.print(f"[yellow]⚠ {message}[/yellow]")
+                self.manager.shutdown.wait(self.interval)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        self.manager.threads["resources"] = thread
+        return thread
@@ -0,0 +1,114 @@
+"""Route-aware reload targeting.
+
+Each client registers its current route over the reload socket. When modules
+are reloaded in place, the route's endpoint is followed through the functions,
+classes and modules it references to find the project modules it renders with.
+Only clients whose route reaches a changed module are reloaded; anything that
+cannot be resolved, including changes outside the project's modules, is treated
+as affected.
+"""
+
+from collections.abc import Iterable
+from types import CodeType, FunctionType, ModuleType
+from typing import Any
+
+from starlette.routing import Match
+
+
+def _code_names(code: CodeType) -> set[str]:
+    """Global and attribute names used by ``code`` and its nested functions."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _cells(func: FunctionType) -> list[Any]:
+    values = []
+    for cell in func.__closure__ or ():
+        try:
+            values.append(cell.cell_contents)
+        except ValueError:
+            continue  # Empty cell
+    return values
+
+
+def function_modules(obj: Any, project: set[str]) -> set[str]:
+    """Project modules reachable from ``obj`` through the names its code uses.
+
+    Functions outside the project are only followed through their closures and
+    ``__wrapped__``, which is enough to see through framework route wrappers.
+    """
+    modules: set[str] = set()
+    pending, seen = [obj], set()
+
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+
+        if isinstance(obj, classmethod | staticmethod):
+            pending.append(obj.__func__)
+        elif isinstance(obj, ModuleType):
+            if obj.__name__ in project:
+                modules.add(obj.__name__)
+        elif isinstance(obj, type):
+            if obj.__module__ in project:
+                modules.add(obj.__module__)
+                pending.extend(vars(obj).values())
+        elif isinstance(obj, FunctionType):
+            if wrapped := getattr(obj, "__wrapped__", None):
+                pending.append(wrapped)
+            pending.extend(_cells(obj))
+            if obj.__module__ not in project:
+                continue
+
+            modules.add(obj.__module__)
+            names = _code_names(obj.__code__)
+            for name in names:
+                if (value := obj.__globals__.get(name)) is None:
+                    continue
+                pending.append(value)
+                # ``views.page()`` uses both names, so follow module attributes too
+                if isinstance(value, ModuleType) and value.__name__ in project:
+                    pending.extend(
+                        attr
+                        for attr_name in names
+                        if (attr := getattr(value, attr_name, None)) is not None
+                    )
+    return modules
+
+
+def endpoint_for(app: Any, path: str) -> Any | None:
+    """The endpoint a GET of ``path`` would reach, if it is a plain route."""
+    route_path = path.partition("?")[0] or "/"
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": route_path,
+        "root_path": "",
+        "app_root_path": "",
+    }
+    router = getattr(app, "router", app)
+    for route in getattr(router, "routes", []):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "endpoint", None)
+    return None
+
+
+def route_affected(
+    app: Any, path: str | None, changed: Iterable[str], project: set[str]
+) -> bool:
+    """Whether the page at ``path`` may render differently after ``changed`` reload."""
+    changed = set(changed)
+    if path is None or not project.issuperset(changed):
+        return True
+    try:
+        endpoint = endpoint_for(app, path)
+        modules = function_modules(endpoint, project) if endpoint else set()
+    except Exception:
+        return True
+    return not modules or not modules.isdisjoint(changed)
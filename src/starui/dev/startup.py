@@ -0,0 +1,59 @@
+"""Startup timing for ``star dev``."""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from rich.table import Table
+
+
+@dataclass
+class StartupTimeline:
+    """Start offsets and durations of startup steps, which may overlap."""
+
+    started: float = field(default_factory=time.perf_counter)
+    steps: list[tuple[str, float, float]] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def record(self, name: str, start: float, end: float) -> None:
+        with self._lock:
+            self.steps.append((name, start - self.started, end - start))
+
+    def mark(self, name: str, at: float | None) -> None:
+        """Record a readiness signal as a step running from startup until ``at``."""
+        if at is not None:
+            self.record(name, self.started, at)
+
+    def ordered(self) -> list[tuple[str, float, float]]:
+        """Steps in the order they finished."""
+        return sorted(self.steps, key=lambda step: step[1] + step[2])
+
+    @property
+    def total(self) -> float:
+        return max((offset + took for _, offset, took in self.steps), default=0.0)
+
+    def summary(self) -> str:
+        steps = " · ".join(
+            f"{name} {took * 1000:.0f}ms" for name, _, took in self.ordered()
+        )
+        return f"Started in {self.total:.2f}s ({steps})"
+
+    def table(self) -> Table:
+        table = Table(title="Startup", show_header=True)
+        table.add_column("Step", style="cyan")
+        table.add_column("Start", justify="right")
+        table.add_column("Took", justify="right")
+        for name, offset, took in self.ordered():
+            table.add_row(name, f"{offset * 1000:.0f}ms", f"{took * 1000:.0f}ms")
+        table.add_row("total", "", f"{self.total * 1000:.0f}ms", style="bold")
+        return table
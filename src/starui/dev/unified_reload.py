@@ -1,6 +1,12 @@
 """Unified development reload system that consolidates CSS and Python file watching."""
 
+import asyncio
 import json
+import sys
+import threading
+import time
+from collections.abc import Coroutine
+from contextlib import suppress
 from pathlib import Path
 from typing import Any
 
@@ -8,14 +14,33 @@ from starlette.endpoints import WebSocketEndpoint
 from starlette.routing import WebSocketRoute
 from starlette.websockets import WebSocket
 
+from .css_delta import diff_css
+from .hmr import diff_html, render_route
+from .import_graph import ImportGraphRecorder
+from .latency import LatencyLog
+from .routes import route_affected
+
 
 class DevReloadHandler(WebSocketEndpoint):
     """Unified WebSocket handler for development reload notifications."""
 
     clients: set[WebSocket] = set()
+    loop: asyncio.AbstractEventLoop | None = None
+    # Set by the dev wrapper so reloads only reach tabs on affected routes
+    app: Any = None
+    graph: ImportGraphRecorder | None = None
+    # Set by the dev wrapper when fragment-level HMR is enabled
+    hmr_app: Any = None
+    routes: dict[WebSocket, str] = {}
+    snapshots: dict[WebSocket, str] = {}
+    # Set by the dev wrapper to collect round-trip timings reported by clients
+    latency: LatencyLog | None = None
+    # The change that restarted this worker (timing and modules), for tabs that reconnect
+    restart: dict[str, Any] | None = None
 
     async def on_connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
+        DevReloadHandler.loop = asyncio.get_running_loop()
         self.clients.add(websocket)
         await self._send_message(
             websocket, {"type": "connected", "message": "StarUI dev reload connected"}
@@ -23,24 +48,164 @@ class DevReloadHandler(WebSocketEndpoint):
 
     async def on_disconnect(self, websocket: WebSocket, close_code: int) -> None:
         self.clients.discard(websocket)
+        self.routes.pop(websocket, None)
+        self.snapshots.pop(websocket, None)
 
     async def on_receive(self, websocket: WebSocket, data: Any) -> None:
-        pass  # Handle client messages if needed
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            return
+
+        if message.get("type") == "hello" and isinstance(message.get("path"), str):
+            self.routes[websocket] = message["path"]
+            if self.hmr_app is not None:
+                await self._snapshot(websocket)
+            if message.get("restarted"):
+                await self._answer_restart(websocket, message["path"])
+        elif message.get("type") == "applied" and isinstance(
+            message.get("timing"), dict
+        ):
+            self._record_latency(message)
 
     @classmethod
-    async def notify_css_update(cls, css_path: Path, build_time: float = 0) -> None:
-        """Notify all clients of CSS updates."""
-        if not cls.clients:
+    async def _answer_restart(cls, websocket: WebSocket, path: str) -> None:
+        """Tell a tab that reconnected after a restart to reload, or that it is stale.
+
+        Without a stashed change, such as after ``star dev`` itself restarted,
+        the tab always reloads.
+        """
+        restart = cls.restart or {}
+        modules = restart.get("modules")
+        if modules is not None and not cls._affected(path, modules):
+            await cls._send_message(websocket, {"type": "stale", "modules": modules})
             return
 
-        await cls._broadcast_message(
-            {
-                "type": "css-update",
-                "path": str(css_path.name),
-                "timestamp": build_time,
-                "buildTime": build_time,
-            }
+        message = {"type": "restart", "modules": modules or []}
+        if timing := restart.get("timing"):
+            message["timing"] = {**timing, "reconnected": time.time()}
+        await cls._send_message(websocket, message)
+
+    @classmethod
+    def _record_latency(cls, message: dict) -> None:
+        if cls.latency is None:
+            return
+
+        sample = cls.latency.record(
+            str(message.get("kind", "update")),
+            {**message["timing"], "applied": message.get("applied")},
         )
+        sys.stdout.write(f"[StarUI] ⏱ {cls.latency.report(sample)}\n")
+        sys.stdout.flush()
+
+    @classmethod
+    async def _snapshot(cls, websocket: WebSocket) -> str | None:
+        """Render the client's route so later renders can be diffed against it."""
+        try:
+            html = await render_route(
+                cls.hmr_app, cls.routes[websocket], websocket.headers.get("cookie")
+            )
+        except Exception:
+            html = None
+
+        if html is None:
+            cls.snapshots.pop(websocket, None)
+        else:
+            cls.snapshots[websocket] = html
+        return html
+
+    @classmethod
+    async def notify_css_update(
+        cls,
+        css_path: Path,
+        build_time: float = 0,
+        delta: dict | None = None,
+        timing: dict[str, float] | None = None,
+    ) -> None:
+        """Notify all clients of CSS updates, as rule deltas when available."""
+        if not cls.clients:
+            return
+
+        message = {
+            "type": "css-update",
+            "path": str(css_path.name),
+            "timestamp": build_time,
+            "buildTime": build_time,
+        }
+        if delta is not None:
+            message.update(type="css-delta", **delta)
+
+        await cls._broadcast_message(_timed(message, timing))
+
+    @classmethod
+    async def notify_reload(
+        cls, modules: list[str], timing: dict[str, float] | None = None
+    ) -> None:
+        """Ask all clients to reload after modules were reloaded in place."""
+        if not cls.clients:
+            return
+
+        stale = cls._unaffected_clients(modules)
+        for client in list(cls.clients):
+            if client in stale:
+                await cls._send_message(client, {"type": "stale", "modules": modules})
+            elif cls.hmr_app is not None:
+                await cls._hot_update(client, modules, timing)
+            else:
+                message = {"type": "reload", "modules": modules}
+                await cls._send_message(client, _timed(message, timing))
+
+    @classmethod
+    def _unaffected_clients(cls, modules: list[str]) -> set[WebSocket]:
+        """Clients whose route doesn't reach any of the reloaded modules."""
+        if cls.app is None or cls.graph is None or cls.graph.graph is None:
+            return set()
+
+        affected: dict[str, bool] = {}
+        stale = set()
+        for client in cls.clients:
+            if (path := cls.routes.get(client)) is None:
+                continue
+            if path not in affected:
+                affected[path] = cls._affected(path, modules)
+            if not affected[path]:
+                stale.add(client)
+        return stale
+
+    @classmethod
+    def _affected(cls, path: str, modules: list[str]) -> bool:
+        if cls.app is None or cls.graph is None or cls.graph.graph is None:
+            return True
+        return route_affected(cls.app, path, modules, set(cls.graph.graph.modules))
+
+    @classmethod
+    async def _hot_update(
+        cls,
+        websocket: WebSocket,
+        modules: list[str],
+        timing: dict[str, float] | None = None,
+    ) -> None:
+        """Patch changed elements on one client, or reload it if that isn't possible."""
+        old = cls.snapshots.get(websocket)
+        new = await cls._snapshot(websocket) if websocket in cls.routes else None
+        patches = diff_html(old, new) if old is not None and new is not None else None
+        if timing is not None:
+            timing = {**timing, "rendered": time.time()}
+
+        if patches is None:
+            message = {"type": "reload", "modules": modules}
+        else:
+            message = {"type": "hmr", "modules": modules, "patches": patches}
+        await cls._send_message(websocket, _timed(message, timing))
+
+    @classmethod
+    def schedule(cls, notification: Coroutine[Any, Any, None]) -> None:
+        """Schedule a notification from a thread outside the server loop."""
+        if cls.loop is None or cls.loop.is_closed():
+            notification.close()
+            return
+
+        asyncio.run_coroutine_threadsafe(notification, cls.loop)
 
     @classmethod
     async def notify_build_error(
@@ -84,6 +249,43 @@ class DevReloadHandler(WebSocketEndpoint):
             pass
 
 
+def _timed(message: dict, timing: dict[str, float] | None) -> dict:
+    """Attach hop timestamps to a message, stamping when it is sent."""
+    if timing is not None:
+        message["timing"] = {**timing, "sent": time.time()}
+    return message
+
+
+def watch_css(css_path: Path, interval: float = 0.2) -> threading.Thread:
+    """Poll the compiled stylesheet and push rule-level deltas to clients."""
+
+    def run() -> None:
+        last_mtime, previous = 0.0, None
+        while True:
+            with suppress(OSError, UnicodeDecodeError):
+                if (mtime := css_path.stat().st_mtime) != last_mtime:
+                    last_mtime = mtime
+                    current = css_path.read_text(encoding="utf-8")
+                    # Skip the truncated file Tailwind leaves while writing
+                    if current.strip() and current != previous:
+                        if previous is not None:
+                            timing = {"built": mtime, "detected": time.time()}
+                            DevReloadHandler.schedule(
+                                DevReloadHandler.notify_css_update(
+                                    css_path,
+                                    timing["detected"],
+                                    diff_css(previous, current),
+                                    timing,
+                                )
+                            )
+                        previous = current
+            time.sleep(interval)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
 def create_dev_reload_route() -> WebSocketRoute:
     """Create the unified dev reload WebSocket route."""
     return WebSocketRoute("/live-reload", endpoint=DevReloadHandler)
@@ -99,41 +301,135 @@ def DevReloadJs(**kwargs):
     let attempts = 0;
     const maxAttempts = 20;
     const reconnectInterval = 1000;
+    const pendingKey = 'starui-dev-pending';
+    let socket = null;
+
+    const markStale = (message) => {
+        if (document.getElementById('starui-dev-stale')) return;
+        const badge = document.createElement('button');
+        badge.id = 'starui-dev-stale';
+        badge.textContent = '↻ Page outdated';
+        badge.title = `Changed: ${message.modules.join(', ')}. Click to reload.`;
+        badge.style.cssText = 'position:fixed;right:12px;bottom:12px;z-index:2147483647;' +
+            'padding:4px 10px;border:1px solid #d4d4d8;border-radius:9999px;background:#fafafa;' +
+            'color:#18181b;font:12px system-ui,sans-serif;cursor:pointer;opacity:.9';
+        badge.onclick = () => window.location.reload();
+        document.body.appendChild(badge);
+    };
+
+    // Echo hop timestamps back so the server can measure save-to-screen latency
+    const ack = (kind, timing) => {
+        if (!timing || !socket || socket.readyState !== WebSocket.OPEN) return;
+        const applied = (performance.timeOrigin + performance.now()) / 1000;
+        socket.send(JSON.stringify({ type: 'applied', kind, timing, applied }));
+    };
+
+    const swapStylesheets = (message) => {
+        const links = document.querySelectorAll('link[href*="starui.css"], link[href*="tailwind"]');
+        let acked = false;
+        links.forEach(link => {
+            const newLink = link.cloneNode();
+            const url = new URL(link.href);
+            url.searchParams.set('t', Date.now());
+            newLink.href = url.toString();
+            newLink.onload = () => {
+                link.remove();
+                if (!acked) ack(message.type, message.timing);
+                acked = true;
+            };
+            link.after(newLink);
+        });
+        console.log(`[CSS] Updated ${message.path} in ${(message.buildTime || 0).toFixed(2)}s`);
+    };
+
+    const applyCssDelta = (message) => {
+        const link = [...document.querySelectorAll(`link[href*="${message.path}"]`)].find(l => l.sheet);
+        try {
+            const sheet = link && link.sheet;
+            if (!sheet || sheet.cssRules.length !== message.rules) return false;
+            // Browsers drop rules they don't support, so check each patched group too
+            for (const [index, count] of Object.entries(message.groups || {})) {
+                const group = sheet.cssRules[index];
+                if (!group || !group.cssRules || group.cssRules.length !== count) return false;
+            }
+            for (const op of message.ops) {
+                const target = op.group === null ? sheet : sheet.cssRules[op.group];
+                if (op.op === 'delete') target.deleteRule(op.index);
+                else target.insertRule(op.rule, op.index);
+            }
+        } catch (e) {
+            return false;
+        }
+        console.log(`[CSS] Applied ${message.ops.length} rule change(s) to ${message.path}`);
+        return true;
+    };
 
     const connect = () => {
         const ws = new WebSocket(`ws://${window.location.host}/live-reload`);
+        socket = ws;
 
-        ws.onopen = async () => {
-            if (attempts > 0) {
-                try {
-                    const res = await fetch(window.location.href);
-                    if (res.ok) {
-                        console.log('[DEV] Server reconnected, reloading page');
-                        window.location.reload();
-                        return;
-                    }
-                } catch (e) {}
-            }
-            console.log('[DEV] Development reload connected');
+        ws.onopen = () => {
+            // After a reconnect the server says whether this route needs a reload
+            const restarted = attempts > 0;
+            console.log(restarted ? '[DEV] Server reconnected' : '[DEV] Development reload connected');
+            ws.send(JSON.stringify({ type: 'hello', path: location.pathname + location.search, restarted }));
             attempts = 0;
+
+            const pending = sessionStorage.getItem(pendingKey);
+            if (pending) {
+                sessionStorage.removeItem(pendingKey);
+                const { kind, timing } = JSON.parse(pending);
+                ack(kind, timing);
+            }
         };
 
         ws.onmessage = (event) => {
             const message = JSON.parse(event.data);
 
             switch (message.type) {
+                case 'css-delta':
+                    // Patch rules through CSSOM, refetching the stylesheet if that fails
+                    if (applyCssDelta(message)) ack(message.type, message.timing);
+                    else swapStylesheets(message);
+                    break;
+
                 case 'css-update':
                     // Hot reload CSS without page refresh
-                    const links = document.querySelectorAll('link[href*="starui.css"], link[href*="tailwind"]');
-                    links.forEach(link => {
-                        const newLink = link.cloneNode();
-                        const url = new URL(link.href);
-                        url.searchParams.set('t', Date.now());
-                        newLink.href = url.toString();
-                        newLink.onload = () => link.remove();
-                        link.after(newLink);
+                    swapStylesheets(message);
+                    break;
+
+                case 'reload':
+                case 'restart':
+                    console.log(message.type === 'restart'
+                        ? '[DEV] Server restarted, refreshing page'
+                        : `[DEV] Reloaded ${message.modules.join(', ')}, refreshing page`);
+                    // Acknowledged by the reloaded page once it reconnects
+                    if (message.timing) {
+                        sessionStorage.setItem(pendingKey, JSON.stringify({ kind: message.type, timing: message.timing }));
+                    }
+                    window.location.reload();
+                    break;
+
+                case 'stale':
+                    // Another route changed; leave this tab alone but flag it
+                    markStale(message);
+                    break;
+
+                case 'hmr':
+                    // Morph changed elements through Datastar so signals and DOM state survive.
+                    // Datastar has no public patch API; this is the internal event its backend
+                    // actions dispatch (see starui.dev.hmr). Drop `--hmr` if it stops applying.
+                    message.patches.forEach(({ html }) => {
+                        document.dispatchEvent(new CustomEvent('datastar-fetch', {
+                            detail: {
+                                type: 'datastar-patch-elements',
+                                el: document.documentElement,
+                                argsRaw: { elements: html, mode: 'outer' },
+                            },
+                        }));
                     });
-                    console.log(`[CSS] Updated ${message.path} in ${(message.buildTime || 0).toFixed(2)}s`);
+                    console.log(`[HMR] Patched ${message.patches.length} element(s) from ${message.modules.join(', ')}`);
+                    ack(message.type, message.timing);
                     break;
 
                 case 'build-error':
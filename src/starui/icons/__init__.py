@@ -0,0 +1,119 @@
+"""Server-side rendering of lucide icons as inline SVG.
+
+Icons come from ``lucide.json``, a bundled index mapping each icon name to the
+markup inside its ``<svg>``, read the first time an icon is rendered. Rendered
+icons are cached per name and attributes, so pages need no client script to
+draw them; ``starui.icons.sprite`` renders them as references to one sprite
+sheet instead. To bundle more icons, point ``python -m starui.icons`` at the
+``icons`` directory of lucide-static.
+"""
+
+import json
+import re
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import Any
+
+from rusty_tags import HtmlString, Svg, Use
+
+from .sprite import current_sheet
+
+INDEX_FILE = Path(__file__).with_name("lucide.json")
+INDEX_VERSION = 1
+ICON_CACHE_SIZE = 2048
+
+# Drawing attributes, shared by every icon and set on sprite symbols
+PRESENTATION_ATTRS = {
+    "fill": "none",
+    "stroke": "currentColor",
+    "stroke_width": "2",
+    "stroke_linecap": "round",
+    "stroke_linejoin": "round",
+}
+SVG_ATTRS = {
+    "xmlns": "http://www.w3.org/2000/svg",
+    "width": "24",
+    "height": "24",
+    "viewBox": "0 0 24 24",
+    **PRESENTATION_ATTRS,
+    "aria_hidden": "true",
+}
+SPRITE_ATTRS = {"width": "24", "height": "24", "aria_hidden": "true"}
+
+
+@cache
+def load_icons(path: Path = INDEX_FILE) -> dict[str, Any]:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def icon_name(name: str) -> str | None:
+    """Bundled lucide name for ``name``, resolving ``lucide:`` and old names."""
+    index = load_icons()
+    name = name.removeprefix("lucide:")
+    name = index["aliases"].get(name, name)
+    return name if name in index["icons"] else None
+
+
+def icon_body(name: str) -> str | None:
+    """Markup inside the icon's ``<svg>``, or None if it isn't bundled."""
+    canonical = icon_name(name)
+    return load_icons()["icons"][canonical] if canonical else None
+
+
+def render_icon(name: str, **attrs: Any) -> HtmlString | None:
+    """Inline ``<svg>`` for a bundled icon, or None if it isn't bundled.
+
+    Inside ``sprite.icon_sprite()`` the ``<svg>`` references the sprite sheet,
+    unless it overrides drawing attributes the shared symbol fixes.
+    """
+    canonical = icon_name(name)
+    if canonical is None:
+        return None
+
+    sheet = current_sheet()
+    href = None
+    if sheet is not None and PRESENTATION_ATTRS.keys().isdisjoint(attrs):
+        href = sheet.use(canonical)
+    key = tuple((k, v.__class__, v) for k, v in attrs.items())
+    try:
+        return _render(canonical, key, href)
+    except TypeError:  # Unhashable attribute value
+        return _render.__wrapped__(canonical, key, href)
+
+
+@lru_cache(maxsize=ICON_CACHE_SIZE)
+def _render(
+    name: str, key: tuple[tuple[str, type, Any], ...], href: str | None
+) -> HtmlString:
+    attrs = {k: v for k, _, v in key}
+    cls = " ".join(filter(None, [f"lucide lucide-{name}", attrs.pop("cls", "")]))
+    if href:
+        return Svg(Use(href=href), **{**SPRITE_ATTRS, **attrs, "cls": cls})
+
+    body = HtmlString(load_icons()["icons"][name])
+    return Svg(body, **{**SVG_ATTRS, **attrs, "cls": cls})
+
+
+_SVG_BODY = re.compile(r"<svg[^>]*>(.*)</svg>", re.DOTALL)
+
+
+def build_index(svg_dir: Path, aliases: dict[str, str] | None = None) -> dict[str, Any]:
+    """Icon index for every ``*.svg`` in ``svg_dir``, e.g. lucide-static's icons."""
+    icons = {}
+    for path in sorted(svg_dir.glob("*.svg")):
+        if match := _SVG_BODY.search(path.read_text(encoding="utf-8")):
+            icons[path.stem] = re.sub(r">\s+<", "><", match.group(1).strip())
+    return {
+        "version": INDEX_VERSION,
+        "source": "lucide",
+        "license": "ISC",
+        "icons": icons,
+        "aliases": dict(sorted((aliases or {}).items())),
+    }
+
+
+def write_index(index: dict[str, Any], path: Path = INDEX_FILE) -> Path:
+    path.write_text(json.dumps(index, indent=2) + "\n", encoding="utf-8")
+    load_icons.cache_clear()
+    _render.cache_clear()
+    return path
@@ -0,0 +1,13 @@
+"""Rebuild the bundled icon index: ``python -m starui.icons path/to/icons``."""
+
+import sys
+from pathlib import Path
+
+from . import INDEX_FILE, build_index, load_icons, write_index
+
+if len(sys.argv) != 2:
+    sys.exit("Usage: python -m starui.icons <directory of lucide svg files>")
+
+aliases = load_icons()["aliases"] if INDEX_FILE.exists() else {}
+index = build_index(Path(sys.argv[1]), aliases)
+print(f"Wrote {len(index['icons'])} icons to {write_index(index)}")
@@ -0,0 +1,122 @@
+"""Sprite sheet mode for icons.
+
+Inside ``icon_sprite()`` icons render as ``<svg><use href="#icon-name">`` and
+the sheet records which ones were used; ``sheet.render()`` then emits each of
+them once, as a ``<symbol>`` in a hidden ``<svg>``. A page repeating an icon
+carries its paths and drawing attributes once instead of once per instance::
+
+    with icon_sprite() as sheet:
+        content = page()
+    return Div(content, sheet.render())
+
+With ``href`` set, instances point into an external sprite file instead, such
+as one written by ``sprite_file()`` and served with long-lived caching, and no
+sheet needs to be rendered into the page.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache, wraps
+from inspect import iscoroutinefunction
+from typing import Any
+
+from rusty_tags import HtmlString, Svg, Symbol
+
+_sheet: ContextVar["SpriteSheet | None"] = ContextVar("icon_sprite", default=None)
+
+
+def symbol_id(name: str) -> str:
+    return f"icon-{name}"
+
+
+def _symbols(names: Iterable[str]) -> str:
+    from . import PRESENTATION_ATTRS, icon_body
+
+    return "".join(
+        str(
+            Symbol(
+                HtmlString(icon_body(name) or ""),
+                id=symbol_id(name),
+                viewBox="0 0 24 24",
+                **PRESENTATION_ATTRS,
+            )
+        )
+        for name in names
+    )
+
+
+class SpriteSheet:
+    """Icons used while the sheet is active, in order of first use."""
+
+    def __init__(self, href: str = "") -> None:
+        self.href = href
+        self.icons: dict[str, None] = {}
+
+    def use(self, name: str) -> str:
+        """Record ``name`` and return the ``href`` an instance points to."""
+        self.icons[name] = None
+        return f"{self.href}#{symbol_id(name)}"
+
+    def render(self) -> HtmlString:
+        """Hidden ``<svg>`` with one symbol per icon used, unless external."""
+        if self.href or not self.icons:
+            return HtmlString("")
+        return Svg(
+            HtmlString(_symbols(self.icons)),
+            xmlns="http://www.w3.org/2000/svg",
+            width="0",
+            height="0",
+            style="position:absolute",
+            aria_hidden="true",
+        )
+
+
+def current_sheet() -> SpriteSheet | None:
+    return _sheet.get()
+
+
+@contextmanager
+def icon_sprite(href: str = "") -> Iterator[SpriteSheet]:
+    """Render icons as references to a sprite sheet within the block."""
+    sheet = SpriteSheet(href)
+    token = _sheet.set(sheet)
+    try:
+        yield sheet
+    finally:
+        _sheet.reset(token)
+
+
+def with_icon_sprite(route: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorate a route so the sheet for its icons is appended to its output."""
+    if iscoroutinefunction(route):
+
+        @wraps(route)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> HtmlString:
+            with icon_sprite() as sheet:
+                content = await route(*args, **kwargs)
+            return HtmlString(f"{content}{sheet.render()}")
+
+        return async_wrapper
+
+    @wraps(route)
+    def wrapper(*args: Any, **kwargs: Any) -> HtmlString:
+        with icon_sprite() as sheet:
+            content = route(*args, **kwargs)
+        return HtmlString(f"{content}{sheet.render()}")
+
+    return wrapper
+
+
+@cache
+def _sprite_file(names: tuple[str, ...]) -> str:
+    return f'<svg xmlns="http://www.w3.org/2000/svg">{_symbols(names)}</svg>'
+
+
+def sprite_file(names: Iterable[str] | None = None) -> str:
+    """Standalone sprite document for ``names``, or for every bundled icon."""
+    from . import icon_name, load_icons
+
+    if names is None:
+        return _sprite_file(tuple(load_icons()["icons"]))
+    return _sprite_file(tuple(filter(None, map(icon_name, names))))
@@ -1,39 +1,61 @@
-"""StarUI component registry system."""
+"""StarUI component registry system.
 
-from .client import RegistryClient
-from .local import discover_components
+Exports are imported on first access: importing a component module runs this
+package's init, which shouldn't pull in starhtml or pydantic along with it.
+"""
 
-# Import dependencies with graceful fallback
-try:
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import RegistryClient
     from .dependencies import ensure_component_dependencies, require_scroll_handler
-    dependencies_available = True
-except ImportError:
-    dependencies_available = False
-    ensure_component_dependencies = None
-    require_scroll_handler = None
-
-# Import loader components with fallback
-try:
     from .loader import ComponentLoader, DependencyResolver
-    loader_available = True
-except ImportError:
-    loader_available = False
-    ComponentLoader = None
-    DependencyResolver = None
+    from .local import discover_components
+
+_EXPORTS = {
+    "RegistryClient": "client",
+    "discover_components": "local",
+    "ensure_component_dependencies": "dependencies",
+    "require_scroll_handler": "dependencies",
+    "ComponentLoader": "loader",
+    "DependencyResolver": "loader",
+}
+
+# Modules with a graceful fallback: their exports are None when unavailable
+_OPTIONAL = {"dependencies_available": "dependencies", "loader_available": "loader"}
 
 __all__ = [
     "RegistryClient",
     "discover_components",
+    "require_scroll_handler",
+    "ensure_component_dependencies",
+    "ComponentLoader",
+    "DependencyResolver",
 ]
 
-if dependencies_available:
-    __all__.extend([
-        "require_scroll_handler",
-        "ensure_component_dependencies",
-    ])
-
-if loader_available:
-    __all__.extend([
-        "ComponentLoader",
-        "DependencyResolver",
-    ])
+
+def _load(module: str) -> Any | None:
+    try:
+        return import_module(f".{module}", __name__)
+    except ImportError:
+        if module not in _OPTIONAL.values():
+            raise
+        return None
+
+
+def __getattr__(name: str) -> Any:
+    if name in _OPTIONAL:
+        value: Any = _load(_OPTIONAL[name]) is not None
+    elif name in _EXPORTS:
+        module = _load(_EXPORTS[name])
+        value = getattr(module, name) if module is not None else None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_OPTIONAL})
@@ -1,15 +1,26 @@
 """Registry client for accessing component files."""
 
-import re
+import os
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+from .index import COMPONENTS_PATH, load_index
+
+REGISTRY_URL_ENV = "STARUI_REGISTRY_URL"
+OFFLINE_ENV = "STARUI_OFFLINE"
+
 
 class RegistryClient:
     """Client for accessing components in the local registry."""
 
     def __init__(self, registry_path: Path | None = None) -> None:
-        self.registry_path = registry_path or Path(__file__).parent / "components"
+        self.registry_path = registry_path or COMPONENTS_PATH
+
+    @property
+    def index(self) -> dict[str, dict[str, Any]]:
+        """Component metadata from the registry index."""
+        return load_index(self.registry_path)
 
     def list_components(self) -> list[str]:
         """List all available components."""
@@ -18,15 +29,11 @@ class RegistryClient:
                 f"Registry directory not found: {self.registry_path}"
             )
 
-        return sorted(
-            f.stem
-            for f in self.registry_path.glob("*.py")
-            if f.name not in ("__init__.py", "utils.py")
-        )
+        return sorted(name for name in self.index if name != "utils")
 
     def component_exists(self, component_name: str) -> bool:
         """Check if a component exists."""
-        return (self.registry_path / f"{component_name}.py").exists()
+        return component_name in self.index
 
     def get_component_source(self, component_name: str) -> str:
         """Get component source code."""
@@ -35,26 +42,21 @@ class RegistryClient:
 
         return (self.registry_path / f"{component_name}.py").read_text(encoding="utf-8")
 
+    def get_component_sources(self, component_names: Iterable[str]) -> dict[str, str]:
+        """Get the source code of several components."""
+        return {name: self.get_component_source(name) for name in component_names}
+
     def get_component_metadata(self, component_name: str) -> dict[str, Any]:
-        """Extract metadata from component."""
-        source = self.get_component_source(component_name)
-
-        # Extract description from docstring
-        description = ""
-        if match := re.search(r'"""([^"]+)"""', source, re.DOTALL):
-            description = match.group(1).strip()
-            if "Dependencies:" in description:
-                description = description.split("Dependencies:")[0].strip()
-
-        # Extract dependencies
-        dependencies = []
-        if match := re.search(r'Dependencies:\s*([^\n"]+)', source, re.IGNORECASE):
-            deps_text = match.group(1).strip()
-            if deps_text:
-                dependencies = [d.strip() for d in deps_text.split(",") if d.strip()]
-
-        return {
-            "name": component_name,
-            "description": description,
-            "dependencies": dependencies,
-        }
+        """Get component metadata from the registry index."""
+        if (entry := self.index.get(component_name)) is None:
+            raise FileNotFoundError(f"Component '{component_name}' not found")
+        return dict(entry)
+
+
+def get_registry_client() -> RegistryClient:
+    """The remote registry at ``STARUI_REGISTRY_URL`` if set, else the bundled one."""
+    if url := os.environ.get(REGISTRY_URL_ENV):
+        from .remote import RemoteRegistryClient
+
+        return RemoteRegistryClient(url, offline=bool(os.environ.get(OFFLINE_ENV)))
+    return RegistryClient()
@@ -1,3 +1,4 @@
+from functools import cache
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -23,14 +24,15 @@ def _component(
     deps: list[str] | None = None,
     handlers: list[str] | None = None,
     **kwargs,
-) -> ComponentMetadata:
-    return ComponentMetadata(
-        name=name,
-        description=desc,
-        dependencies=deps or [],
-        handlers=handlers or [],
+) -> dict[str, Any]:
+    # Plain dicts, so the models are only built for components that are used
+    return {
+        "name": name,
+        "description": desc,
+        "dependencies": deps or [],
+        "handlers": handlers or [],
         **kwargs,
-    )
+    }
 
 
 COMPONENT_REGISTRY = {
@@ -105,5 +107,8 @@ COMPONENT_REGISTRY = {
 }
 
 
+@cache
 def get_component_metadata(component_name: str) -> ComponentMetadata | None:
-    return COMPONENT_REGISTRY.get(component_name)
+    if (entry := COMPONENT_REGISTRY.get(component_name)) is None:
+        return None
+    return ComponentMetadata(**entry)
@@ -1,168 +1,349 @@
-# Core utilities
-# Layout components
-from .accordion import Accordion, AccordionItem
-
-# Feedback components
-from .alert import Alert, AlertDescription, AlertTitle
-
-# Overlay components
-from .alert_dialog import (
-    AlertDialog,
-    AlertDialogAction,
-    AlertDialogCancel,
-    AlertDialogContent,
-    AlertDialogDescription,
-    AlertDialogFooter,
-    AlertDialogHeader,
-    AlertDialogTitle,
-    AlertDialogTrigger,
-)
-
-# Data display components
-from .avatar import Avatar, AvatarFallback, AvatarImage, AvatarWithFallback
-from .badge import Badge
-from .breadcrumb import (
-    Breadcrumb,
-    BreadcrumbEllipsis,
-    BreadcrumbItem,
-    BreadcrumbLink,
-    BreadcrumbList,
-    BreadcrumbPage,
-    BreadcrumbSeparator,
-)
-
-# Form components
-from .button import Button
-from .calendar import Calendar
-from .card import (
-    Card,
-    CardAction,
-    CardContent,
-    CardDescription,
-    CardFooter,
-    CardHeader,
-    CardTitle,
-)
-from .checkbox import Checkbox, CheckboxWithLabel
-
-# Utility components
-from .code_block import CodeBlock
-from .code_block import InlineCode as CodeInlineCode
-from .dialog import (
-    Dialog,
-    DialogClose,
-    DialogContent,
-    DialogDescription,
-    DialogFooter,
-    DialogHeader,
-    DialogTitle,
-    DialogTrigger,
-)
-from .dropdown_menu import (
-    DropdownMenu,
-    DropdownMenuCheckboxItem,
-    DropdownMenuContent,
-    DropdownMenuGroup,
-    DropdownMenuItem,
-    DropdownMenuLabel,
-    DropdownMenuRadioGroup,
-    DropdownMenuRadioItem,
-    DropdownMenuSeparator,
-    DropdownMenuShortcut,
-    DropdownMenuSub,
-    DropdownMenuSubContent,
-    DropdownMenuSubTrigger,
-    DropdownMenuTrigger,
-)
-from .hover_card import HoverCard, HoverCardTrigger
-from .input import Input, InputWithLabel
-from .label import Label
-from .popover import Popover, PopoverTrigger
-from .progress import Progress
-from .radio_group import RadioGroup, RadioGroupItem, RadioGroupWithLabel
-from .select import (
-    Select,
-    SelectContent,
-    SelectGroup,
-    SelectItem,
-    SelectLabel,
-    SelectTrigger,
-    SelectValue,
-    SelectWithLabel,
-    # SelectWithLabelSimple,
-)
-from .separator import Separator
-from .sheet import (
-    Sheet,
-    SheetClose,
-    SheetContent,
-    SheetDescription,
-    SheetFooter,
-    SheetHeader,
-    SheetTitle,
-    SheetTrigger,
-)
-from .skeleton import Skeleton
-from .switch import Switch, SwitchWithLabel
-from .table import (
-    Table,
-    TableBody,
-    TableCaption,
-    TableCell,
-    TableFooter,
-    TableHead,
-    TableHeader,
-    TableRow,
-)
-
-# Navigation components
-from .tabs import Tabs, TabsContent, TabsList, TabsTrigger
-from .textarea import Textarea, TextareaWithLabel
-from .theme_toggle import ThemeToggle
-from .toast import Toaster
-from .toggle import Toggle
-from .toggle_group import (
-    MultipleToggleGroup,
-    SingleToggleGroup,
-    ToggleGroup,
-    ToggleGroupItem,
-)
-from .tooltip import Tooltip, TooltipContent, TooltipProvider, TooltipTrigger
-
-# Typography components
-from .typography import (
-    H1,
-    H2,
-    H3,
-    H4,
-    H5,
-    H6,
-    Blockquote,
-    Caption,
-    Display,
-    Em,
-    Figcaption,
-    Figure,
-    Hr,
-    InlineCode,
-    Kbd,
-    Large,
-    Lead,
-    List,
-    Mark,
-    Muted,
-    P,
-    Prose,
-    Small,
-    Strong,
-    Subtitle,
-    Text,
-)
-from .utils import Icon, cn, cva
+"""StarUI components, imported on first access.
+
+Each export maps to the component module that defines it, so using one
+component doesn't import the other modules (and their starhtml, fastcore or
+starlighter dependencies).
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Core utilities
+    # Layout components
+    from .accordion import Accordion, AccordionItem
+
+    # Feedback components
+    from .alert import Alert, AlertDescription, AlertTitle
+
+    # Overlay components
+    from .alert_dialog import (
+        AlertDialog,
+        AlertDialogAction,
+        AlertDialogCancel,
+        AlertDialogContent,
+        AlertDialogDescription,
+        AlertDialogFooter,
+        AlertDialogHeader,
+        AlertDialogTitle,
+        AlertDialogTrigger,
+    )
+
+    # Data display components
+    from .avatar import Avatar, AvatarFallback, AvatarImage, AvatarWithFallback
+    from .badge import Badge
+    from .breadcrumb import (
+        Breadcrumb,
+        BreadcrumbEllipsis,
+        BreadcrumbItem,
+        BreadcrumbLink,
+        BreadcrumbList,
+        BreadcrumbPage,
+        BreadcrumbSeparator,
+    )
+
+    # Form components
+    from .button import Button
+    from .calendar import Calendar
+    from .card import (
+        Card,
+        CardAction,
+        CardContent,
+        CardDescription,
+        CardFooter,
+        CardHeader,
+        CardTitle,
+    )
+    from .checkbox import Checkbox, CheckboxWithLabel
+
+    # Utility components
+    from .code_block import CodeBlock
+    from .code_block import InlineCode as CodeInlineCode
+    from .dialog import (
+        Dialog,
+        DialogClose,
+        DialogContent,
+        DialogDescription,
+        DialogFooter,
+        DialogHeader,
+        DialogTitle,
+        DialogTrigger,
+    )
+    from .dropdown_menu import (
+        DropdownMenu,
+        DropdownMenuCheckboxItem,
+        DropdownMenuContent,
+        DropdownMenuGroup,
+        DropdownMenuItem,
+        DropdownMenuLabel,
+        DropdownMenuRadioGroup,
+        DropdownMenuRadioItem,
+        DropdownMenuSeparator,
+        DropdownMenuShortcut,
+        DropdownMenuSub,
+        DropdownMenuSubContent,
+        DropdownMenuSubTrigger,
+        DropdownMenuTrigger,
+    )
+    from .hover_card import HoverCard, HoverCardTrigger
+    from .input import Input, InputWithLabel
+    from .label import Label
+    from .popover import Popover, PopoverTrigger
+    from .progress import Progress
+    from .radio_group import RadioGroup, RadioGroupItem, RadioGroupWithLabel
+    from .select import (
+        Select,
+        SelectContent,
+        SelectGroup,
+        SelectItem,
+        SelectLabel,
+        SelectTrigger,
+        SelectValue,
+        SelectWithLabel,
+        # SelectWithLabelSimple,
+    )
+    from .separator import Separator
+    from .sheet import (
+        Sheet,
+        SheetClose,
+        SheetContent,
+        SheetDescription,
+        SheetFooter,
+        SheetHeader,
+        SheetTitle,
+        SheetTrigger,
+    )
+    from .skeleton import Skeleton
+    from .switch import Switch, SwitchWithLabel
+    from .table import (
+        Table,
+        TableBody,
+        TableCaption,
+        TableCell,
+        TableFooter,
+        TableHead,
+        TableHeader,
+        TableRow,
+    )
+
+    # Navigation components
+    from .tabs import Tabs, TabsContent, TabsList, TabsTrigger
+    from .textarea import Textarea, TextareaWithLabel
+    from .theme_toggle import ThemeToggle
+    from .toast import Toaster
+    from .toggle import Toggle
+    from .toggle_group import (
+        MultipleToggleGroup,
+        SingleToggleGroup,
+        ToggleGroup,
+        ToggleGroupItem,
+    )
+    from .tooltip import Tooltip, TooltipContent, TooltipProvider, TooltipTrigger
+
+    # Typography components
+    from .typography import (
+        H1,
+        H2,
+        H3,
+        H4,
+        H5,
+        H6,
+        Blockquote,
+        Caption,
+        Display,
+        Em,
+        Figcaption,
+        Figure,
+        Hr,
+        InlineCode,
+        Kbd,
+        Large,
+        Lead,
+        List,
+        Mark,
+        Muted,
+        P,
+        Prose,
+        Small,
+        Strong,
+        Subtitle,
+        Text,
+    )
+    from .utils import Icon, cn, cva, set_cn_merge
+
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "accordion": ("Accordion", "AccordionItem"),
+    "alert": ("Alert", "AlertDescription", "AlertTitle"),
+    "alert_dialog": (
+        "AlertDialog",
+        "AlertDialogAction",
+        "AlertDialogCancel",
+        "AlertDialogContent",
+        "AlertDialogDescription",
+        "AlertDialogFooter",
+        "AlertDialogHeader",
+        "AlertDialogTitle",
+        "AlertDialogTrigger",
+    ),
+    "avatar": ("Avatar", "AvatarFallback", "AvatarImage", "AvatarWithFallback"),
+    "badge": ("Badge",),
+    "breadcrumb": (
+        "Breadcrumb",
+        "BreadcrumbEllipsis",
+        "BreadcrumbItem",
+        "BreadcrumbLink",
+        "BreadcrumbList",
+        "BreadcrumbPage",
+        "BreadcrumbSeparator",
+    ),
+    "button": ("Button",),
+    "calendar": ("Calendar",),
+    "card": (
+        "Card",
+        "CardAction",
+        "CardContent",
+        "CardDescription",
+        "CardFooter",
+        "CardHeader",
+        "CardTitle",
+    ),
+    "checkbox": ("Checkbox", "CheckboxWithLabel"),
+    "code_block": ("CodeBlock",),
+    "dialog": (
+        "Dialog",
+        "DialogClose",
+        "DialogContent",
+        "DialogDescription",
+        "DialogFooter",
+        "DialogHeader",
+        "DialogTitle",
+        "DialogTrigger",
+    ),
+    "dropdown_menu": (
+        "DropdownMenu",
+        "DropdownMenuCheckboxItem",
+        "DropdownMenuContent",
+        "DropdownMenuGroup",
+        "DropdownMenuItem",
+        "DropdownMenuLabel",
+        "DropdownMenuRadioGroup",
+        "DropdownMenuRadioItem",
+        "DropdownMenuSeparator",
+        "DropdownMenuShortcut",
+        "DropdownMenuSub",
+        "DropdownMenuSubContent",
+        "DropdownMenuSubTrigger",
+        "DropdownMenuTrigger",
+    ),
+    "hover_card": ("HoverCard", "HoverCardTrigger"),
+    "input": ("Input", "InputWithLabel"),
+    "label": ("Label",),
+    "popover": ("Popover", "PopoverTrigger"),
+    "progress": ("Progress",),
+    "radio_group": ("RadioGroup", "RadioGroupItem", "RadioGroupWithLabel"),
+    "select": (
+        "Select",
+        "SelectContent",
+        "SelectGroup",
+        "SelectItem",
+        "SelectLabel",
+        "SelectTrigger",
+        "SelectValue",
+        "SelectWithLabel",
+    ),
+    "separator": ("Separator",),
+    "sheet": (
+        "Sheet",
+        "SheetClose",
+        "SheetContent",
+        "SheetDescription",
+        "SheetFooter",
+        "SheetHeader",
+        "SheetTitle",
+        "SheetTrigger",
+    ),
+    "skeleton": ("Skeleton",),
+    "switch": ("Switch", "SwitchWithLabel"),
+    "table": (
+        "Table",
+        "TableBody",
+        "TableCaption",
+        "TableCell",
+        "TableFooter",
+        "TableHead",
+        "TableHeader",
+        "TableRow",
+    ),
+    "tabs": ("Tabs", "TabsContent", "TabsList", "TabsTrigger"),
+    "textarea": ("Textarea", "TextareaWithLabel"),
+    "theme_toggle": ("ThemeToggle",),
+    "toast": ("Toaster",),
+    "toggle": ("Toggle",),
+    "toggle_group": (
+        "MultipleToggleGroup",
+        "SingleToggleGroup",
+        "ToggleGroup",
+        "ToggleGroupItem",
+    ),
+    "tooltip": ("Tooltip", "TooltipContent", "TooltipProvider", "TooltipTrigger"),
+    "typography": (
+        "H1",
+        "H2",
+        "H3",
+        "H4",
+        "H5",
+        "H6",
+        "Blockquote",
+        "Caption",
+        "Display",
+        "Em",
+        "Figcaption",
+        "Figure",
+        "Hr",
+        "InlineCode",
+        "Kbd",
+        "Large",
+        "Lead",
+        "List",
+        "Mark",
+        "Muted",
+        "P",
+        "Prose",
+        "Small",
+        "Strong",
+        "Subtitle",
+        "Text",
+    ),
+    "utils": ("Icon", "cn", "cva", "set_cn_merge"),
+}
+
+_ALIASES = {
+    "CodeInlineCode": ("code_block", "InlineCode"),
+}
+
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _ALIASES:
+        module, attr = _ALIASES[name]
+    elif name in _MODULES:
+        module, attr = _MODULES[name], name
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     # Utilities
-    "cn", "cva", "Icon",
+    "cn", "cva", "Icon", "set_cn_merge",
 
     # Layout
     "Accordion", "AccordionItem",
@@ -1,9 +1,10 @@
 from typing import Any, Literal
-from uuid import uuid4
 
-from rusty_tags import Button, Details, Div, HtmlString, Path, Section, Summary, Svg
+from rusty_tags import Button, Details, Div, HtmlString, Section, Summary
 from rusty_tags.datastar import Signals
 
+from starui.render.ids import new_id
+
 from .utils import Icon, cn
 
 
@@ -14,7 +15,7 @@ def Accordion(
     cls: str = "accordion",
     **attrs: Any,
 ) -> HtmlString:
-    signal = signal or f"accordion_{uuid4().hex[:8]}"
+    signal = signal or f"accordion_{new_id()}"
 
     processed_children = [
         child(signal, type) if callable(child) else child
@@ -37,7 +38,7 @@ def AccordionItem(
     cls: str = "group border-b last:border-b-0",
     **attrs: Any,
 ) -> HtmlString:
-    id = attrs.pop("id", f"accordion-item-{str(uuid4())[:8]}")
+    id = attrs.pop("id", f"accordion-item-{new_id()}")
     def create_item(signal, type="single"):
         if type == "single":
             open_params = {"data_attr_open": f"${signal} === '{id}'"}
@@ -47,18 +48,9 @@ def AccordionItem(
         return Details(
             Summary(
                 summary,
-                Svg(
-                    Path(d='m6 9 6 6 6-6'),
-                    xmlns='http://www.w3.org/2000/svg',
-                    width='24',
-                    height='24',
-                    viewbox='0 0 24 24',
-                    fill='none',
-                    stroke='currentColor',
-                    stroke_width='2',
-                    stroke_linecap='round',
-                    stroke_linejoin='round',
-                    cls='text-muted-foreground pointer-events-none size-4 shrink-0 translate-y-0.5 transition-transform duration-200 group-open:rotate-180'
+                Icon(
+                    "chevron-down",
+                    cls="text-muted-foreground pointer-events-none size-4 shrink-0 translate-y-0.5 transition-transform duration-200 group-open:rotate-180",
                 ),
                 cls='flex flex-1 items-start justify-between gap-4 py-4 text-left text-sm font-medium hover:underline'
             ),
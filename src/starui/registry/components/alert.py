@@ -2,6 +2,8 @@ from typing import Literal
 
 from rusty_tags import Div, HtmlString
 
+from starui.render.cache import memoized
+
 from .utils import cn, cva
 
 AlertVariant = Literal["default", "destructive"]
@@ -21,6 +23,7 @@ alert_variants = cva(
 )
 
 
+@memoized
 def Alert(
     *children,
     variant: AlertVariant = "default",
@@ -42,6 +45,7 @@ def Alert(
     )
 
 
+@memoized
 def AlertTitle(
     *children,
     class_name: str = "",
@@ -60,6 +64,7 @@ def AlertTitle(
     )
 
 
+@memoized
 def AlertDescription(
     *children,
     class_name: str = "",
@@ -1,10 +1,11 @@
 from typing import Any
-from uuid import uuid4
 
 from rusty_tags import Div, HtmlString, Img
 from rusty_tags.datastar import Signals
 from starhtml.datastar import ds_on, ds_show, ds_signals
 
+from starui.render.ids import new_id
+
 from .utils import cn
 
 
@@ -84,7 +85,7 @@ def AvatarWithFallback(
             **attrs,
         )
 
-    signal = f"avatar_{str(uuid4())[:8]}_error"
+    signal = f"avatar_{new_id()}_error"
 
     return Avatar(
         Img(
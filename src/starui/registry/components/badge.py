@@ -3,6 +3,8 @@ from typing import Literal
 from rusty_tags import A, HtmlString, Span
 from rusty_tags import Button as HTMLButton
 
+from starui.render.cache import memoized
+
 from .utils import cn, cva
 
 BadgeVariant = Literal["default", "secondary", "destructive", "outline"]
@@ -24,6 +26,7 @@ badge_variants = cva(
 )
 
 
+@memoized
 def Badge(
     *children,
     variant: BadgeVariant = "default",
@@ -3,6 +3,8 @@ from typing import Any, Literal
 from rusty_tags import Button as HTMLButton
 from rusty_tags import HtmlString
 
+from starui.render.cache import memoized
+
 from .utils import cn, cva
 
 ButtonVariant = Literal[
@@ -35,6 +37,7 @@ button_variants = cva(
 )
 
 
+@memoized
 def Button(
     *children: Any,
     variant: ButtonVariant = "default",
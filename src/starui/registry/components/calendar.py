@@ -1,10 +1,12 @@
 from datetime import datetime, timedelta
 from typing import Any, Literal
-from uuid import uuid4
 
 from starhtml import Div, Icon, Style
 from starhtml.datastar import ds_effect, ds_on_click, ds_signals, ds_text, value
 
+from starui.render.context import require_asset
+from starui.render.ids import new_id
+
 from .button import Button
 from .utils import cn
 
@@ -23,7 +25,7 @@ def Calendar(
     cls: str = "",
     **attrs: Any,
 ) -> Div:
-    signal = signal or f"calendar_{uuid4().hex[:8]}"
+    signal = signal or f"calendar_{new_id()}"
     today = datetime.now()
     current_month = month or today.month
     current_year = year or today.year
@@ -51,7 +53,7 @@ def Calendar(
     }
 
     return Div(
-        Style(_CALENDAR_STYLES),
+        require_asset("starui-calendar-styles", Style(_CALENDAR_STYLES)),
         Div(
             Button(
                 Icon("lucide:chevron-left", cls="h-4 w-4"),
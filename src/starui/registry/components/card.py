@@ -8,11 +8,14 @@ from rusty_tags import H5 as HTMLH5
 from rusty_tags import H6 as HTMLH6
 from rusty_tags import Div, HtmlString, P
 
+from starui.render.stream import streaming
+
 from .utils import cn
 
 HeadingLevel = Literal["h1", "h2", "h3", "h4", "h5", "h6"]
 
 
+@streaming
 def Card(
     *children,
     class_name: str = "",
@@ -87,6 +90,7 @@ def CardAction(
     return Div(*children, cls=classes, data_slot="card-action", **attrs)
 
 
+@streaming
 def CardContent(
     *children,
     class_name: str = "",
@@ -1,5 +1,4 @@
 from typing import Any
-from uuid import uuid4
 
 from rusty_tags import Div, HtmlString
 from rusty_tags import Input as HTMLInput
@@ -8,6 +7,8 @@ from rusty_tags import P as HTMLP
 from rusty_tags import Span as HTMLSpan
 from rusty_tags.datastar import Signals
 
+from starui.render.ids import new_id
+
 from .utils import Icon, cn
 
 
@@ -22,7 +23,7 @@ def Checkbox(
     indicator_cls: str = "",
     **attrs: Any,
 ) -> HtmlString:
-    signal = signal or f"checkbox_{str(uuid4())[:8]}"
+    signal = signal or f"checkbox_{new_id()}"
 
     return Div(
         HTMLInput(
@@ -76,7 +77,7 @@ def CheckboxWithLabel(
     indicator_cls: str = "",
     **attrs: Any,
 ) -> HtmlString:
-    checkbox_id = f"checkbox_{str(uuid4())[:8]}"
+    checkbox_id = f"checkbox_{new_id()}"
 
     return Div(
         Div(
@@ -1,9 +1,10 @@
 from typing import Any, Literal
-from uuid import uuid4
 
 from rusty_tags import Button as HTMLButton
 from rusty_tags import Div, Hr, HtmlString, Script, Signals, Span
 
+from starui.render.ids import new_id
+
 from .button import Button
 from .utils import Icon, cn
 
@@ -11,7 +12,7 @@ from .utils import Icon, cn
 def DropdownMenu(
     *children, signal: str | None = None, cls: str = "", **attrs: Any
 ) -> HtmlString:
-    signal = signal or f"dropdown_{uuid4().hex[:8]}"
+    signal = signal or f"dropdown_{new_id()}"
     return Div(
         *[child(signal) if callable(child) else child for child in children],
         cls=cn("relative inline-block","dropdown-menu", cls),
@@ -288,7 +289,7 @@ def DropdownMenuSub(
     class_name: str = "",
     **attrs: Any,
 ) -> HtmlString:
-    signal = signal or f"dropdown_sub_{uuid4().hex[:8]}"
+    signal = signal or f"dropdown_sub_{new_id()}"
     return Div(
         *children,
         cls=cn("relative", class_name, cls),
@@ -1,8 +1,9 @@
 from typing import Literal
-from uuid import uuid4
 
 from rusty_tags import Div, HtmlString
 
+from starui.render.ids import new_id
+
 from .button import Button
 from .utils import cn
 
@@ -19,7 +20,7 @@ def HoverCardTrigger(*children,
                     hide_delay: int = 300,
                     variant="default", cls="",
                     **attrs) -> HtmlString:
-    id = id or uuid4().hex[:8]
+    id = id or f"hover_card_{new_id()}"
     return Div(
         *children,
         id=f'{id}',
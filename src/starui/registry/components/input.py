@@ -5,6 +5,8 @@ from rusty_tags import Input as HTMLInput
 from rusty_tags import Label as HTMLLabel
 from rusty_tags import P as HTMLP
 
+from starui.render.ids import new_id
+
 from .utils import cn
 
 InputType = Literal[
@@ -107,9 +109,7 @@ def InputWithLabel(
     **attrs,
 ) -> HtmlString:
     if not id:
-        import uuid
-
-        id = f"input_{str(uuid.uuid4())[:8]}"
+        id = f"input_{new_id()}"
 
     if error_text:
         attrs["aria_invalid"] = "true"
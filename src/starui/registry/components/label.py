@@ -1,9 +1,12 @@
 from rusty_tags import HtmlString
 from rusty_tags import Label as HtmlLabel
 
+from starui.render.cache import memoized
+
 from .utils import cn
 
 
+@memoized
 def Label(
     *children,
     class_name: str = "",
@@ -1,8 +1,9 @@
 from typing import Literal
-from uuid import uuid4
 
 from rusty_tags import Div, HtmlString
 
+from starui.render.ids import new_id
+
 from .button import Button
 from .utils import cn
 
@@ -12,7 +13,7 @@ def PopoverTrigger(*children,
                     id: str | None = None,
                     variant="default", cls="",
                     **attrs) -> HtmlString:
-    id = id or uuid4().hex[:8]
+    id = id or f"popover_{new_id()}"
     return Button(
         *children,
         id=f'{id}',
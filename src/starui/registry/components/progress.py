@@ -1,11 +1,12 @@
 """Progress component - Loading and completion indicators."""
 
 from typing import Any
-from uuid import uuid4
 
 from rusty_tags import Div, HtmlString
 from rusty_tags.datastar import Signals
 
+from starui.render.ids import new_id
+
 from .utils import cn
 
 
@@ -17,7 +18,7 @@ def Progress(
     cls: str = "",
     **attrs: Any,
 ) -> HtmlString:
-    signal = signal or f"progress_{str(uuid4())[:8]}"
+    signal = signal or f"progress_{new_id()}"
 
     initial_percentage = max(
         0,
@@ -1,6 +1,4 @@
-from itertools import count
 from typing import Any
-from uuid import uuid4
 
 from rusty_tags import HtmlString, Div
 from rusty_tags import Input as HTMLInput
@@ -9,9 +7,9 @@ from rusty_tags import P as HTMLP
 from rusty_tags import Span as HTMLSpan
 from rusty_tags.datastar import Signals
 
-from .utils import cn
+from starui.render.ids import new_id
 
-_radio_group_ids = count(1)
+from .utils import cn
 
 
 def RadioGroup(
@@ -24,7 +22,7 @@ def RadioGroup(
     cls: str = "",
     **attrs: Any,
 ) -> HtmlString:
-    signal = signal or f"radio_{next(_radio_group_ids)}"
+    signal = signal or f"radio_{new_id()}"
     group_name = f"radio_group_{signal}"
 
     processed_children = [
@@ -55,7 +53,7 @@ def RadioGroupItem(
     **attrs: Any,
 ) -> HtmlString:
     def create_item(signal, group_name, default_value=None):
-        radio_id = f"radio_{str(uuid4())[:8]}"
+        radio_id = f"radio_{new_id()}"
         filtered_attrs = {k: v for k, v in attrs.items() if k != "name"}
 
         radio_input = HTMLInput(
@@ -107,7 +105,7 @@ def RadioGroupWithLabel(
     cls: str = "",
     **attrs: Any,
 ) -> HtmlString:
-    base_id = str(uuid4())[:8]
+    base_id = new_id()
     signal = signal or f"radio_{base_id}"
     name = name or f"radio_group_{signal}"
     group_id = f"radiogroup_{base_id}"
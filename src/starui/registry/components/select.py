@@ -1,8 +1,7 @@
 from typing import Any
-from uuid import uuid4
 
 from rusty_tags import Button as HTMLButton
-from rusty_tags import Circle, Div, Header, HtmlString, Path, Span, Svg
+from rusty_tags import Div, Header, HtmlString, Span
 from rusty_tags import Input as HTMLInput
 from rusty_tags import Label as HTMLLabel
 from rusty_tags import Optgroup as HTMLOptionGroup
@@ -11,6 +10,8 @@ from rusty_tags import P as HTMLP
 from rusty_tags import Select as HTMLSelect
 from rusty_tags.datastar import Signals
 
+from starui.render.ids import new_id
+
 from .utils import Icon, cn
 
 
@@ -21,7 +22,7 @@ def Select(
         cls: str = "",
         **attrs: Any,
     ) -> HtmlString:
-    signal = signal or f"select_{uuid4().hex[:8]}"
+    signal = signal or f"select_{new_id()}"
     return Div(
         *children,
         HTMLInput(type='hidden', name=f'select-{signal}-value', value=initial_value or ''),
@@ -41,20 +42,7 @@ def SelectTrigger(
     trigger_id = attrs.pop("id", f"select-{signal}-trigger")
     trigger= HTMLButton(
         *children,
-        Svg(
-            Path(d='m7 15 5 5 5-5'),
-            Path(d='m7 9 5-5 5 5'),
-            xmlns='http://www.w3.org/2000/svg',
-            width='24',
-            height='24',
-            viewbox='0 0 24 24',
-            fill='none',
-            stroke='currentColor',
-            stroke_width='2',
-            stroke_linecap='round',
-            stroke_linejoin='round',
-            cls='lucide lucide-chevrons-up-down-icon lucide-chevrons-up-down text-muted-foreground opacity-50 shrink-0'
-        ),
+        Icon("chevrons-up-down", cls="text-muted-foreground opacity-50 shrink-0"),
         type='button',
         id=trigger_id,
         aria_haspopup='listbox',
@@ -89,20 +77,7 @@ def SelectContent(
 
     return Div(
             Header(
-                Svg(
-                    Circle(cx='11', cy='11', r='8'),
-                    Path(d='m21 21-4.3-4.3'),
-                    xmlns='http://www.w3.org/2000/svg',
-                    width='24',
-                    height='24',
-                    viewbox='0 0 24 24',
-                    fill='none',
-                    stroke='currentColor',
-                    stroke_width='2',
-                    stroke_linecap='round',
-                    stroke_linejoin='round',
-                    cls='lucide lucide-search-icon lucide-search'
-                ),
+                Icon("search"),
                 HTMLInput(type='text', value='', placeholder='Search entries...', autocomplete='off', autocorrect='off', spellcheck='false', aria_autocomplete='list', role='combobox', aria_expanded='false', aria_controls=f'select-{signal}-listbox', aria_labelledby=f'select-{signal}-trigger')
             ),
             Div(
@@ -130,7 +105,7 @@ def SelectItem(
 ) -> HtmlString:
     label = label or value
     signal = signal or "select"
-    id = f'select-{signal}-items-{uuid4().hex[:8]}'
+    id = f'select-{signal}-items-{new_id()}'
     return Div(label, id=id, role='option', data_value=value,  disabled=disabled, cls=cls, **attrs)
 
 def SelectGroup(
@@ -141,7 +116,7 @@ def SelectGroup(
     **attrs: Any,
 ) -> HtmlString:
     signal = signal or "select"
-    id = f'group-label-select-{signal}-items-{uuid4().hex[:8]}'
+    id = f'group-label-select-{signal}-items-{new_id()}'
     return Div(
             Div(label, role='heading', id=id),
            *children,
@@ -178,7 +153,7 @@ def SelectWithLabel(
     ) -> HtmlString:
     # Generate signal if not provided
     if not signal:
-        signal = f"select_{uuid4().hex[:8]}"
+        signal = f"select_{new_id()}"
 
     # Use the signal-based ID that SelectTrigger expects
     select_id = f"{signal}-trigger"
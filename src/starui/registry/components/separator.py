@@ -2,9 +2,12 @@ from typing import Any, Literal
 
 from rusty_tags import Div, HtmlString
 
+from starui.render.cache import memoized
+
 from .utils import cn
 
 
+@memoized
 def Separator(
     orientation: Literal["horizontal", "vertical"] = "horizontal",
     decorative: bool = True,
@@ -1,8 +1,11 @@
 from rusty_tags import HtmlString, Div
 
+from starui.render.cache import memoized
+
 from .utils import cn
 
 
+@memoized
 def Skeleton(
     *children,
     class_name: str = "",
@@ -1,5 +1,4 @@
 from typing import Any
-from uuid import uuid4
 
 from rusty_tags import Div, HtmlString
 from rusty_tags import Input as HTMLInput
@@ -8,6 +7,8 @@ from rusty_tags import P as HTMLP
 from rusty_tags import Span as HTMLSpan
 from rusty_tags.datastar import Signals
 
+from starui.render.ids import new_id
+
 from .utils import cn
 
 
@@ -20,8 +21,8 @@ def Switch(
     cls: str = "",
     **attrs: Any,
 ) -> HtmlString:
-    signal = signal or f'switch_{str(uuid4())[:8]}'
-    switch_id = attrs.pop("id", f"switch_{str(uuid4())[:8]}")
+    signal = signal or f'switch_{new_id()}'
+    switch_id = attrs.pop("id", f"switch_{new_id()}")
 
     return Div(
         HTMLInput(
@@ -53,8 +54,8 @@ def SwitchWithLabel(
     switch_cls: str = "",
     **attrs: Any,
 ) -> HtmlString:
-    signal = signal or f"switch_{str(uuid4())[:8]}"
-    switch_id = f"switch_{str(uuid4())[:8]}"
+    signal = signal or f"switch_{new_id()}"
+    switch_id = f"switch_{new_id()}"
 
     return Div(
         Div(
@@ -15,9 +15,12 @@ from rusty_tags import (
     Table as HTMLTable,
 )
 
+from starui.render.stream import streaming
+
 from .utils import cn
 
 
+@streaming
 def Table(
     *children: Any,
     class_name: str = "",
@@ -42,6 +45,7 @@ def TableHeader(
     return Thead(*children, data_slot="table-header", cls=classes, **attrs)
 
 
+@streaming
 def TableBody(
     *children: Any,
     class_name: str = "",
@@ -1,16 +1,15 @@
-from itertools import count
 from typing import Literal
 
 from rusty_tags import Button as HTMLButton
 from rusty_tags import Div, HtmlString
 from rusty_tags.datastar import Signals
 
+from starui.render.ids import new_id
+
 from .utils import cn
 
 TabsVariant = Literal["default", "plain"]
 
-_tab_ids = count(1)
-
 
 def Tabs(
     *children,
@@ -21,7 +20,7 @@ def Tabs(
 ) -> HtmlString:
     signal = attrs.pop("signal", None)
     if not signal:
-        signal = f"tabs_{next(_tab_ids)}"
+        signal = f"tabs_{new_id()}"
     processed_children = [
         child(signal, default_id, variant) if callable(child) else child
         for child in children
@@ -6,6 +6,8 @@ from rusty_tags import P as HTMLP
 from rusty_tags import Span as HTMLSpan
 from rusty_tags import Textarea as HTMLTextarea
 
+from starui.render.ids import new_id
+
 from .utils import cn
 
 ResizeType = Literal["none", "both", "horizontal", "vertical"]
@@ -102,9 +104,7 @@ def TextareaWithLabel(
     **attrs: Any,
 ) -> HtmlString:
     if not id:
-        import uuid
-
-        id = f"textarea_{str(uuid.uuid4())[:8]}"
+        id = f"textarea_{new_id()}"
 
     if error_text:
         attrs["aria_invalid"] = "true"
@@ -1,10 +1,11 @@
 from typing import Any, Literal
-from uuid import uuid4
 
 from rusty_tags import HtmlString, Div
 from rusty_tags import Button as HTMLButton
 from rusty_tags.datastar import Signals
 
+from starui.render.ids import new_id
+
 from .utils import cn, cva
 
 ToggleVariant = Literal["default", "outline"]
@@ -45,8 +46,8 @@ def Toggle(
     cls: str = "",
     **attrs: Any,
 ) -> HtmlString:
-    signal = signal or f"toggle_{str(uuid4())[:8]}"
-    toggle_id = attrs.pop("id", f"toggle_{str(uuid4())[:8]}")
+    signal = signal or f"toggle_{new_id()}"
+    toggle_id = attrs.pop("id", f"toggle_{new_id()}")
 
     return Div(
         HTMLButton(
@@ -1,10 +1,11 @@
 from typing import Any, Literal
-from uuid import uuid4
 
 from rusty_tags import Button as HTMLButton
 from rusty_tags import Div, HtmlString
 from rusty_tags.datastar import Signals
 
+from starui.render.ids import new_id
+
 from .toggle import toggle_variants
 from .utils import cn
 
@@ -24,7 +25,7 @@ def ToggleGroup(
     cls: str = "",
     **attrs: Any,
 ) -> HtmlString:
-    signal = signal or f"toggle_group_{str(uuid4())[:8]}"
+    signal = signal or f"toggle_group_{new_id()}"
     value_signal = f"{signal}_value"
 
     initial_value = "" if type == "single" else []
@@ -82,7 +83,7 @@ def ToggleGroupItem(
     **attrs: Any,
 ) -> HtmlString:
     value_signal = f"{group_signal}_value"
-    item_id = attrs.pop("id", f"toggle_item_{str(uuid4())[:8]}")
+    item_id = attrs.pop("id", f"toggle_item_{new_id()}")
     aria_label = aria_label or attrs.pop("aria_label", None)
 
     if type == "single":
@@ -1,6 +1,5 @@
 from collections.abc import Callable
 from typing import Any, Literal
-from uuid import uuid4
 
 from starhtml import FT, Div
 from starhtml.datastar import (
@@ -15,11 +14,13 @@ from starhtml.datastar import (
     ds_signals,
 )
 
+from starui.render.ids import new_id
+
 from .utils import cn
 
 
 def Tooltip(*children, cls: str = "relative inline-block", **attrs: Any) -> FT:
-    tooltip_id = f"tooltip_{uuid4().hex[:8]}"
+    tooltip_id = f"tooltip_{new_id()}"
     return Div(
         *[child(tooltip_id) if callable(child) else child for child in children],
         ds_signals({f"{tooltip_id}_open": False}),
@@ -1,14 +1,55 @@
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from rusty_tags import HtmlString, I, Script
 
+from starui.render.tracking import mark_volatile, settings_changed
+
+# Variant combinations remembered per cva; the Literal values keep real tables small
+CVA_TABLE_SIZE = 1024
+# Distinct all-string cn() calls remembered
+CN_CACHE_SIZE = 4096
+
 
 def Icon(icon: str, **attrs) -> HtmlString:
-    """Iconify icon element. Usage: Icon("home", cls="h-4 w-4")"""
-    return I(Script("lucide.createIcons();"),data_lucide=icon, **attrs)
+    """Lucide icon as inline SVG. Usage: Icon("home", cls="h-4 w-4")
+
+    Icons missing from the bundled index fall back to lucide's client-side
+    rendering, which needs the lucide script on the page.
+    """
+    from starui.icons import current_sheet, render_icon
+
+    if current_sheet() is not None:
+        mark_volatile(contextual=True)  # The sheet must see every use
+    if (svg := render_icon(icon, **attrs)) is not None:
+        return svg
+    return I(Script("lucide.createIcons();"), data_lucide=icon, **attrs)
+
+
+def cn(*classes: Any, merge: bool | None = None) -> str:
+    """Join class names, skipping falsy ones. Dicts map classes to conditions.
+
+    With ``merge`` (default: see ``set_cn_merge``) conflicting Tailwind
+    utilities are resolved in favour of the last one, so ``cls="h-12"`` replaces
+    a component's ``h-9`` instead of shipping both.
+    """
+    if merge is None:
+        merge = _merge_by_default
 
-def cn(*classes: Any) -> str:
+    for cls in classes:
+        if cls.__class__ is not str:
+            return _resolve(classes, merge)
+    return _join(classes, merge)
+
+
+@lru_cache(maxsize=CN_CACHE_SIZE)
+def _join(classes: tuple[str, ...], merge: bool) -> str:
+    joined = " ".join(filter(None, classes))
+    return _merge(joined) if merge else joined
+
+
+def _resolve(classes: tuple[Any, ...], merge: bool) -> str:
     result_classes: list[str] = []
 
     for cls in classes:
@@ -22,50 +63,83 @@ def cn(*classes: Any) -> str:
                 if condition:
                     result_classes.append(str(class_name))
         elif isinstance(cls, list | tuple):
-            result_classes.append(cn(*cls))
+            result_classes.append(cn(*cls, merge=False))
         else:
             result_classes.append(str(cls))
 
-    return " ".join(result_classes)
+    joined = " ".join(result_classes)
+    return _merge(joined) if merge else joined
+
+
+def _merge(classes: str) -> str:
+    from starui.render.merge import tw_merge
+
+    return tw_merge(classes)
+
+
+def set_cn_merge(enabled: bool) -> None:
+    """Make ``cn`` merge conflicting Tailwind utilities unless told otherwise."""
+    global _merge_by_default
+    _merge_by_default = enabled
+    settings_changed()  # Cached renders were merged the old way
+
+
+_merge_by_default = False
 
 
 def cva(base: str = "", config: dict[str, Any] | None = None) -> Callable[..., str]:
+    """Class string builder for component variants.
+
+    Each combination of variant values is resolved once and then served from a
+    lookup table, so repeated calls cost a tuple build and a dict lookup.
+    """
     if config is None:
         config = {}
 
     variants = config.get("variants", {})
-    compound_variants = config.get("compoundVariants", [])
     default_variants = config.get("defaultVariants", {})
-
-    def variant_function(**props: Any) -> str:
+    compound_variants = [
+        (compound["class"], [(k, v) for k, v in compound.items() if k != "class"])
+        for compound in config.get("compoundVariants", [])
+        if compound.get("class", "")
+    ]
+
+    # Only these props affect the result, so they alone make up the cache key
+    compound_keys = [k for _, conditions in compound_variants for k, _ in conditions]
+    keys = tuple(dict.fromkeys([*variants, *compound_keys]))
+    defaults = tuple(default_variants.get(key) for key in keys)
+    table: dict[tuple, str] = {}
+
+    def build(props: dict[str, Any]) -> str:
         classes = [base] if base else []
 
-        # Merge defaults with props
-        final_props = {**default_variants, **props}
-
-        # Apply variants
         for variant_key, variant_values in variants.items():
-            prop_value = final_props.get(variant_key)
+            prop_value = props.get(variant_key)
             if prop_value and prop_value in variant_values:
                 classes.append(variant_values[prop_value])
 
-        # Apply compound variants
-        for compound in compound_variants:
-            compound_class = compound.get("class", "")
-            if not compound_class:
-                continue
-
-            matches = True
-            for key, value in compound.items():
-                if key == "class":
-                    continue
-                if final_props.get(key) != value:
-                    matches = False
-                    break
-
-            if matches:
+        for compound_class, conditions in compound_variants:
+            if all(props.get(key) == value for key, value in conditions):
                 classes.append(compound_class)
 
-        return cn(*classes)
+        return cn(*classes, merge=False)
+
+    def variant_function(**props: Any) -> str:
+        if props:
+            key = tuple(
+                [props[k] if k in props else default_variants.get(k) for k in keys]
+            )
+        else:
+            key = defaults
+
+        try:
+            return table[key]
+        except KeyError:
+            result = build({**default_variants, **props})
+            if len(table) < CVA_TABLE_SIZE:
+                table[key] = result
+            return result
+        except TypeError:  # Unhashable prop value
+            return build({**default_variants, **props})
 
     return variant_function
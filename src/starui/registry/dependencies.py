@@ -4,19 +4,19 @@ from fastcore.xml import FT
 from starhtml import Script
 from starhtml.starapp import DATASTAR_VERSION
 
+from ..render.context import require_asset
+
 
 class DependencyManager:
-    def __init__(self):
-        self._injected = set[str]()
+    """Handler scripts, collected once per response inside ``render_context()``.
 
-    def require_handler(self, name: str, config: dict | None = None) -> FT | None:
-        if name in self._injected:
-            return None
+    Outside a render context each call returns its script to render inline.
+    """
 
-        self._injected.add(name)
+    def require_handler(self, name: str, config: dict | None = None) -> FT | None:
         config_json = json.dumps(config) if config else "{}"
 
-        return Script(
+        script = Script(
             f"""
             import handlerPlugin from '/static/js/handlers/{name}.js';
             import {{ load, apply }} from 'https://cdn.jsdelivr.net/gh/starfederation/datastar@{DATASTAR_VERSION}/bundles/datastar.js';
@@ -28,6 +28,7 @@ class DependencyManager:
             type="module",
             id=f"starui-{name}-handler",
         )
+        return require_asset(f"starui-{name}-handler", script, "body")
 
 
 _manager = DependencyManager()
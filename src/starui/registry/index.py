@@ -0,0 +1,70 @@
+"""Prebuilt index of the component registry.
+
+``index.json`` is generated from the component sources and ``COMPONENT_REGISTRY``
+and shipped next to them, so listing and resolving components takes a single
+read instead of parsing every source file. Regenerate it after changing either::
+
+    python -m starui.registry.index
+"""
+
+import hashlib
+import json
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+COMPONENTS_PATH = Path(__file__).parent / "components"
+
+
+def source_hash(source: bytes) -> str:
+    return hashlib.sha256(source).hexdigest()
+
+
+def build_index(registry_path: Path = COMPONENTS_PATH) -> dict[str, dict[str, Any]]:
+    """Index entries for every component source in ``registry_path``."""
+    from .component_metadata import COMPONENT_REGISTRY
+
+    index = {}
+    for path in sorted(registry_path.glob("*.py")):
+        if path.name == "__init__.py":
+            continue
+
+        source = path.read_bytes()
+        metadata = COMPONENT_REGISTRY.get(path.stem, {})
+        index[path.stem] = {
+            "name": path.stem,
+            "description": metadata.get("description", ""),
+            "dependencies": metadata.get("dependencies", []),
+            "packages": metadata.get("packages", []),
+            "handlers": metadata.get("handlers", []),
+            "css_imports": metadata.get("css_imports", []),
+            "hash": source_hash(source),
+            "size": len(source),
+        }
+    return index
+
+
+def write_index(registry_path: Path = COMPONENTS_PATH) -> Path:
+    path = registry_path / INDEX_FILE
+    data = {"version": INDEX_VERSION, "components": build_index(registry_path)}
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+@cache
+def load_index(registry_path: Path = COMPONENTS_PATH) -> dict[str, dict[str, Any]]:
+    """The shipped index, or one built from the sources if there is none."""
+    try:
+        data = json.loads((registry_path / INDEX_FILE).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return build_index(registry_path)
+
+    if data.get("version") != INDEX_VERSION:
+        return build_index(registry_path)
+    return data["components"]
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_index()}")
@@ -1,14 +1,30 @@
 """Component loading and dependency resolution."""
 
-from .client import RegistryClient
-from .component_metadata import get_component_metadata
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from .client import RegistryClient, get_registry_client
+
+
+@dataclass
+class InstallPlan:
+    """Components to install, dependencies before the components using them."""
+
+    requested: list[str]
+    order: list[str] = field(default_factory=list)
+    required_by: dict[str, list[str]] = field(default_factory=dict)
+
+    def reason(self, name: str) -> str:
+        if name in self.requested:
+            return "requested"
+        return f"required by {', '.join(self.required_by.get(name, []))}"
 
 
 class ComponentLoader:
     """Loads components with dependency resolution."""
 
     def __init__(self, client: RegistryClient | None = None) -> None:
-        self.client = client or RegistryClient()
+        self.client = client or get_registry_client()
         self.resolver = DependencyResolver(self.client)
 
     def load_component(self, component_name: str) -> str:
@@ -17,15 +33,18 @@ class ComponentLoader:
         return self.client.get_component_source(component_name)
 
     def load_component_with_dependencies(self, component_name: str) -> dict[str, str]:
-        resolved = self.resolver.resolve_dependencies(component_name)
+        return self.load_plan(self.plan([component_name]))
 
-        sources = {}
-        for name in resolved:
+    def plan(self, component_names: Iterable[str]) -> InstallPlan:
+        return self.resolver.plan(component_names)
+
+    def load_plan(self, plan: InstallPlan) -> dict[str, str]:
+        """Read each planned component's source once, in install order."""
+        for name in plan.order:
             if not self.client.component_exists(name):
                 raise FileNotFoundError(f"Dependency '{name}' not found")
-            sources[name] = self.client.get_component_source(name)
 
-        return sources
+        return self.client.get_component_sources(plan.order)
 
 
 class DependencyResolver:
@@ -33,10 +52,21 @@ class DependencyResolver:
 
     def __init__(self, client: RegistryClient) -> None:
         self.client = client
+        self.graph: dict[str, list[str]] = {}
+
+    def dependencies(self, component_name: str) -> list[str]:
+        if component_name not in self.graph:
+            metadata = self.client.get_component_metadata(component_name)
+            self.graph[component_name] = list(metadata["dependencies"])
+        return self.graph[component_name]
 
     def resolve_dependencies(self, component_name: str) -> list[str]:
         """Resolve dependencies in topological order."""
-        resolved = []
+        return self.plan([component_name]).order
+
+    def plan(self, component_names: Iterable[str]) -> InstallPlan:
+        """One topological order covering all requested components."""
+        plan = InstallPlan(requested=list(dict.fromkeys(component_names)))
         visiting = set()
         visited = set()
 
@@ -46,18 +76,14 @@ class DependencyResolver:
             if name in visited:
                 return
 
-            metadata = get_component_metadata(name)
-            if not metadata:
-                raise FileNotFoundError(f"Component '{name}' not found")
-
             visiting.add(name)
-            for dep in metadata.dependencies:
+            for dep in self.dependencies(name):
+                plan.required_by.setdefault(dep, []).append(name)
                 visit(dep)
             visiting.remove(name)
             visited.add(name)
+            plan.order.append(name)
 
-            if name not in resolved:
-                resolved.append(name)
-
-        visit(component_name)
-        return resolved
+        for name in plan.requested:
+            visit(name)
+        return plan
@@ -1,7 +1,101 @@
+"""Discovery of components vendored into ``components/ui``.
+
+Exported names are found by parsing each file rather than importing it, and
+cached against the file's mtime so repeated discovery only re-parses changed
+files. Components are returned as lazy proxies that import their module the
+first time they are called. ``invalidate`` makes proxies pick up edited files;
+the dev reloader calls it with every file that changed.
+"""
+
+import ast
 import importlib.util
+import threading
+from collections.abc import Iterable
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
+# Assigned values that can't be components
+_DATA = (ast.Constant, ast.Dict, ast.List, ast.Tuple, ast.Set, ast.JoinedStr)
+
+_lock = threading.Lock()
+_names: dict[Path, tuple[int, tuple[str, ...]]] = {}
+_modules: dict[Path, tuple[int, ModuleType]] = {}
+_generation = 0
+
+
+def exported_names(source: str) -> list[str]:
+    """Capitalized functions, classes and aliases defined at the top level."""
+    names = []
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
+            names.append(node.name)
+        elif isinstance(node, ast.Assign) and not isinstance(node.value, _DATA):
+            names.extend(t.id for t in node.targets if isinstance(t, ast.Name))
+    return [name for name in dict.fromkeys(names) if name[0].isupper()]
+
+
+def _mtime(path: Path) -> int:
+    return path.stat().st_mtime_ns
+
+
+def _file_names(path: Path) -> tuple[str, ...]:
+    mtime = _mtime(path)
+    with _lock:
+        if (cached := _names.get(path)) and cached[0] == mtime:
+            return cached[1]
+
+    names = tuple(exported_names(path.read_text(encoding="utf-8")))
+    with _lock:
+        _names[path] = (mtime, names)
+    return names
+
+
+def load_module(path: Path) -> ModuleType:
+    """Import a component file, reusing the module until the file changes."""
+    mtime = _mtime(path)
+    with _lock:
+        if (cached := _modules.get(path)) and cached[0] == mtime:
+            return cached[1]
+
+    if not (spec := importlib.util.spec_from_file_location(path.stem, path)):
+        raise ImportError(f"Cannot load component module {path}")
+    if not spec.loader:
+        raise ImportError(f"Cannot load component module {path}")
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    with _lock:
+        _modules[path] = (mtime, module)
+    return module
+
+
+class LazyComponent:
+    """Stands in for a component until it is first called."""
+
+    __slots__ = ("name", "file", "_target", "_generation")
+
+    def __init__(self, name: str, file: Path) -> None:
+        self.name = name
+        self.file = file
+        self._target: Any = None
+        self._generation = -1
+
+    def resolve(self) -> Any:
+        if self._generation != _generation:
+            self._target = getattr(load_module(self.file), self.name)
+            self._generation = _generation
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        return f"<LazyComponent {self.name} from {self.file.name}>"
+
 
 def discover_components(base_path: Path | None = None) -> dict[str, Any]:
     components_path = (base_path or Path.cwd()) / "components" / "ui"
@@ -10,28 +104,34 @@ def discover_components(base_path: Path | None = None) -> dict[str, Any]:
         return {}
 
     components = {}
-    for py_file in components_path.glob("*.py"):
+    for py_file in sorted(components_path.glob("*.py")):
         if py_file.name.startswith("_"):
             continue
 
-        if not (spec := importlib.util.spec_from_file_location(py_file.stem, py_file)):
-            continue
+        path = py_file.resolve()
+        for name in _file_names(path):
+            components[name] = LazyComponent(name, path)
 
-        if not spec.loader:
-            continue
+    return components
 
-        try:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            components.update(
-                {
-                    name: attr
-                    for name in dir(module)
-                    if name[0].isupper() and callable(attr := getattr(module, name))
-                }
-            )
-        except Exception:
-            continue
 
-    return components
+def discovered_files() -> set[Path]:
+    with _lock:
+        return set(_names)
+
+
+def invalidate(paths: Iterable[Path] | None = None) -> None:
+    """Forget cached names and modules for ``paths``, or for every file.
+
+    Proxies re-resolve on their next call, importing files that changed again.
+    """
+    global _generation
+    with _lock:
+        if paths is None:
+            _names.clear()
+            _modules.clear()
+        else:
+            for path in paths:
+                _names.pop(Path(path).resolve(), None)
+                _modules.pop(Path(path).resolve(), None)
+        _generation += 1
@@ -0,0 +1,165 @@
+"""Lockfile of vendored components.
+
+``starui.lock`` records, for each component copied into a project, the
+registry hash of its source, the hash of the file that was written and, for
+tree-shaken components, the names the file was shaken to. Comparing them with
+the registry index and the files on disk tells which components have upstream
+changes and which were edited locally, without reading any source that hasn't
+changed.
+"""
+
+import difflib
+import json
+import os
+import re
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .index import source_hash
+from .loader import ComponentLoader
+from .shaker import Usage, shake
+
+LOCK_FILE = "starui.lock"
+LOCK_VERSION = 1
+
+
+def vendored_source(source: str) -> str:
+    """Component source as written into a project, importing utils from starui."""
+    return re.sub(r"from\s+\.utils\s+import", "from starui import", source)
+
+
+def text_hash(text: str) -> str:
+    return source_hash(text.encode("utf-8"))
+
+
+def write_atomic(files: dict[Path, str]) -> None:
+    """Write all ``files`` or none: each is staged next to its target first."""
+    staged: list[tuple[str, Path]] = []
+    try:
+        for path, content in files.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+            staged.append((tmp, path))
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+    except BaseException:
+        for tmp, _ in staged:
+            Path(tmp).unlink(missing_ok=True)
+        raise
+
+    for tmp, path in staged:
+        os.replace(tmp, path)
+
+
+@dataclass
+class Lockfile:
+    path: Path
+    components: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, project_root: Path) -> "Lockfile":
+        path = project_root / LOCK_FILE
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(path)
+        return cls(path, data.get("components", {}))
+
+    def record(
+        self,
+        name: str,
+        registry_hash: str,
+        content: str,
+        names: list[str] | None = None,
+    ) -> None:
+        entry: dict[str, Any] = {"hash": registry_hash, "installed": text_hash(content)}
+        if names is not None:
+            entry["names"] = names
+        self.components[name] = entry
+
+    def dumps(self) -> str:
+        data = {"version": LOCK_VERSION, "components": self.components}
+        return json.dumps(data, indent=2, sort_keys=True) + "\n"
+
+    def save(self) -> None:
+        write_atomic({self.path: self.dumps()})
+
+
+@dataclass
+class ComponentUpdate:
+    """What ``star update`` would do with one component."""
+
+    name: str
+    path: Path
+    status: str  # unchanged, update, modified or missing
+    registry_hash: str
+    content: str | None = None
+    local: str | None = None
+    names: list[str] | None = None  # Set when the component is tree-shaken
+
+    def diff(self) -> str:
+        return "".join(
+            difflib.unified_diff(
+                (self.local or "").splitlines(keepends=True),
+                (self.content or "").splitlines(keepends=True),
+                f"{self.path.name} (local)",
+                f"{self.path.name} (registry)",
+            )
+        )
+
+
+def plan_updates(
+    loader: ComponentLoader,
+    lock: Lockfile,
+    component_dir: Path,
+    names: Iterable[str] | None = None,
+    usage: Usage | None = None,
+) -> list[ComponentUpdate]:
+    """Compare the registry, the lockfile and the vendored files.
+
+    Without ``names``, every locked or vendored registry component is checked.
+    Dependencies of the checked components that are missing are included.
+    Tree-shaken components are shaken again to their locked names plus any
+    new ones the project uses according to ``usage``.
+    """
+    index = loader.client.index
+    if names is None:
+        vendored = {path.stem for path in component_dir.glob("*.py")}
+        names = sorted((set(lock.components) | vendored) & set(index))
+
+    updates = []
+    for name in loader.plan(names).order:
+        path = component_dir / f"{name}.py"
+        registry_hash = index[name]["hash"]
+        locked = lock.components.get(name)
+        update = ComponentUpdate(name, path, "unchanged", registry_hash)
+        updates.append(update)
+
+        grown = False
+        if locked and "names" in locked:
+            used = (usage or {}).get(name, set())
+            if used is not None:
+                update.names = sorted(set(locked["names"]) | used)
+            grown = update.names != sorted(locked["names"])
+
+        if locked and locked["hash"] == registry_hash and path.exists() and not grown:
+            continue  # No upstream change: local edits, if any, are kept
+
+        update.content = vendored_source(loader.load_component(name))
+        if update.names is not None:
+            update.content = shake(update.content, update.names)
+        if not path.exists():
+            update.status = "missing"
+            continue
+
+        update.local = path.read_text(encoding="utf-8")
+        if update.local == update.content:
+            continue  # Already current, only the lock entry is missing or stale
+        if locked and text_hash(update.local) == locked["installed"]:
+            update.status = "update"
+        else:
+            update.status = "modified"
+    return updates
@@ -0,0 +1,182 @@
+"""Registry client for a component registry served over HTTP.
+
+The registry is a directory of component sources next to an ``index.json`` in
+the format of the bundled one, so ``python -m http.server`` in a components
+directory is a working registry. Responses are kept in an on-disk cache:
+
+- The index is revalidated with ``If-None-Match`` once per client.
+- A cached source whose hash matches the index is used without a request.
+- With ``offline=True``, or when the registry can't be reached, everything is
+  served from the cache.
+
+Sources for a dependency set are fetched concurrently over one pooled session.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .client import RegistryClient
+from .index import INDEX_FILE, INDEX_VERSION, source_hash
+
+# Names become cache and project file names, so they must be plain module names
+COMPONENT_NAME = re.compile(r"[a-z_][a-z0-9_]*")
+
+
+class RemoteRegistryError(Exception):
+    """Remote registry could not provide a resource."""
+
+    pass
+
+
+def get_registry_cache_dir(url: str) -> Path:
+    key = hashlib.sha256(url.encode()).hexdigest()[:16]
+    return Path.home() / ".starui" / "registry" / key
+
+
+class RemoteRegistryClient(RegistryClient):
+    """Client for components served by a remote registry."""
+
+    def __init__(
+        self,
+        url: str,
+        cache_dir: Path | None = None,
+        offline: bool = False,
+        max_workers: int = 8,
+        timeout: float = 10,
+    ) -> None:
+        self.url = url.rstrip("/")
+        self.registry_path = cache_dir or get_registry_cache_dir(self.url)
+        self.offline = offline
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._index: dict[str, dict[str, Any]] | None = None
+        self._sources: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def index(self) -> dict[str, dict[str, Any]]:
+        if self._index is None:
+            data = json.loads(self._fetch(INDEX_FILE))
+            if data.get("version") != INDEX_VERSION:
+                raise RemoteRegistryError(
+                    f"Unsupported registry index version: {data.get('version')}"
+                )
+            components = data["components"]
+            if invalid := [n for n in components if not COMPONENT_NAME.fullmatch(n)]:
+                raise RemoteRegistryError(
+                    f"Invalid component name in registry index: {invalid[0]!r}"
+                )
+            self._index = components
+        return self._index
+
+    def list_components(self) -> list[str]:
+        return sorted(name for name in self.index if name != "utils")
+
+    def get_component_source(self, component_name: str) -> str:
+        if not self.component_exists(component_name):
+            raise FileNotFoundError(f"Component '{component_name}' not found")
+
+        if component_name not in self._sources:
+            expected = self.index[component_name]["hash"]
+            resource = f"{component_name}.py"
+            cached = self._cached(resource)
+            if cached is None or source_hash(cached) != expected:
+                cached = self._fetch(resource)
+                if source_hash(cached) != expected:
+                    raise RemoteRegistryError(
+                        f"{resource} does not match the registry index"
+                    )
+            self._sources[component_name] = cached.decode("utf-8")
+        return self._sources[component_name]
+
+    def get_component_sources(self, component_names: Iterable[str]) -> dict[str, str]:
+        """Fetch several components concurrently, in the order given."""
+        names = list(component_names)
+        # Checked up front so the index is fetched once, before the workers start
+        if missing := [name for name in names if not self.component_exists(name)]:
+            raise FileNotFoundError(f"Component '{missing[0]}' not found")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            sources = pool.map(self.get_component_source, names)
+            return dict(zip(names, sources, strict=True))
+
+    def close(self) -> None:
+        self.session.close()
+
+    # Cache
+
+    @property
+    def _etags_path(self) -> Path:
+        return self.registry_path / "etags.json"
+
+    def _etags(self) -> dict[str, str]:
+        try:
+            return json.loads(self._etags_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _cached(self, resource: str) -> bytes | None:
+        try:
+            return (self.registry_path / resource).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _store(self, resource: str, content: bytes, etag: str | None) -> None:
+        with self._lock:
+            self.registry_path.mkdir(parents=True, exist_ok=True)
+            _write_atomic(self.registry_path / resource, content)
+            etags = self._etags()
+            if etag:
+                etags[resource] = etag
+            else:
+                etags.pop(resource, None)
+            _write_atomic(self._etags_path, json.dumps(etags, indent=2).encode())
+
+    def _fetch(self, resource: str) -> bytes:
+        cached = self._cached(resource)
+        if self.offline:
+            if cached is None:
+                raise RemoteRegistryError(f"{resource} is not cached (offline)")
+            return cached
+
+        headers = {}
+        if cached is not None and (etag := self._etags().get(resource)):
+            headers["If-None-Match"] = etag
+
+        try:
+            response = self.session.get(
+                f"{self.url}/{resource}", headers=headers, timeout=self.timeout
+            )
+            if response.status_code == 304 and cached is not None:
+                return cached
+            response.raise_for_status()
+        except requests.RequestException as e:
+            if cached is not None:
+                return cached  # Unreachable registry: work from the cache
+            raise RemoteRegistryError(f"Failed to fetch {resource}: {e}") from e
+
+        self._store(resource, response.content, response.headers.get("ETag"))
+        return response.content
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+    os.replace(tmp, path)
@@ -0,0 +1,233 @@
+"""Tree shaking of vendored component modules.
+
+A project's Python files are scanned for the names it imports from each
+component module. Only the top-level definitions reachable from those names,
+including ``cva`` tables and helpers, are kept, and imports nothing uses any
+more are dropped. Component modules that import each other are shaken in
+reverse install order, so a dependency keeps what its dependents still use.
+"""
+
+import ast
+from collections.abc import Iterable
+from pathlib import Path
+
+IGNORED_DIRS = {"__pycache__", ".git", ".venv", "venv", "node_modules", "build"}
+
+# None means the whole module is used, e.g. through a star import
+Usage = dict[str, set[str] | None]
+
+
+def _merge(usage: Usage, module: str, names: set[str] | None) -> None:
+    if module in usage and usage[module] is None:
+        return
+    if names is None:
+        usage[module] = None
+    else:
+        usage.setdefault(module, set()).update(names)  # type: ignore[union-attr]
+
+
+def module_usage(tree: ast.Module, modules: set[str]) -> Usage:
+    """Names one file uses from the component ``modules``."""
+    usage: Usage = {}
+    aliases: dict[str, str] = {}  # Local name bound to a component module
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            base = (node.module or "").rpartition(".")[2]
+            for alias in node.names:
+                if base in modules:
+                    names = None if alias.name == "*" else {alias.name}
+                    _merge(usage, base, names)
+                elif alias.name in modules:
+                    aliases[alias.asname or alias.name] = alias.name
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname and alias.name.rpartition(".")[2] in modules:
+                    aliases[alias.asname] = alias.name.rpartition(".")[2]
+
+    if not aliases:
+        return usage
+
+    attributes: set[int] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            if module := aliases.get(node.value.id):
+                _merge(usage, module, {node.attr})
+                attributes.add(id(node.value))
+    for node in ast.walk(tree):
+        # The module object itself escapes, so anything in it may be used
+        if isinstance(node, ast.Name) and node.id in aliases:
+            if id(node) not in attributes and isinstance(node.ctx, ast.Load):
+                _merge(usage, aliases[node.id], None)
+    return usage
+
+
+def project_usage(root: Path, modules: set[str], exclude: Path | None = None) -> Usage:
+    """Names the project's Python files use from the component ``modules``."""
+    usage: Usage = {}
+    for path in root.rglob("*.py"):
+        relative = path.relative_to(root)
+        if IGNORED_DIRS.intersection(relative.parts[:-1]):
+            continue
+        if exclude and path.is_relative_to(exclude):
+            continue
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+        except (OSError, SyntaxError, UnicodeDecodeError):
+            continue
+        for module, names in module_usage(tree, modules).items():
+            _merge(usage, module, names)
+    return usage
+
+
+def _bound_names(node: ast.stmt) -> set[str]:
+    if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
+        return {node.name}
+    if isinstance(node, ast.Assign):
+        return {t.id for t in node.targets if isinstance(t, ast.Name)}
+    if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+        return {node.target.id}
+    if isinstance(node, ast.Import | ast.ImportFrom):
+        return {
+            (alias.asname or alias.name).partition(".")[0]
+            for alias in node.names
+            if alias.name != "*"
+        }
+    return set()
+
+
+def _references(node: ast.AST) -> set[str]:
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def _is_docstring(node: ast.stmt) -> bool:
+    return isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)
+
+
+def _is_all(node: ast.stmt) -> bool:
+    return "__all__" in _bound_names(node)
+
+
+def reachable(tree: ast.Module, roots: Iterable[str]) -> set[str]:
+    """Top-level names needed by ``roots`` and by statements that always run."""
+    definitions: dict[str, list[ast.stmt]] = {}
+    pending = set(roots)
+    for node in tree.body:
+        if bound := _bound_names(node):
+            for name in bound:
+                definitions.setdefault(name, []).append(node)
+        elif not _is_docstring(node):
+            pending |= _references(node)
+
+    needed: set[str] = set()
+    while pending:
+        name = pending.pop()
+        if name in needed or name not in definitions:
+            continue
+        needed.add(name)
+        for node in definitions[name]:
+            if not isinstance(node, ast.Import | ast.ImportFrom):
+                pending |= _references(node)
+    return needed
+
+
+def _statement(node: ast.stmt, needed: set[str], source: str) -> str | None:
+    """Source for ``node`` with unused names removed, or None to drop it."""
+    segment = ast.get_source_segment(source, node) or ""
+    if isinstance(node, ast.ImportFrom) and node.module == "__future__":
+        return segment
+    if isinstance(node, ast.Import | ast.ImportFrom):
+        kept = [
+            alias
+            for alias in node.names
+            if alias.name == "*"
+            or (alias.asname or alias.name).partition(".")[0] in needed
+        ]
+        if len(kept) == len(node.names):
+            return segment
+        if not kept:
+            return None
+        node = type(node)(**{**node.__dict__, "names": kept})
+        return ast.unparse(node)
+    if _is_all(node) and isinstance(node, ast.Assign):
+        if isinstance(node.value, ast.List | ast.Tuple):
+            names = [
+                e.value
+                for e in node.value.elts
+                if isinstance(e, ast.Constant) and e.value in needed
+            ]
+            return f"__all__ = {names!r}".replace("'", '"')
+    bound = _bound_names(node)
+    if bound and not bound & needed:
+        return None
+    return segment
+
+
+def shake(source: str, roots: Iterable[str]) -> str:
+    """``source`` reduced to what ``roots`` need, keeping the original text."""
+    roots = sorted(roots)
+    tree = ast.parse(source)
+    needed = reachable(tree, roots)
+    lines = source.splitlines(keepends=True)
+
+    parts = [f"# Tree-shaken by `star add --shake` for: {', '.join(roots)}\n"]
+    previous_end = 0
+    for node in tree.body:
+        start = min(
+            [node.lineno, *(d.lineno for d in getattr(node, "decorator_list", []))]
+        )
+        # Blank lines and comments above a statement travel with it
+        leading = "".join(lines[previous_end : start - 1])
+        previous_end = node.end_lineno or node.lineno
+
+        text = _statement(node, needed, source)
+        if text is None:
+            continue
+        if text == ast.get_source_segment(source, node):
+            text = "".join(lines[start - 1 : previous_end]).rstrip("\n")
+        parts.append(f"{leading}{text}\n" if len(parts) > 1 else f"{text}\n")
+    return "".join(parts)
+
+
+def _sibling_usage(source: str, modules: set[str]) -> Usage:
+    """Names a component module imports from other component modules."""
+    usage: Usage = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ImportFrom) and node.level and node.module in modules:
+            names = {alias.name for alias in node.names}
+            _merge(usage, node.module, None if "*" in names else names)
+    return usage
+
+
+def shake_components(
+    sources: dict[str, str], usage: Usage, keep: Iterable[str] = ("utils",)
+) -> dict[str, tuple[str, list[str] | None]]:
+    """Shake vendored sources given in install order.
+
+    Returns each component's new source and the names it was shaken to, or
+    ``None`` when it is kept whole. Components nothing uses are left out.
+    """
+    usage = {
+        name: None if names is None else set(names) for name, names in usage.items()
+    }
+    for name in keep:
+        usage[name] = None
+
+    shaken: dict[str, tuple[str, list[str] | None]] = {}
+    modules = set(sources)
+    for name in reversed(list(sources)):
+        source = sources[name]
+        if name not in usage:
+            continue
+
+        roots = usage[name]
+        if roots is None:
+            shaken[name] = (source, None)
+        else:
+            source = shake(source, roots)
+            shaken[name] = (source, sorted(roots))
+
+        for module, names in _sibling_usage(source, modules).items():
+            _merge(usage, module, names)
+
+    return {name: shaken[name] for name in sources if name in shaken}
@@ -0,0 +1,74 @@
+"""Rendering machinery shared by StarUI components.
+
+Components import what they use from the submodules, so vendored copies stay
+small and using one feature doesn't import the others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cache import (
+        RenderCacheInfo,
+        memoized,
+        render_cache_clear,
+        render_cache_info,
+        set_render_cache,
+    )
+    from .context import (
+        RenderContext,
+        current_render_context,
+        render_context,
+        require_asset,
+        with_render_context,
+    )
+    from .html import sort_attributes
+    from .ids import counter_ids, id_scope, new_id, random_id
+    from .merge import tw_merge
+    from .stream import HtmlStream, stream, streaming
+    from .template import template
+
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "cache": (
+        "RenderCacheInfo",
+        "memoized",
+        "render_cache_clear",
+        "render_cache_info",
+        "set_render_cache",
+    ),
+    "context": (
+        "RenderContext",
+        "current_render_context",
+        "render_context",
+        "require_asset",
+        "with_render_context",
+    ),
+    "html": ("sort_attributes",),
+    "ids": ("counter_ids", "id_scope", "new_id", "random_id"),
+    "merge": ("tw_merge",),
+    "stream": ("HtmlStream", "stream", "streaming"),
+    "template": ("template",),
+}
+
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = [
+    "memoized", "set_render_cache", "render_cache_info", "render_cache_clear",
+    "RenderCacheInfo", "template", "stream", "streaming", "HtmlStream",
+    "id_scope", "counter_ids", "new_id", "random_id", "sort_attributes",
+    "render_context", "with_render_context", "require_asset", "RenderContext",
+    "current_render_context", "tw_merge",
+]  # fmt: skip
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{_MODULES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
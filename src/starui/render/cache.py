@@ -0,0 +1,104 @@
+"""Memoized rendering of pure components.
+
+Components that are pure functions of their arguments can be decorated with
+``memoized``. Once ``set_render_cache(True)`` is called, calls whose arguments
+are hashable are served from a shared LRU cache. A render that generated an
+ID, used an icon sprite sheet or required an asset depends on more than its
+arguments and is never stored.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import wraps
+from threading import Lock
+from typing import Any, NamedTuple
+
+from rusty_tags import HtmlString
+
+from . import tracking
+
+# Rendered calls of memoized components remembered while the cache is on
+RENDER_CACHE_SIZE = 2048
+
+
+class RenderCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    bypasses: int
+    maxsize: int
+    currsize: int
+
+
+_render_cache: OrderedDict[tuple, HtmlString] = OrderedDict()
+_render_lock = Lock()
+_render_stats = {"hits": 0, "misses": 0, "bypasses": 0}
+_cache_renders = False
+
+
+def _cache_key(values: Any) -> tuple:
+    # Rendered children compare by identity, so key them by their markup
+    return tuple(
+        [(HtmlString, str(v)) if v.__class__ is HtmlString else v for v in values]
+    )
+
+
+def memoized(component: Callable[..., HtmlString]) -> Callable[..., HtmlString]:
+    """Serve repeated calls of a pure component from the render cache."""
+
+    @wraps(component)
+    def wrapper(*args: Any, **kwargs: Any) -> HtmlString:
+        if not _cache_renders:
+            return component(*args, **kwargs)
+
+        key = (
+            component,
+            tracking.generation,
+            _cache_key(args),
+            tuple(kwargs),
+            _cache_key(kwargs.values()),
+        )
+        try:
+            hash(key)
+        except TypeError:  # Unhashable argument
+            _render_stats["bypasses"] += 1
+            return component(*args, **kwargs)
+        # Under the lock, so an eviction can't remove the entry in between
+        with _render_lock:
+            if (result := _render_cache.get(key)) is not None:
+                _render_cache.move_to_end(key)
+                _render_stats["hits"] += 1
+                return result
+
+        result, usage = tracking.tracked(component, *args, **kwargs)
+        if usage.volatile:
+            _render_stats["bypasses"] += 1
+            return result
+        with _render_lock:
+            _render_stats["misses"] += 1
+            _render_cache[key] = result
+            if len(_render_cache) > RENDER_CACHE_SIZE:
+                _render_cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+def set_render_cache(enabled: bool) -> None:
+    """Turn the render cache for ``memoized`` components on or off."""
+    global _cache_renders
+    _cache_renders = enabled
+    if not enabled:
+        render_cache_clear()
+
+
+def render_cache_info() -> RenderCacheInfo:
+    """Hits, misses and bypasses (uncacheable calls) of the render cache."""
+    return RenderCacheInfo(
+        **_render_stats, maxsize=RENDER_CACHE_SIZE, currsize=len(_render_cache)
+    )
+
+
+def render_cache_clear() -> None:
+    with _render_lock:
+        _render_cache.clear()
+        _render_stats.update(hits=0, misses=0, bypasses=0)
@@ -0,0 +1,149 @@
+"""Per-response collection of scripts and styles.
+
+Inside ``render_context()`` components register the scripts and styles they
+need with ``require_asset`` instead of emitting them where they sit. Each is
+kept once per response, and ``hoist`` moves them into ``<head>`` or to the end
+of ``<body>``. The context lives in a ContextVar, so concurrent requests each
+collect their own.
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Literal
+
+from rusty_tags import HtmlString
+
+from . import tracking
+from .html import sort_attributes
+from .ids import id_scope
+from .stream import HtmlStream
+
+AssetPosition = Literal["head", "body"]
+
+
+def _markup(element: Any) -> str:
+    # fastcore FT renders through __html__, its str() is only the id
+    html = getattr(element, "__html__", None)
+    return html() if html is not None else str(element)
+
+
+class RenderContext:
+    """Assets, and the icon sprite sheet if any, of one response."""
+
+    def __init__(self, sheet: Any = None) -> None:
+        self.sheet = sheet
+        self.assets: dict[AssetPosition, dict[str, Any]] = {"head": {}, "body": {}}
+
+    def require(self, key: str, element: Any, position: AssetPosition) -> bool:
+        """Collect ``element`` unless ``key`` was required before."""
+        assets = self.assets[position]
+        if key in assets:
+            return False
+        assets[key] = element
+        return True
+
+    def render(self, position: AssetPosition) -> str:
+        markup = "".join(map(_markup, self.assets[position].values()))
+        if position == "body" and self.sheet is not None:
+            markup += str(self.sheet.render())
+        return markup
+
+    def hoist(self, page: Any) -> HtmlString:
+        """``page`` with the collected assets before ``</head>`` and ``</body>``.
+
+        Attributes are sorted, so the same page renders to the same bytes.
+        """
+        html = _markup(page)
+        if head := self.render("head"):
+            at = html.find("</head>")
+            html = f"{html[:at]}{head}{html[at:]}" if at >= 0 else head + html
+        if body := self.render("body"):
+            at = html.rfind("</body>")
+            html = f"{html[:at]}{body}{html[at:]}" if at >= 0 else html + body
+        return HtmlString(sort_attributes(html))
+
+
+_render_context: ContextVar[RenderContext | None] = ContextVar(
+    "render_context", default=None
+)
+
+
+def current_render_context() -> RenderContext | None:
+    return _render_context.get()
+
+
+def require_asset(
+    key: str, element: Any, position: AssetPosition = "head"
+) -> Any | None:
+    """Require a script or style once per response, identified by ``key``.
+
+    Inside a render context the element is collected for ``hoist`` and None is
+    returned; outside one the element is returned to be rendered inline.
+    """
+    context = _render_context.get()
+    if context is None:
+        return element
+    tracking.mark_volatile(contextual=True)
+    context.require(key, element, position)
+    return None
+
+
+@contextmanager
+def render_context(ids: bool = True, sprite: bool = False) -> Iterator[RenderContext]:
+    """Collect the assets of the renders in the block.
+
+    ``ids`` numbers generated IDs per response (see ``id_scope``), and
+    ``sprite`` renders icons against a sprite sheet hoisted with the assets.
+    """
+    with ExitStack() as stack:
+        if ids:
+            stack.enter_context(id_scope())
+        sheet = None
+        if sprite:
+            from starui.icons.sprite import icon_sprite
+
+            sheet = stack.enter_context(icon_sprite())
+        context = RenderContext(sheet)
+        token = _render_context.set(context)
+        try:
+            yield context
+        finally:
+            _render_context.reset(token)
+
+
+def with_render_context(
+    route: Callable[..., Any] | None = None, *, ids: bool = True, sprite: bool = False
+) -> Any:
+    """Decorate a route to render in a context and hoist its assets.
+
+    Streamed pages aren't supported: their children render after the route
+    returns, outside the context.
+    """
+
+    def hoist(context: RenderContext, page: Any) -> HtmlString:
+        if page.__class__ is HtmlStream:
+            raise TypeError("with_render_context can't hoist into an HtmlStream")
+        return context.hoist(page)
+
+    def decorate(route: Callable[..., Any]) -> Callable[..., Any]:
+        from inspect import iscoroutinefunction
+
+        if iscoroutinefunction(route):
+
+            @wraps(route)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> HtmlString:
+                with render_context(ids, sprite) as context:
+                    return hoist(context, await route(*args, **kwargs))
+
+            return async_wrapper
+
+        @wraps(route)
+        def wrapper(*args: Any, **kwargs: Any) -> HtmlString:
+            with render_context(ids, sprite) as context:
+                return hoist(context, route(*args, **kwargs))
+
+        return wrapper
+
+    return decorate(route) if route is not None else decorate
@@ -0,0 +1,37 @@
+"""Deterministic attribute order for rendered markup.
+
+rusty_tags writes an element's attributes in hash order, which changes from
+render to render. ``sort_attributes`` rewrites start tags with their attributes
+sorted, so the same tree always renders to the same bytes. Text, comments and
+the contents of ``<script>`` and ``<style>`` are left untouched, as are tags it
+can't parse, such as ones with unescaped quotes in a value.
+"""
+
+import re
+
+_ATTR = r"""[^\s"'<>/=]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'=<>`]+))?"""
+_TOKEN = re.compile(
+    r"<!--.*?-->"
+    # Raw text elements, whose contents may look like tags
+    rf"|<(script|style)((?:\s+{_ATTR})*)(\s*>.*?)(?=</\1|$)"
+    # Other start tags with more than one attribute
+    rf"|<([a-zA-Z][^\s/>]*)(\s+{_ATTR}(?:\s+{_ATTR})+)(\s*/?>)",
+    re.DOTALL | re.IGNORECASE,
+)
+_ATTRS = re.compile(_ATTR)
+
+
+def _sorted_tag(match: re.Match[str]) -> str:
+    if tag := match.group(4):
+        attrs, rest = match.group(5), match.group(6)
+    elif (tag := match.group(1)) and match.group(2):
+        attrs, rest = match.group(2), match.group(3)
+    else:
+        return match.group()
+    # Whole attribute text: ties on the name still sort deterministically
+    return f"<{tag} {' '.join(sorted(_ATTRS.findall(attrs)))}{rest}"
+
+
+def sort_attributes(html: str) -> str:
+    """``html`` with the attributes of every start tag in sorted order."""
+    return _TOKEN.sub(_sorted_tag, html)
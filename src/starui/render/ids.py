@@ -0,0 +1,57 @@
+"""Element IDs and signal names.
+
+Components that need an ID or signal the caller didn't pass ask ``new_id``
+for a token. Outside ``id_scope`` that is random, as it always was; inside it
+comes from the scope's generator, a counter by default. With attributes
+sorted by ``sort_attributes`` the same page then renders to the same bytes on
+every request and can be cached or diffed.
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from uuid import uuid4
+
+from .tracking import mark_volatile
+
+IdGenerator = Callable[[], str]
+
+
+def random_id() -> str:
+    return uuid4().hex[:8]
+
+
+def counter_ids(namespace: str = "") -> IdGenerator:
+    """Generator of ``1``, ``2``, ... tokens, prefixed with ``namespace``.
+
+    Give fragments rendered on their own a distinct namespace, so their IDs
+    can't collide with the page they are swapped into.
+    """
+    count = 0
+
+    def next_id() -> str:
+        nonlocal count
+        count += 1
+        return f"{namespace}{count}"
+
+    return next_id
+
+
+_id_generator: ContextVar[IdGenerator] = ContextVar("id_generator", default=random_id)
+
+
+def new_id() -> str:
+    """Token for a generated element ID or signal name."""
+    mark_volatile()
+    return _id_generator.get()()
+
+
+@contextmanager
+def id_scope(generator: IdGenerator | None = None) -> Iterator[IdGenerator]:
+    """Generate IDs with ``generator`` (default: a fresh counter) in the block."""
+    generator = generator or counter_ids()
+    token = _id_generator.set(generator)
+    try:
+        yield generator
+    finally:
+        _id_generator.reset(token)
@@ -0,0 +1,256 @@
+"""Tailwind conflict resolution for ``cn(..., merge=True)``.
+
+A class is split into its variant prefix (``md:hover:``) and utility, and the
+utility is mapped to the CSS property group it sets through the tables below.
+Later classes win over earlier ones with the same variants and group, or with
+a group they override (``p-4`` overrides ``px-2``). Classes that aren't
+recognised Tailwind utilities are always kept.
+"""
+
+import re
+from collections.abc import Callable
+from functools import lru_cache
+
+# Distinct classes whose conflict group is remembered
+MERGE_CACHE_SIZE = 4096
+
+_SIZES = frozenset(
+    ["xs", "sm", "base", "md", "lg", "xl", *(f"{n}xl" for n in range(2, 10))]
+)
+_SPACING_WORDS = frozenset(
+    ["auto", "full", "screen", "min", "max", "fit", "px", "none", "prose"]
+    + ["svh", "lvh", "dvh", "svw", "lvw", "dvw", "3xs", "2xs", *_SIZES]
+    + ["tight", "snug", "normal", "relaxed", "loose", "tighter", "wide", "wider"]
+    + ["widest"]
+)
+_LENGTH = re.compile(
+    r"(\d+(\.\d+)?|\d+/\d+|\[(length:)?-?[\d.]+[a-z%]*\]|\[(calc|min|max|clamp)\(.*\)\])"
+)
+_BORDER_STYLES = frozenset(["solid", "dashed", "dotted", "double", "hidden", "none"])
+_SHADOW_SIZES = frozenset(
+    ["", "2xs", "xs", "sm", "md", "lg", "xl", "2xl", "none", "inner"]
+)
+_FONT_WEIGHTS = frozenset(
+    ["thin", "extralight", "light", "normal", "medium", "semibold", "bold"]
+    + ["extrabold", "black"]
+)
+_BG_GROUPS = {
+    **dict.fromkeys(["fixed", "local", "scroll"], "bg-attachment"),
+    **dict.fromkeys(["auto", "cover", "contain"], "bg-size"),
+    **dict.fromkeys(["repeat", "no-repeat", "repeat-x", "repeat-y"], "bg-repeat"),
+    **dict.fromkeys(
+        ["bottom", "center", "left", "right", "top", "left-bottom", "left-top"]
+        + ["right-bottom", "right-top"],
+        "bg-position",
+    ),
+    "none": "bg-image",
+}
+_SIDES = ("x", "y", "t", "r", "b", "l", "s", "e")
+_CORNERS = tuple("t r b l s e tl tr br bl ss se ee es".split())
+
+
+def _is_length(value: str) -> bool:
+    return _LENGTH.fullmatch(value) is not None
+
+
+def _sized(group: str) -> Callable[[str], str | None]:
+    def classify(value: str) -> str | None:
+        if _is_length(value) or value in _SPACING_WORDS or value.startswith("["):
+            return group
+        return None
+
+    return classify
+
+
+def _bg(value: str) -> str:
+    if group := _BG_GROUPS.get(value):
+        return group
+    if value.startswith(("[url(", "[image:")):
+        return "bg-image"
+    if value.startswith(("[length:", "[size:")):
+        return "bg-size"
+    if value.startswith("[position:"):
+        return "bg-position"
+    return "bg-color"
+
+
+def _text(value: str) -> str:
+    if value.partition("/")[0] in _SIZES or _is_length(value):
+        return "font-size"
+    if value in ("left", "center", "right", "justify", "start", "end"):
+        return "text-align"
+    if value in ("wrap", "nowrap", "balance", "pretty"):
+        return "text-wrap"
+    return "text-color"
+
+
+def _border(side: str) -> Callable[[str], str]:
+    def classify(value: str) -> str:
+        if not value or _is_length(value):
+            return f"border-w{side}"
+        if not side and value in _BORDER_STYLES:
+            return "border-style"
+        if not side and value in ("collapse", "separate"):
+            return "border-collapse"
+        return f"border-color{side}"
+
+    return classify
+
+
+def _rounded(corner: str) -> Callable[[str], str]:
+    return lambda value: f"rounded{corner}"
+
+
+_PREFIXES: dict[str, str | Callable[[str], str | None]] = {
+    **{
+        prefix: _sized(prefix)
+        for prefix in [
+            *("w", "h", "size", "min-w", "min-h", "max-w", "max-h", "basis"),
+            *("p", "m", *(f"p{s}" for s in _SIDES), *(f"m{s}" for s in _SIDES)),
+            *("gap", "gap-x", "gap-y", "space-x", "space-y"),
+            *("inset", "inset-x", "inset-y", "top", "right", "bottom", "left"),
+            *("start", "end", "z", "order", "opacity", "leading", "tracking"),
+            *("translate-x", "translate-y", "scale", "rotate", "line-clamp"),
+            *("ring-offset", "outline-offset", "underline-offset"),
+        ]
+    },
+    **{prefix: prefix for prefix in ["items", "justify", "self", "place-items"]},
+    **{prefix: prefix for prefix in ["place-content", "place-self", "content"]},
+    **{prefix: prefix for prefix in ["cursor", "select", "pointer-events"]},
+    **{prefix: prefix for prefix in ["overflow", "overflow-x", "overflow-y"]},
+    **{prefix: prefix for prefix in ["whitespace", "object", "origin", "aspect"]},
+    **{prefix: prefix for prefix in ["duration", "ease", "delay", "animate"]},
+    **{prefix: prefix for prefix in ["transition", "grid-cols", "grid-rows"]},
+    **{prefix: prefix for prefix in ["col-span", "row-span", "shrink", "grow"]},
+    **{prefix: prefix for prefix in ["fill", "blur", "backdrop-blur", "align"]},
+    "text": _text,
+    "font": lambda v: "font-weight" if v in _FONT_WEIGHTS else "font-family",
+    # Longer prefixes are tried first, so these never fall through to bg-color
+    **dict.fromkeys(["bg-linear", "bg-radial", "bg-conic", "bg-gradient"], "bg-image"),
+    **{prefix: prefix for prefix in ["bg-clip", "bg-origin", "bg-blend"]},
+    **{prefix: prefix for prefix in ["bg-size", "bg-position", "bg-repeat"]},
+    "bg": _bg,
+    "border": _border(""),
+    **{f"border-{side}": _border(f"-{side}") for side in _SIDES},
+    "rounded": _rounded(""),
+    **{f"rounded-{corner}": _rounded(f"-{corner}") for corner in _CORNERS},
+    "shadow": lambda v: "shadow" if v in _SHADOW_SIZES else "shadow-color",
+    "ring": lambda v: "ring-w" if not v or _is_length(v) else "ring-color",
+    "outline": lambda v: (
+        "outline-style"
+        if v in _BORDER_STYLES
+        else "outline-w"
+        if _is_length(v)
+        else "outline-color"
+    ),
+    "flex": lambda v: (
+        "flex-direction"
+        if v in ("row", "row-reverse", "col", "col-reverse")
+        else "flex-wrap"
+        if v in ("wrap", "wrap-reverse", "nowrap")
+        else "flex"
+    ),
+    "stroke": lambda v: "stroke-w" if _is_length(v) else "stroke",
+}
+
+_EXACT: dict[str, str] = {
+    **dict.fromkeys(
+        ["block", "inline-block", "inline", "flex", "inline-flex", "grid"]
+        + ["inline-grid", "table", "inline-table", "table-row", "table-cell"]
+        + ["contents", "list-item", "flow-root", "hidden"],
+        "display",
+    ),
+    **dict.fromkeys(["static", "fixed", "absolute", "relative", "sticky"], "position"),
+    **dict.fromkeys(["visible", "invisible", "collapse"], "visibility"),
+    **dict.fromkeys(["italic", "not-italic"], "font-style"),
+    **dict.fromkeys(
+        ["underline", "overline", "line-through", "no-underline"], "text-decoration"
+    ),
+    **dict.fromkeys(
+        ["uppercase", "lowercase", "capitalize", "normal-case"], "text-transform"
+    ),
+    **dict.fromkeys(["truncate", "text-ellipsis", "text-clip"], "text-overflow"),
+    **dict.fromkeys(["sr-only", "not-sr-only"], "sr-only"),
+}
+
+_CONFLICTS: dict[str, tuple[str, ...]] = {
+    "p": tuple(f"p{side}" for side in _SIDES),
+    "px": ("pr", "pl", "ps", "pe"),
+    "py": ("pt", "pb"),
+    "m": tuple(f"m{side}" for side in _SIDES),
+    "mx": ("mr", "ml", "ms", "me"),
+    "my": ("mt", "mb"),
+    "size": ("w", "h"),
+    "gap": ("gap-x", "gap-y"),
+    "inset": ("inset-x", "inset-y", "top", "right", "bottom", "left", "start", "end"),
+    "inset-x": ("right", "left"),
+    "inset-y": ("top", "bottom"),
+    "overflow": ("overflow-x", "overflow-y"),
+    "font-size": ("leading",),
+    "rounded": tuple(f"rounded-{corner}" for corner in _CORNERS),
+    **{
+        f"rounded-{side}": tuple(c for c in _CORNERS if len(c) == 2 and side in c)
+        for side in ("t", "r", "b", "l")
+    },
+    "border-w": tuple(f"border-w-{side}" for side in _SIDES),
+    "border-w-x": ("border-w-r", "border-w-l"),
+    "border-w-y": ("border-w-t", "border-w-b"),
+    "border-color": tuple(f"border-color-{side}" for side in _SIDES),
+    "border-color-x": ("border-color-r", "border-color-l"),
+    "border-color-y": ("border-color-t", "border-color-b"),
+}
+
+
+def _utility_group(utility: str) -> str | None:
+    if utility.startswith("[") and ":" in utility:
+        return utility.partition(":")[0]  # Arbitrary property, e.g. [mask-type:alpha]
+    if group := _EXACT.get(utility):
+        return group
+
+    base, bracket, arbitrary = utility.partition("[")
+    parts = base.rstrip("-").split("-")
+    for i in range(len(parts), 0, -1):
+        rule = _PREFIXES.get("-".join(parts[:i]))
+        if rule is None:
+            continue
+        value = "-".join(parts[i:]) + bracket + arbitrary
+        return rule(value) if callable(rule) else rule
+    return None
+
+
+@lru_cache(maxsize=MERGE_CACHE_SIZE)
+def _conflict_key(cls: str) -> tuple[str, str] | None:
+    """Variant prefix and property group of a Tailwind class, if it is one."""
+    variants = []
+    depth = start = 0
+    for i, char in enumerate(cls):
+        if char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+        elif char == ":" and depth == 0:
+            variants.append(cls[start:i])
+            start = i + 1
+
+    utility = cls[start:]
+    important = utility.startswith("!") or utility.endswith("!")
+    group = _utility_group(utility.strip("!").removeprefix("-"))
+    if group is None:
+        return None
+    return ":".join(sorted(variants)) + ("!" if important else ""), group
+
+
+def tw_merge(classes: str) -> str:
+    """Drop Tailwind utilities overridden by a later conflicting one."""
+    seen: set[tuple[str, str]] = set()
+    kept: list[str] = []
+    for cls in reversed(classes.split()):
+        key = _conflict_key(cls)
+        if key is not None:
+            if key in seen:
+                continue
+            variants, group = key
+            seen.add(key)
+            seen.update((variants, other) for other in _CONFLICTS.get(group, ()))
+        kept.append(cls)
+    return " ".join(reversed(kept))
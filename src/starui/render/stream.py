@@ -0,0 +1,157 @@
+"""Streaming rendering of containers with iterable children.
+
+``stream`` renders a container once with markers in place of its iterable
+children and returns the markup around them as an ``HtmlStream``. The
+children are only pulled, and rendered, as the stream is iterated.
+"""
+
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterator
+from functools import wraps
+from typing import Any
+
+from rusty_tags import HtmlString
+
+# Characters buffered before a streamed page yields a chunk
+STREAM_CHUNK_SIZE = 16 * 1024
+
+_STREAM_HOLE = re.compile("\x01(\\d+)\x01")
+
+
+class HtmlStream:
+    """Markup rendered as it is iterated, for streaming responses.
+
+    Iterating yields chunks of about ``STREAM_CHUNK_SIZE`` characters. The
+    markup before each streamed child is flushed before the child is pulled,
+    so the ``<head>`` goes out before the first row is built. Use ``async for``
+    (as Starlette's ``StreamingResponse`` does) when a child is async.
+    """
+
+    __slots__ = ("parts",)
+
+    def __init__(self, parts: list[Any]) -> None:
+        self.parts = parts
+
+    def _pieces(self) -> Iterator[str | None]:
+        # None marks a point to flush at
+        for part in self.parts:
+            if part.__class__ is str:
+                yield part
+            elif part.__class__ is HtmlStream:
+                yield from part._pieces()
+            elif isinstance(part, AsyncIterable):
+                raise TypeError("HtmlStream has async children, use `async for`")
+            else:
+                yield None
+                for child in part:
+                    if child.__class__ is HtmlStream:
+                        yield from child._pieces()
+                    else:
+                        yield str(child)
+
+    async def _apieces(self) -> AsyncIterator[str | None]:
+        for part in self.parts:
+            if part.__class__ is str:
+                yield part
+            elif part.__class__ is HtmlStream:
+                async for piece in part._apieces():
+                    yield piece
+            else:
+                yield None
+                if isinstance(part, AsyncIterable):
+                    async for child in part:
+                        async for piece in _apieces(child):
+                            yield piece
+                else:
+                    for child in part:
+                        async for piece in _apieces(child):
+                            yield piece
+
+    def __iter__(self) -> Iterator[str]:
+        buffer: list[str] = []
+        size = 0
+        for piece in self._pieces():
+            if piece is not None:
+                buffer.append(piece)
+                size += len(piece)
+                if size < STREAM_CHUNK_SIZE:
+                    continue
+            if buffer:
+                yield "".join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield "".join(buffer)
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        buffer: list[str] = []
+        size = 0
+        async for piece in self._apieces():
+            if piece is not None:
+                buffer.append(piece)
+                size += len(piece)
+                if size < STREAM_CHUNK_SIZE:
+                    continue
+            if buffer:
+                yield "".join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield "".join(buffer)
+
+    def __str__(self) -> str:
+        return "".join(self)
+
+
+async def _apieces(child: Any) -> AsyncIterator[str | None]:
+    if child.__class__ is HtmlStream:
+        async for piece in child._apieces():
+            yield piece
+    else:
+        yield str(child)
+
+
+def _streams(child: Any) -> bool:
+    return child.__class__ is HtmlStream or isinstance(child, Iterator | AsyncIterable)
+
+
+def stream(
+    container: Callable[..., HtmlString], *children: Any, **attrs: Any
+) -> HtmlString | HtmlStream:
+    """Call ``container`` with ``children``, streaming the iterable ones.
+
+    Iterators, async iterables and other streams become streamed children; a
+    call without any renders as usual. Works with any tag or component that
+    passes its children through unchanged:
+
+        stream(Html, Head(...), stream(Body, Table(TableBody(rows()))))
+    """
+    streamed = [child for child in children if _streams(child)]
+    if not streamed:
+        return container(*children, **attrs)
+
+    holes = iter(range(len(streamed)))
+    markup = str(
+        container(
+            *(f"\x01{next(holes)}\x01" if _streams(c) else c for c in children),
+            **attrs,
+        )
+    )
+    parts = _STREAM_HOLE.split(markup)
+    order = [int(i) for i in parts[1::2]]
+    if sorted(order) != list(range(len(streamed))):
+        raise ValueError(
+            f"{getattr(container, '__name__', container)}() must render each "
+            "streamed child exactly once"
+        )
+    return HtmlStream(
+        [streamed[int(part)] if i % 2 else part for i, part in enumerate(parts)]
+    )
+
+
+def streaming(component: Callable[..., HtmlString]) -> Callable[..., Any]:
+    """Let a container component take iterable children, see ``stream``."""
+
+    @wraps(component)
+    def wrapper(*children: Any, **attrs: Any) -> HtmlString | HtmlStream:
+        return stream(component, *children, **attrs)
+
+    return wrapper
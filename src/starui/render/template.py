@@ -0,0 +1,145 @@
+"""Static subtree hoisting.
+
+``template`` renders a component once with markers in place of its hole
+arguments and keeps the markup between them as pre-joined segments. Calls
+then only concatenate the segments with the hole values; the tree is rebuilt
+only for new static arguments. Like rusty_tags, holes are inserted unescaped.
+"""
+
+import re
+from collections.abc import Callable
+from functools import lru_cache, wraps
+from typing import Any
+
+from rusty_tags import HtmlString
+
+from . import tracking
+
+# Combinations of static arguments compiled per template
+TEMPLATE_VARIANTS = 256
+
+_HOLE = re.compile("\x00(\\d+)\x00")
+_FILLABLE = frozenset([str, HtmlString, int, float])
+_MISSING = object()
+
+
+class _ContextDependent(Exception):
+    """The compiled markup depends on the active sprite sheet or assets."""
+
+
+def _in_render_context() -> bool:
+    """Whether a sprite sheet or render context could make renders contextual."""
+    from starui.icons.sprite import current_sheet
+
+    from .context import current_render_context
+
+    return current_sheet() is not None or current_render_context() is not None
+
+
+def template(
+    *holes: str,
+) -> Callable[[Callable[..., HtmlString]], Callable[..., HtmlString]]:
+    """Hoist everything but the ``holes`` arguments out of a component's calls.
+
+        @template("title", "body")
+        def Panel(title, body, variant="default"): ...
+
+    Holes must reach the markup unchanged: as children, attribute values or
+    formatted into strings. Arguments that drive logic stay static, and each
+    combination of them is compiled once. Renders that generate IDs, use a
+    sprite sheet or require assets are not hoisted, and hole values other than
+    strings, rendered HTML or numbers fall back to a full render.
+    """
+
+    def decorate(component: Callable[..., HtmlString]) -> Callable[..., HtmlString]:
+        from inspect import Parameter, signature
+
+        parameters = signature(component).parameters
+        if unknown := [hole for hole in holes if hole not in parameters]:
+            raise TypeError(f"{component.__name__}() has no parameter(s) {unknown}")
+        if any(
+            p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD, p.POSITIONAL_ONLY)
+            for p in parameters.values()
+        ):
+            raise TypeError(f"{component.__name__}() must take named parameters only")
+
+        names = tuple(parameters)
+        defaults = {
+            name: p.default
+            for name, p in parameters.items()
+            if p.default is not Parameter.empty
+        }
+        markers = {hole: f"\x00{i}\x00" for i, hole in enumerate(holes)}
+        # Variants that used a sprite sheet or assets; inside a context they
+        # render directly instead of failing to compile first
+        contextual: set[tuple[int, tuple[tuple[str, Any], ...]]] = set()
+
+        @lru_cache(maxsize=TEMPLATE_VARIANTS)
+        def compile(
+            generation: int, static: tuple[tuple[str, Any], ...]
+        ) -> tuple[tuple[str, ...], tuple[int, ...]] | None:
+            rendered, usage = tracking.tracked(component, **markers, **dict(static))
+            if usage.contextual:
+                raise _ContextDependent  # Not cached: may be fine in another
+            if usage.volatile:
+                return None
+
+            markup = str(rendered)
+
+            parts = _HOLE.split(markup)
+            order = tuple(int(i) for i in parts[1::2])
+            if unused := [h for i, h in enumerate(holes) if i not in order]:
+                raise ValueError(
+                    f"{component.__name__}() doesn't render {unused} unchanged; "
+                    "pass them as static arguments instead"
+                )
+            return tuple(parts[0::2]), order
+
+        @wraps(component)
+        def wrapper(*args: Any, **kwargs: Any) -> HtmlString:
+            if len(args) > len(names):
+                return component(*args, **kwargs)
+            values = dict(zip(names, args, strict=False))
+            values.update(kwargs)
+
+            fills = []
+            for hole in holes:
+                value = values.pop(hole, defaults.get(hole, _MISSING))
+                if value.__class__ not in _FILLABLE:
+                    return component(*args, **kwargs)
+                fills.append(str(value))
+
+            static = tuple(values.items())
+            try:
+                hash(static)
+            except TypeError:  # Unhashable static argument
+                return component(*args, **kwargs)
+            variant = (tracking.generation, static)
+            if variant in contextual and _in_render_context():
+                return component(*args, **kwargs)
+            try:
+                compiled = compile(*variant)
+            except _ContextDependent:
+                if len(contextual) >= TEMPLATE_VARIANTS:
+                    contextual.clear()
+                contextual.add(variant)
+                compiled = None
+            if compiled is None:
+                return component(*args, **kwargs)
+
+            segments, order = compiled
+            out = [segments[0]]
+            for i, segment in zip(order, segments[1:], strict=True):
+                out.append(fills[i])
+                out.append(segment)
+            return HtmlString("".join(out))
+
+        def cache_clear() -> None:
+            compile.cache_clear()
+            contextual.clear()
+
+        wrapper.cache_info = compile.cache_info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorate
@@ -0,0 +1,55 @@
+"""What a render depended on besides its arguments.
+
+``tracked`` runs a render with a fresh ``Usage`` in a ContextVar, so
+concurrent requests and threads each record their own. Generating an ID marks
+the render volatile; using a sprite sheet or requiring an asset also marks it
+contextual. Caches store only renders that are neither, and key them on
+``generation``, which settings that change every render (``set_cn_merge``)
+bump through ``settings_changed``.
+"""
+
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import Any
+
+generation = 0
+
+
+class Usage:
+    __slots__ = ("volatile", "contextual")
+
+    def __init__(self) -> None:
+        self.volatile = False  # IDs generated, or contextual
+        self.contextual = False  # Sprite icons used or assets required
+
+
+_usage: ContextVar[Usage | None] = ContextVar("render_usage", default=None)
+
+
+def mark_volatile(contextual: bool = False) -> None:
+    """Record that the render in progress can't be reused as is."""
+    if (usage := _usage.get()) is not None:
+        usage.volatile = True
+        usage.contextual = usage.contextual or contextual
+
+
+def tracked(render: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[Any, Usage]:
+    """Call ``render`` and return its result with what it used.
+
+    The usage also counts towards any tracked render this one is part of.
+    """
+    usage = Usage()
+    token = _usage.set(usage)
+    try:
+        result = render(*args, **kwargs)
+    finally:
+        _usage.reset(token)
+        if usage.volatile:
+            mark_volatile(usage.contextual)
+    return result, usage
+
+
+def settings_changed() -> None:
+    """Invalidate cached renders after a setting that changes every render."""
+    global generation
+    generation += 1
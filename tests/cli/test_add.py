@@ -0,0 +1,59 @@
+"""Tests for package installation in the add command."""
+
+import subprocess
+from unittest.mock import patch
+
+from starui.cli.add import _declared_packages, _install_packages
+
+PYPROJECT = """
+[project]
+name = "demo"
+dependencies = ["Star_Lighter>=0.1", "httpx[http2] ; python_version > '3.10'"]
+
+[project.optional-dependencies]
+docs = ["mkdocs"]
+
+[dependency-groups]
+dev = ["pytest>=8", {include-group = "docs"}]
+"""
+
+
+def test_declared_packages(tmp_path):
+    (tmp_path / "pyproject.toml").write_text(PYPROJECT)
+
+    assert _declared_packages(tmp_path) == {"star-lighter", "httpx", "mkdocs", "pytest"}
+    assert _declared_packages(tmp_path / "missing") == set()
+
+
+@patch("starui.cli.add.console.print")
+def test_install_packages_in_one_call(mock_print, tmp_path):
+    (tmp_path / "pyproject.toml").write_text(PYPROJECT)
+    packages = {"star-lighter", "typer", "not-a-real-pkg", "other-pkg"}
+
+    with patch("starui.cli.add.subprocess.run") as mock_run:
+        _install_packages(packages, tmp_path)
+
+    mock_run.assert_called_once()
+    assert mock_run.call_args.args[0] == ["uv", "add", "not-a-real-pkg", "other-pkg"]
+
+    output = " ".join(str(call.args[0]) for call in mock_print.call_args_list)
+    assert "Already available: star-lighter, typer" in output
+    assert "Installed: not-a-real-pkg, other-pkg" in output
+
+
+@patch("starui.cli.add.console.print")
+def test_nothing_to_install(mock_print, tmp_path):
+    with patch("starui.cli.add.subprocess.run") as mock_run:
+        _install_packages({"typer", "rich"}, tmp_path)
+
+    mock_run.assert_not_called()
+
+
+@patch("starui.cli.add.console.print")
+def test_install_failure_is_reported(mock_print, tmp_path):
+    error = subprocess.CalledProcessError(1, ["uv"], stderr="no solution")
+    with patch("starui.cli.add.subprocess.run", side_effect=error):
+        _install_packages({"not-a-real-pkg"}, tmp_path)
+
+    output = " ".join(str(call.args[0]) for call in mock_print.call_args_list)
+    assert "Failed to install not-a-real-pkg: no solution" in output
@@ -149,3 +149,35 @@ class TestProcessManager:
 
         for proc in mock_procs.values():
             proc.terminate.assert_called_once()
+
+
+def test_generated_css_input_is_reused(tmp_path):
+    """Test that the generated input is kept across runs and only rewritten on change."""
+    config = MagicMock()
+    config.project_root = tmp_path
+    config.css_output_absolute = tmp_path / "static" / "css" / "output.css"
+
+    with patch("starui.cli.dev.generate_css_input", return_value="/* a */"):
+        first = get_or_create_css_input(config)
+        mtime = first.stat().st_mtime_ns
+        second = get_or_create_css_input(config)
+
+    assert first == second
+    assert second.stat().st_mtime_ns == mtime
+
+    with patch("starui.cli.dev.generate_css_input", return_value="/* b */"):
+        assert get_or_create_css_input(config).read_text() == "/* b */"
+
+
+@patch("starui.cli.dev.success")
+@patch("starui.cli.dev.console")
+def test_wait_for_css_uses_tailwind_readiness(mock_console, mock_success, tmp_path):
+    """Test wait_for_css waits on Tailwind's ready signal instead of polling."""
+    css_path = tmp_path / "out.css"
+    manager = MagicMock()
+    manager.wait_ready.side_effect = lambda name, timeout: css_path.write_text("x")
+
+    wait_for_css(css_path, manager=manager)
+
+    manager.wait_ready.assert_called_once_with("tailwind", 10)
+    mock_success.assert_called_once_with("CSS built")
@@ -1,5 +1,9 @@
 """Tests for the main CLI application."""
 
+import json
+import subprocess
+import sys
+
 from typer.testing import CliRunner
 
 from starui.cli.main import app
@@ -99,3 +103,41 @@ class TestCLIErrorHandling:
         result = self.runner.invoke(app, ["add"])
         # Should fail gracefully with help message
         assert result.exit_code != 0
+
+
+DEFERRED_MODULES = {"pydantic", "requests", "starlette", "starhtml", "starui.dev"}
+
+
+def test_help_defers_command_imports():
+    """Test that `star --help` stays fast by not importing command internals."""
+    script = (
+        "import json, sys\n"
+        "from starui.cli.main import app\n"
+        "try:\n"
+        "    app(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(json.dumps(sorted(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True
+    )
+    assert result.returncode == 0
+
+    loaded = set(json.loads(result.stdout.splitlines()[-1]))
+    assert "starui.cli.main" in loaded
+    assert not loaded & DEFERRED_MODULES
+
+
+def test_add_dry_run(tmp_path, monkeypatch):
+    """Test that --dry-run explains the install plan without writing files."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo"\n')
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(app, ["add", "theme-toggle", "dialog", "--dry-run"])
+
+    assert result.exit_code == 0
+    assert "1. utils" in result.stdout
+    assert "2. button required by theme_toggle, dialog" in result.stdout
+    assert "4. dialog requested" in result.stdout
+    assert not (tmp_path / "components").exists()
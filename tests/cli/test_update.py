@@ -0,0 +1,84 @@
+"""Tests for the update command."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from starui.cli.main import app
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo"\n')
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(app, ["add", "button"])
+    assert result.exit_code == 0, result.output
+    return tmp_path
+
+
+def set_locked_hash(root, name, value):
+    lock_path = root / "starui.lock"
+    lock = json.loads(lock_path.read_text())
+    lock["components"][name]["hash"] = value
+    lock_path.write_text(json.dumps(lock))
+
+
+def test_add_writes_lock(project):
+    lock = json.loads((project / "starui.lock").read_text())
+    assert set(lock["components"]) == {"utils", "button"}
+
+
+def test_update_is_a_no_op_when_current(project):
+    lock_before = (project / "starui.lock").read_text()
+
+    result = CliRunner().invoke(app, ["update"])
+
+    assert result.exit_code == 0
+    assert "All 2 components are up to date" in result.stdout
+    assert (project / "starui.lock").read_text() == lock_before
+
+
+def test_update_shows_diff_for_local_changes(project):
+    button = project / "components" / "ui" / "button.py"
+    original = button.read_text()
+    button.write_text(original + "# local tweak\n")
+    set_locked_hash(project, "button", "outdated")
+
+    result = CliRunner().invoke(app, ["update"], input="n\n")
+    assert "-# local tweak" in result.stdout
+    assert button.read_text().endswith("# local tweak\n")
+
+    result = CliRunner().invoke(app, ["update", "--force"])
+    assert result.exit_code == 0
+    assert button.read_text() == original
+    assert "outdated" not in (project / "starui.lock").read_text()
+
+
+def test_update_dry_run(project):
+    (project / "components" / "ui" / "utils.py").unlink()
+
+    result = CliRunner().invoke(app, ["update", "--dry-run"])
+
+    assert "Restore" in result.stdout
+    assert not (project / "components" / "ui" / "utils.py").exists()
+
+
+def test_update_fails_without_registry_source(project, monkeypatch):
+    from starui.registry import lockfile
+
+    plan_updates = lockfile.plan_updates
+
+    def without_content(*args, **kwargs):
+        updates = plan_updates(*args, **kwargs)
+        for update in updates:
+            update.status, update.content = "update", None
+        return updates
+
+    monkeypatch.setattr(lockfile, "plan_updates", without_content)
+    set_locked_hash(project, "button", "outdated")
+
+    result = CliRunner().invoke(app, ["update", "--force"])
+
+    assert result.exit_code == 1
+    assert "no registry source" in result.stdout
@@ -0,0 +1 @@
+"""Tests for StarUI development tools."""
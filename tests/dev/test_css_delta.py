@@ -0,0 +1,110 @@
+"""Tests for rule-level CSS deltas."""
+
+import json
+
+import pytest
+
+from starui.dev.css_delta import apply_delta, diff_css, parse_sheet, split_rules
+from starui.dev.unified_reload import DevReloadHandler
+
+BASE = """/*! tailwindcss v4.1.0 | MIT License */
+@layer theme, base, components, utilities;
+@layer theme {
+  :root { --color-red-500: oklch(63.7% 0.237 25.331); }
+}
+@layer utilities {
+  .flex { display: flex; }
+  .h-9 { height: calc(var(--spacing) * 9); }
+  .md\\:grid { @media (width >= 48rem) { display: grid; } }
+  .before\\:content-\\[\\'\\{\\'\\] { --tw-content: '{'; }
+}
+@keyframes spin { to { transform: rotate(360deg); } }
+"""
+
+
+class TestSplitRules:
+    """Test stylesheet rule splitting."""
+
+    def test_top_level_rules(self):
+        rules = split_rules(BASE)
+
+        assert rules[0] == "@layer theme, base, components, utilities;"
+        assert rules[1].startswith("@layer theme {")
+        assert rules[3].startswith("@keyframes spin")
+        assert len(rules) == 4
+
+    def test_braces_in_strings_and_escapes(self):
+        utilities = parse_sheet(BASE)[2]
+
+        assert utilities[0] == "@layer utilities"
+        assert len(utilities) == 5
+        assert utilities[-1].endswith("{ --tw-content: '{'; }")
+
+
+class TestDiffCss:
+    """Test stylesheet diffing."""
+
+    def test_identical(self):
+        assert diff_css(BASE, BASE) == {"rules": 4, "groups": {}, "ops": []}
+
+    def test_added_utility_is_single_insert(self):
+        new = BASE.replace(
+            "  .flex { display: flex; }\n",
+            "  .flex { display: flex; }\n  .gap-2 { gap: calc(var(--spacing) * 2); }\n",
+        )
+        delta = diff_css(BASE, new, max_ratio=1.0)
+
+        assert delta["ops"] == [
+            {
+                "op": "insert",
+                "group": 2,
+                "index": 1,
+                "rule": ".gap-2 { gap: calc(var(--spacing) * 2); }",
+            }
+        ]
+        assert delta["groups"] == {2: 4}
+        assert apply_delta(BASE, delta) == parse_sheet(new)
+
+    def test_out_of_sync_group_is_detected(self):
+        new = BASE.replace(".flex {", ".grid { display: grid; }\n  .flex {")
+        delta = diff_css(BASE, new, max_ratio=1.0)
+        # A browser that dropped a rule, or a stylesheet that changed meanwhile
+        drifted = BASE.replace(".flex {", ".hidden { display: none; }\n  .flex {")
+
+        with pytest.raises(ValueError, match="out of sync"):
+            apply_delta(drifted, delta)
+
+    def test_changed_and_removed_rules(self):
+        new = BASE.replace(".h-9 { height: calc(var(--spacing) * 9); }", "")
+        new = new.replace("rotate(360deg)", "rotate(-360deg)")
+        new = new.replace(
+            "@layer theme {", "@media print { .x { color: red; } }\n@layer theme {"
+        )
+        delta = diff_css(BASE, new, max_ratio=1.0)
+
+        assert {op["op"] for op in delta["ops"]} == {"insert", "delete"}
+        assert apply_delta(BASE, delta) == parse_sheet(new)
+
+    def test_large_delta_falls_back(self):
+        assert diff_css(BASE, ".a { color: red; }") is None
+
+
+@pytest.mark.asyncio
+async def test_notify_css_delta_message(monkeypatch, tmp_path):
+    sent = []
+
+    class Client:
+        async def send_text(self, text):
+            sent.append(json.loads(text))
+
+    monkeypatch.setattr(DevReloadHandler, "clients", {Client()})
+    delta = {"rules": 4, "groups": {2: 4}, "ops": []}
+
+    await DevReloadHandler.notify_css_update(tmp_path / "starui.css", 1.0, delta)
+    await DevReloadHandler.notify_css_update(tmp_path / "starui.css", 1.0)
+
+    assert sent[0]["type"] == "css-delta"
+    assert sent[0]["rules"] == 4 and sent[0]["ops"] == []
+    assert sent[0]["groups"] == {"2": 4}  # JSON keys, as the client reads them
+    assert sent[1]["type"] == "css-update"
+    assert "ops" not in sent[1]
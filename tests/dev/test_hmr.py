@@ -0,0 +1,187 @@
+"""Tests for fragment-level hot module replacement."""
+
+import json
+
+import pytest
+from rusty_tags import Div
+from starlette.applications import Starlette
+from starlette.responses import HTMLResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from starui.dev.hmr import diff_html, parse_html, render_route, scoped_ids
+from starui.dev.unified_reload import DevReloadHandler
+from starui.registry.components.badge import Badge
+from starui.registry.components.button import Button
+from starui.registry.components.card import Card, CardContent, CardHeader, CardTitle
+from starui.registry.components.checkbox import CheckboxWithLabel
+from starui.render.html import sort_attributes
+from starui.render.ids import id_scope
+
+
+def page(body: str, head: str = "<title>t</title>") -> str:
+    return f"<!doctype html><html><head>{head}</head><body>{body}</body></html>"
+
+
+def plan_page(label: str) -> str:
+    """A page of real components; rusty_tags orders attributes differently per render."""
+    return page(
+        str(
+            Card(
+                CardHeader(CardTitle("Plan")),
+                CardContent(
+                    Badge(label, variant="secondary"),
+                    Button("Upgrade", variant="outline", size="sm"),
+                    CheckboxWithLabel("Renew automatically"),
+                ),
+                id="plan",
+            )
+        )
+        + "".join(
+            str(Div(Button(f"Action {i}", variant="ghost"), cls="flex gap-2"))
+            for i in range(8)
+        )
+    )
+
+
+class TestParseHtml:
+    """Test the offset-tracking HTML tree."""
+
+    def test_offsets_cover_elements(self):
+        source = '<div id="a">\n  <span>x</span><br><img src="i"/>\n</div>'
+        root = parse_html(source)
+        div = root.children[0]
+
+        assert source[div.start : div.end] == source
+        assert [c.tag for c in div.children] == ["span", "br", "img"]
+        assert source[div.children[0].start : div.children[0].end] == "<span>x</span>"
+
+
+class TestDiffHtml:
+    """Test HTML diffing into element patches."""
+
+    def test_identical(self):
+        assert diff_html(page("<p>x</p>"), page("<p>x</p>")) == []
+
+    def test_changed_text_patches_nearest_id(self):
+        old = page(
+            '<main id="m"><section id="s"><p>old</p></section></main>' + "x" * 200
+        )
+        new = page(
+            '<main id="m"><section id="s"><p>new</p></section></main>' + "x" * 200
+        )
+
+        assert diff_html(old, new) == [
+            {"id": "s", "html": '<section id="s"><p>new</p></section>'}
+        ]
+
+    def test_nested_changes_collapse_to_outer_id(self):
+        old = page('<div id="a">one<div id="b">two</div></div>' + "x" * 200)
+        new = page('<div id="a">uno<div id="b">dos</div></div>' + "x" * 200)
+
+        assert [p["id"] for p in diff_html(old, new)] == ["a"]
+
+    def test_change_without_id_needs_reload(self):
+        assert diff_html(page("<p>old</p>"), page("<p>new</p>")) is None
+
+    def test_head_change_needs_reload(self):
+        old = page('<div id="a">x</div>', head="<title>a</title>")
+        new = page('<div id="a">x</div>', head="<title>b</title>")
+
+        assert diff_html(old, new) is None
+
+    def test_real_components(self):
+        """Attribute order differs between renders but isn't a change."""
+
+        def render(label):
+            with id_scope():
+                return plan_page(label)
+
+        old = render("Free")
+        assert diff_html(old, render("Free")) == []
+
+        (patch,) = diff_html(old, render("Pro"))
+        assert patch["id"] == "plan"
+        assert "Pro" in patch["html"]
+        assert "Free" not in patch["html"]
+
+    def test_large_diff_needs_reload(self):
+        old = page('<div id="a">old</div>')
+        new = page('<div id="a">new</div>')
+
+        assert diff_html(old, new, max_ratio=0.1) is None
+        assert diff_html(old, new, max_ratio=1.0) is not None
+
+
+@pytest.fixture
+def app():
+    state = {"label": "Free"}
+
+    async def home(request):
+        return HTMLResponse(plan_page(state["label"]))
+
+    app = Starlette(routes=[Route("/", home)])
+    app.state.plan = state
+    return app
+
+
+@pytest.mark.asyncio
+async def test_render_route(app):
+    html = await render_route(app, "/?q=1")
+
+    assert 'id="plan"' in html
+    assert await render_route(app, "/") == html  # IDs numbered, attributes sorted
+    assert await render_route(app, "/missing") is None
+
+
+@pytest.mark.asyncio
+async def test_served_pages_match_renders(app):
+    """The page in the browser must carry the IDs the patches target."""
+    client = TestClient(scoped_ids(app))
+
+    served = client.get("/").text
+    fragment = client.get("/", headers={"datastar-request": "true"}).text
+
+    assert sort_attributes(served) == await render_route(app, "/")
+    assert sort_attributes(fragment) != sort_attributes(served)
+
+
+class FakeWebSocket:
+    headers: dict[str, str] = {}
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
+
+@pytest.mark.asyncio
+async def test_hot_update_sends_patches(app, monkeypatch):
+    ws = FakeWebSocket()
+    monkeypatch.setattr(DevReloadHandler, "hmr_app", app)
+    monkeypatch.setattr(DevReloadHandler, "clients", {ws})
+    monkeypatch.setattr(DevReloadHandler, "routes", {ws: "/"})
+    monkeypatch.setattr(DevReloadHandler, "snapshots", {})
+
+    await DevReloadHandler._snapshot(ws)
+    app.state.plan["label"] = "Pro"
+    await DevReloadHandler.notify_reload(["views"])
+
+    (message,) = ws.sent
+    assert message["type"] == "hmr"
+    assert [patch["id"] for patch in message["patches"]] == ["plan"]
+    assert "Pro" in message["patches"][0]["html"]
+
+
+@pytest.mark.asyncio
+async def test_hot_update_without_snapshot_reloads(app, monkeypatch):
+    ws = FakeWebSocket()
+    monkeypatch.setattr(DevReloadHandler, "hmr_app", app)
+    monkeypatch.setattr(DevReloadHandler, "clients", {ws})
+    monkeypatch.setattr(DevReloadHandler, "routes", {})
+    monkeypatch.setattr(DevReloadHandler, "snapshots", {})
+
+    await DevReloadHandler.notify_reload(["views"])
+
+    assert ws.sent == [{"type": "reload", "modules": ["views"]}]
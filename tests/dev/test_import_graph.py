@@ -0,0 +1,277 @@
+"""Tests for import-graph-aware development reloads."""
+
+import importlib
+import os
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from starui.dev.import_graph import (
+    ImportGraph,
+    ImportGraphRecorder,
+    ModuleNode,
+    build_import_graph,
+    changed_since,
+    find_imports,
+    has_new_modules,
+    reload_in_place,
+    snapshot,
+)
+from starui.dev.process_manager import ProcessManager
+from starui.registry.local import discover_components, invalidate
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A small app: app -> views (leaf), app -> pkg.helpers -> pkg.shared (leaf)."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "shared.py").write_text("VALUE = 1\n")
+    (tmp_path / "pkg" / "helpers.py").write_text("from .shared import VALUE\n")
+    (tmp_path / "views.py").write_text("def page():\n    return 'old'\n")
+    (tmp_path / "app.py").write_text(
+        "import pkg.helpers\nfrom views import page\n\ndef home():\n    return page()\n"
+    )
+    (tmp_path / "script.py").write_text("print('not imported')\n")
+
+    sys.path.insert(0, str(tmp_path))
+    importlib.import_module("app")
+    yield tmp_path
+    sys.path.remove(str(tmp_path))
+    for name in ("app", "views", "pkg", "pkg.helpers", "pkg.shared"):
+        sys.modules.pop(name, None)
+
+
+class TestImportGraph:
+    """Test graph construction and change planning."""
+
+    def test_build_records_only_imported_project_modules(self, project):
+        graph = build_import_graph(project, "app")
+
+        assert set(graph.modules) == {
+            "app",
+            "views",
+            "pkg",
+            "pkg.helpers",
+            "pkg.shared",
+        }
+        assert graph.modules["app"].imports == {"pkg", "pkg.helpers", "views"}
+        assert graph.modules["pkg.helpers"].imports == {"pkg", "pkg.shared"}
+        assert (project / "script.py").resolve() not in graph.files()
+
+    def test_leaf_detection(self, project):
+        graph = build_import_graph(project, "app")
+
+        assert graph.is_leaf("views")
+        assert graph.is_leaf("pkg.shared")
+        assert not graph.is_leaf("app")
+        assert not graph.is_leaf("pkg")
+        assert not graph.is_leaf("pkg.helpers")
+
+    def test_plan(self, project):
+        root = project.resolve()
+        graph = build_import_graph(project, "app", {root / "templates" / "a.html"})
+
+        assert graph.plan([root / "script.py"]) == ([], False)
+        assert graph.plan([root / "views.py"]) == (["views"], False)
+        assert graph.plan([root / "app.py"]) == ([], True)
+        assert graph.plan([root / "templates" / "a.html"]) == ([], True)
+        assert graph.plan([root / "static" / "x.py"]) == ([], False)
+        assert graph.plan([root / "notes.txt"]) == ([], False)
+
+    def test_lazily_imported_modules_are_new(self, project):
+        """Handlers may import modules lazily, after the graph was built."""
+        graph = build_import_graph(project, "app")
+        assert not has_new_modules(graph)
+
+        (project / "lazy.py").write_text("VALUE = 1\n")
+        importlib.import_module("lazy")
+        try:
+            assert has_new_modules(graph)
+            assert "lazy" in build_import_graph(project, "app").modules
+        finally:
+            sys.modules.pop("lazy", None)
+
+    def test_round_trip(self, project, tmp_path):
+        graph = build_import_graph(project, "app", {project / "t.html"})
+        graph.vendored = {project / "components" / "ui" / "badge.py"}
+        graph.save(tmp_path / "graph.json")
+
+        assert ImportGraph.load(tmp_path / "graph.json") == graph
+
+    def test_relative_imports(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "b.py").write_text("from . import c\nfrom ..d import e\n")
+        node = ModuleNode("a.b", tmp_path / "a" / "b.py")
+
+        assert find_imports(node, {"a", "a.c", "d", "d.e", "x"}) == {
+            "a",
+            "a.c",
+            "d",
+            "d.e",
+        }
+
+
+class TestReloadInPlace:
+    """Test in-place reloading of leaf modules."""
+
+    def test_rebinds_from_imports(self, project):
+        graph = build_import_graph(project, "app")
+        app = sys.modules["app"]
+        assert app.home() == "old"
+
+        (project / "views.py").write_text("def page():\n    return 'new'\n")
+        importlib.invalidate_caches()
+        reload_in_place("views", graph)
+
+        assert app.page is sys.modules["views"].page
+        assert app.home() == "new"
+
+
+def test_changed_since(tmp_path):
+    path = tmp_path / "f.py"
+    path.write_text("a")
+    mtimes = snapshot([path, tmp_path / "missing.py"])
+
+    assert changed_since(mtimes) == []
+
+    later = time.time() + 5
+    os.utime(path, (later, later))
+    assert changed_since(mtimes) == [path]
+    assert changed_since(mtimes) == []
+
+
+def test_recorder_refreshes_discovered_components(project, tmp_path):
+    ui = project / "components" / "ui"
+    ui.mkdir(parents=True)
+    (ui / "badge.py").write_text("def Badge():\n    return 'old'\n")
+    badge = discover_components(project)["Badge"]
+    assert badge() == "old"
+
+    reloads = []
+    recorder = ImportGraphRecorder(project, "app", tmp_path / "graph.json")
+    recorder.start(lambda modules, timing: reloads.append(modules), interval=0.05)
+    try:
+        time.sleep(0.2)  # Let the watcher take its first snapshot
+        later = time.time() + 5
+        (ui / "badge.py").write_text("def Badge():\n    return 'new'\n")
+        os.utime(ui / "badge.py", (later, later))
+
+        deadline = time.time() + 5
+        while not reloads and time.time() < deadline:
+            time.sleep(0.05)
+    finally:
+        recorder.stop.set()
+        invalidate()
+
+    assert reloads == [["badge"]]
+    assert badge() == "new"
+
+
+def test_recorder_picks_up_lazy_imports(project, tmp_path):
+    graph_file = tmp_path / "graph.json"
+    recorder = ImportGraphRecorder(project, "app", graph_file)
+    recorder.start(interval=0.05)
+    try:
+        assert "lazy" not in ImportGraph.load(graph_file).modules
+        (project / "lazy.py").write_text("VALUE = 1\n")
+        importlib.import_module("lazy")
+
+        deadline = time.time() + 5
+        while "lazy" not in recorder.graph.modules and time.time() < deadline:
+            time.sleep(0.05)
+    finally:
+        recorder.stop.set()
+        sys.modules.pop("lazy", None)
+
+    assert "lazy" in ImportGraph.load(graph_file).modules
+
+
+class TestProcessManagerGraphReload:
+    """Test uvicorn startup with graph reload."""
+
+    @patch("subprocess.Popen")
+    def test_graph_reload_disables_uvicorn_reloader(self, mock_popen, tmp_path):
+        mock_popen.return_value = MagicMock(poll=MagicMock(return_value=0))
+        app_file = tmp_path / "app.py"
+        app_file.write_text("app = None\n")
+        manager = ProcessManager()
+
+        with patch.object(manager, "_watch_graph") as mock_watch:
+            manager.start_uvicorn(app_file, 5000, ["*.py"], True, True, True)
+
+        cmd = mock_popen.call_args[0][0]
+        assert "--reload" not in cmd
+        assert "--reload-include" not in cmd
+        mock_watch.assert_called_once_with(
+            "uvicorn", manager.graph_file(app_file), manager.restart_file(app_file)
+        )
+        manager.stop_all()
+
+    @patch("subprocess.Popen")
+    def test_without_graph_reload_uses_uvicorn_reloader(self, mock_popen, tmp_path):
+        mock_popen.return_value = MagicMock(poll=MagicMock(return_value=0))
+        app_file = tmp_path / "app.py"
+        manager = ProcessManager()
+
+        manager.start_uvicorn(app_file, 5000, ["*.py"], False, True, True)
+
+        cmd = mock_popen.call_args[0][0]
+        assert "--reload" in cmd
+        assert cmd[cmd.index("--reload-include") + 1] == "*.py"
+        manager.stop_all()
+
+    def test_failed_restart_waits_for_a_fix(self, tmp_path):
+        """A broken save stops the worker without ending the session."""
+        app_file = tmp_path / "app.py"
+        app_file.write_text("import time\ntime.sleep(60)\n")
+        graph_file = tmp_path / "graph.json"
+        ImportGraph(tmp_path, "app", {"app": ModuleNode("app", app_file)}).save(
+            graph_file
+        )
+        manager = ProcessManager()
+        manager.start_process("uvicorn", [sys.executable, str(app_file)], tmp_path)
+        manager._watch_graph("uvicorn", graph_file)
+        supervisor = threading.Thread(target=manager.wait_for_any_exit, daemon=True)
+        supervisor.start()
+
+        def save(source, seconds):
+            later = time.time() + seconds
+            app_file.write_text(source)
+            os.utime(app_file, (later, later))
+
+        def wait_for(condition):
+            deadline = time.time() + 10
+            while not condition() and time.time() < deadline:
+                time.sleep(0.05)
+            return condition()
+
+        try:
+            time.sleep(0.7)  # Let the watcher snapshot the graph
+            save("def broken(:\n", 5)
+            assert wait_for(lambda: "uvicorn" in manager.waiting)
+            assert supervisor.is_alive()
+
+            save("import time\ntime.sleep(60)\n", 10)
+            assert wait_for(lambda: manager.is_running("uvicorn"))
+            assert "uvicorn" not in manager.waiting
+            assert supervisor.is_alive()
+        finally:
+            manager.stop_all()
+            supervisor.join(timeout=2)
+
+    def test_restart_process(self):
+        manager = ProcessManager()
+        old = MagicMock()
+        manager.processes["test"] = old
+        manager.commands["test"] = (["cmd"], None, None)
+
+        with patch.object(manager, "start_process") as mock_start:
+            manager.restart_process("test")
+
+        old.terminate.assert_called_once()
+        mock_start.assert_called_once_with("test", ["cmd"], None, None)
+        assert "test" not in manager.restarting
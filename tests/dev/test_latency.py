@@ -0,0 +1,190 @@
+"""Tests for dev-loop latency tracking and the benchmark harness."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from starui.dev.benchmark import acknowledge, run_benchmark
+from starui.dev.latency import (
+    LatencyLog,
+    LatencySample,
+    percentile,
+    stash_restart,
+    take_restart,
+)
+from starui.dev.unified_reload import DevReloadHandler
+
+
+class FakeWebSocket:
+    headers: dict[str, str] = {}
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
+    async def send(self, text):
+        self.sent.append(json.loads(text))
+
+
+def test_percentile():
+    assert percentile([], 50) == 0.0
+    assert percentile([5.0], 95) == 5.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert percentile([1.0, 2.0, 3.0, 4.0], 100) == 4.0
+
+
+class TestLatencyLog:
+    """Test latency samples and their log file."""
+
+    def test_spans_follow_hop_order(self):
+        sample = LatencySample(
+            "hmr", {"sent": 1.3, "saved": 1.0, "detected": 1.2, "applied": 1.35}
+        )
+
+        assert list(sample.spans()) == [
+            "saved → detected",
+            "detected → sent",
+            "sent → applied",
+            "total",
+        ]
+        assert sample.spans()["total"] == pytest.approx(350)
+
+    def test_record_and_load(self, tmp_path):
+        path = tmp_path / "latency.jsonl"
+        log = LatencyLog(path)
+        log.record("reload", {"saved": 1.0, "applied": 1.1, "bogus": 5, "sent": "x"})
+        log.record("reload", {"saved": 2.0, "applied": 2.3})
+        with path.open("a") as f:
+            f.write("not json\n")
+
+        loaded = LatencyLog.load(path)
+
+        assert [s.timing for s in loaded.samples] == [
+            {"saved": 1.0, "applied": 1.1},
+            {"saved": 2.0, "applied": 2.3},
+        ]
+        assert loaded.totals("reload") == pytest.approx([100, 300])
+        assert "p50 200ms" in loaded.report(loaded.samples[-1])
+
+    def test_table_rows(self):
+        log = LatencyLog()
+        log.record("css-delta", {"built": 1.0, "detected": 1.1, "applied": 1.2})
+        log.record("reload", {"saved": 1.0, "applied": 1.1})
+
+        # Three css-delta rows (two hops and total), one reload row
+        assert log.table().row_count == 4
+
+
+def test_restart_is_handed_over_once(tmp_path):
+    path = tmp_path / "restart.json"
+    stash_restart(path, {"saved": 1.0, "detected": 1.2}, ["views"])
+
+    restart = take_restart(path)
+
+    assert restart["modules"] == ["views"]
+    assert restart["timing"]["saved"] == 1.0
+    assert restart["timing"]["restarted"] >= restart["timing"]["detected"]
+    assert take_restart(path) is None
+
+
+def test_unclaimed_restarts_are_merged(tmp_path):
+    """A worker that failed to start leaves its change for the next one."""
+    path = tmp_path / "restart.json"
+    stash_restart(path, {"saved": 1.0}, ["views"])
+    stash_restart(path, {"saved": 2.0}, ["admin"])
+
+    assert take_restart(path)["modules"] == ["admin", "views"]
+
+    stash_restart(path, {"saved": 1.0}, ["views"])
+    stash_restart(path, {"saved": 2.0}, None)
+
+    restart = take_restart(path)
+    assert restart["modules"] is None
+    assert restart["timing"]["saved"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_reconnecting_tab_gets_restart_timing(monkeypatch):
+    ws = FakeWebSocket()
+    monkeypatch.setattr(DevReloadHandler, "hmr_app", None)
+    monkeypatch.setattr(DevReloadHandler, "routes", {})
+    restart = {"timing": {"saved": 1.0}, "modules": None}
+    monkeypatch.setattr(DevReloadHandler, "restart", restart)
+    handler = object.__new__(DevReloadHandler)
+
+    await handler.on_receive(ws, json.dumps({"type": "hello", "path": "/"}))
+    assert ws.sent == []
+
+    hello = {"type": "hello", "path": "/", "restarted": True}
+    await handler.on_receive(ws, json.dumps(hello))
+    assert ws.sent[0]["type"] == "restart"
+    assert ws.sent[0]["timing"]["reconnected"] > 1.0
+
+
+@pytest.mark.asyncio
+async def test_applied_message_is_recorded(monkeypatch, capsys):
+    log = LatencyLog()
+    monkeypatch.setattr(DevReloadHandler, "latency", log)
+    handler = object.__new__(DevReloadHandler)
+    message = {
+        "type": "applied",
+        "kind": "hmr",
+        "timing": {"saved": 1.0, "sent": 1.2},
+        "applied": 1.25,
+    }
+
+    await handler.on_receive(FakeWebSocket(), json.dumps(message))
+
+    assert log.samples[0].timing == {"saved": 1.0, "sent": 1.2, "applied": 1.25}
+    assert "hmr applied in 250ms" in capsys.readouterr().out
+
+
+@pytest.mark.asyncio
+async def test_notifications_stamp_sent(monkeypatch):
+    ws = FakeWebSocket()
+    monkeypatch.setattr(DevReloadHandler, "hmr_app", None)
+    monkeypatch.setattr(DevReloadHandler, "clients", {ws})
+
+    await DevReloadHandler.notify_reload(["views"], {"saved": 1.0, "detected": 2.0})
+
+    timing = ws.sent[0]["timing"]
+    assert timing["saved"] == 1.0
+    assert timing["sent"] >= timing["detected"]
+
+
+@pytest.mark.asyncio
+async def test_benchmark_client_acknowledges_like_the_browser():
+    ws = FakeWebSocket()
+
+    with patch("starui.dev.benchmark.fetch") as mock_fetch:
+        await acknowledge(ws, {"type": "reload", "timing": {"sent": 1.0}}, "http://x/")
+        await acknowledge(ws, {"type": "hmr"}, "http://x/")
+
+    mock_fetch.assert_called_once_with("http://x/")
+    assert len(ws.sent) == 1
+    assert ws.sent[0]["type"] == "applied"
+    assert ws.sent[0]["kind"] == "reload"
+    assert ws.sent[0]["timing"] == {"sent": 1.0}
+
+
+def test_benchmark_end_to_end():
+    """Two edits through a real worker come back with every hop measured."""
+    result = run_benchmark(edits=2, hmr=True, timeout=15)
+
+    assert result.missed == 0
+    assert len(result.client.totals("hmr")) == 2
+    spans = result.worker.summary()["hmr"]
+    assert {"saved → detected", "sent → applied", "total"} <= set(spans)
+
+
+def test_benchmark_restart_end_to_end():
+    """Edits to the app module are measured through the worker restart."""
+    result = run_benchmark(edits=2, restart=True, timeout=15)
+
+    assert result.missed == 0
+    assert len(result.client.totals("restart")) == 2
+    spans = result.worker.summary()["restart"]
+    assert {"detected → restarted", "reconnected → applied", "total"} <= set(spans)
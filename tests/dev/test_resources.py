@@ -0,0 +1,135 @@
+"""Tests for the dev process resource monitor."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from starui.dev.process_manager import ProcessManager
+from starui.dev.resources import (
+    LEAK_RELOADS,
+    ResourceMonitor,
+    ResourceSample,
+    descendants,
+    sample_process,
+    supported,
+)
+
+pytestmark = pytest.mark.skipif(not supported(), reason="requires /proc")
+
+MB = 1024 * 1024
+
+
+def sample(name="uvicorn", cpu=0.0, rss=50 * MB, fds=10, watches=0, reloads=0):
+    return ResourceSample(name, 1, time.time(), 0.0, rss, fds, 1, watches, cpu, reloads)
+
+
+class TestProcSampling:
+    """Test reading process resources from /proc."""
+
+    def test_sample_own_process(self):
+        own = sample_process("star", os.getpid(), {})
+
+        assert own.rss > 0
+        assert own.fds > 0
+        assert own.threads >= 1
+        assert own.cpu_time > 0
+
+    def test_descendants_are_folded_in(self):
+        child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+        try:
+            assert child.pid in descendants(os.getpid())
+            alone = sample_process("star", os.getpid(), {})
+            tree = sample_process("star", os.getpid())
+            assert tree.rss > alone.rss
+        finally:
+            child.kill()
+            child.wait()
+
+    def test_missing_process(self):
+        assert sample_process("gone", 2**22 + 12345, {}) is None
+
+
+class TestResourceMonitor:
+    """Test sampling, logging and runaway checks."""
+
+    def test_sample_logs_and_computes_cpu(self, tmp_path):
+        manager = ProcessManager()
+        manager.start_process(
+            "uvicorn",
+            [sys.executable, "-c", "while True: pass"],
+        )
+        log = tmp_path / "resources.jsonl"
+        monitor = ResourceMonitor(manager, log)
+
+        try:
+            monitor.sample()
+            time.sleep(0.3)
+            samples = {s.name: s for s in monitor.sample()}
+        finally:
+            manager.stop_all()
+
+        assert set(samples) == {"star", "uvicorn"}
+        assert samples["uvicorn"].cpu > 20
+        lines = [json.loads(line) for line in log.read_text().splitlines()]
+        assert len(lines) == 4
+        assert {"name", "cpu", "rss", "fds", "watches", "reloads"} <= set(lines[0])
+        assert "uvicorn" in monitor.status_line()
+
+    def test_busy_tailwind_warns_once(self):
+        monitor = ResourceMonitor(MagicMock())
+        busy = sample("tailwind", cpu=99)
+
+        warnings = [monitor.check([busy]) for _ in range(6)]
+
+        assert warnings[3] == []
+        assert "99% CPU" in warnings[4][0]
+        assert ".gitignore" in warnings[4][0]
+        assert warnings[5] == []
+
+    def test_many_watches_warn(self):
+        monitor = ResourceMonitor(MagicMock())
+
+        assert (
+            "20000 directories" in monitor.check([sample("tailwind", watches=20000)])[0]
+        )
+
+    def test_memory_growth_across_reloads(self):
+        monitor = ResourceMonitor(MagicMock())
+        warnings = []
+        for reload in range(LEAK_RELOADS + 1):
+            # Several samples per reload; only the first after each reload counts
+            for _ in range(3):
+                warnings += monitor.check(
+                    [sample(rss=(50 + 20 * reload) * MB, reloads=reload)]
+                )
+
+        assert len(warnings) == 1
+        assert "grew by 100MB" in warnings[0]
+
+    def test_stable_memory_does_not_warn(self):
+        monitor = ResourceMonitor(MagicMock())
+        for reload in range(LEAK_RELOADS * 2):
+            rss = (50 + (30 if reload % 2 else 0)) * MB
+            assert monitor.check([sample(rss=rss, reloads=reload)]) == []
+
+
+def test_reload_lines_are_counted():
+    manager = ProcessManager()
+    script = (
+        "import time\n"
+        "for _ in range(2): print('[StarUI] ↻ Reloaded in place: views', flush=True)\n"
+        "time.sleep(5)"
+    )
+    manager.start_process("uvicorn", [sys.executable, "-c", script])
+    try:
+        deadline = time.time() + 5
+        while manager.reloads.get("uvicorn", 0) < 2 and time.time() < deadline:
+            time.sleep(0.05)
+        assert manager.reloads["uvicorn"] == 2
+    finally:
+        manager.stop_all()
@@ -0,0 +1,180 @@
+"""Tests for route-aware reload targeting."""
+
+import functools
+import importlib
+import json
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from starui.dev.import_graph import build_import_graph
+from starui.dev.routes import endpoint_for, function_modules, route_affected
+from starui.dev.unified_reload import DevReloadHandler
+
+APP = """
+import functools
+
+from starlette.applications import Starlette
+from starlette.responses import HTMLResponse
+from starlette.routing import Route
+
+import admin
+from views import page
+
+
+def wrap(func):
+    # Like framework route wrappers: the handler is only reachable via the closure
+    async def endpoint(request):
+        return HTMLResponse(func())
+    return endpoint
+
+
+def home():
+    return page()
+
+
+def dashboard():
+    return admin.table()
+
+
+app = Starlette(routes=[Route("/", wrap(home)), Route("/admin/{section}", wrap(dashboard))])
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    """app -> views (home), app -> admin -> widgets (dashboard)."""
+    (tmp_path / "widgets.py").write_text(
+        "class Grid:\n    @staticmethod\n    def render():\n        return 'grid'\n"
+    )
+    (tmp_path / "admin.py").write_text(
+        "from widgets import Grid\n\ndef table():\n    return Grid.render()\n"
+    )
+    (tmp_path / "views.py").write_text("def page():\n    return 'home'\n")
+    (tmp_path / "app.py").write_text(APP)
+
+    sys.path.insert(0, str(tmp_path))
+    module = importlib.import_module("app")
+    yield module, build_import_graph(tmp_path, "app")
+    sys.path.remove(str(tmp_path))
+    for name in ("app", "admin", "views", "widgets"):
+        sys.modules.pop(name, None)
+
+
+class TestRouteDependencies:
+    """Test mapping routes to the modules they render with."""
+
+    def test_endpoint_for(self, project):
+        module, _ = project
+
+        assert endpoint_for(module.app, "/?tab=1") is module.app.routes[0].endpoint
+        assert endpoint_for(module.app, "/admin/users") is not None
+        assert endpoint_for(module.app, "/missing") is None
+
+    def test_function_modules_follow_closures_and_attributes(self, project):
+        module, graph = project
+        project_modules = set(graph.modules)
+
+        home = endpoint_for(module.app, "/")
+        dashboard = endpoint_for(module.app, "/admin/users")
+
+        assert function_modules(home, project_modules) == {"app", "views"}
+        assert function_modules(dashboard, project_modules) == {
+            "app",
+            "admin",
+            "widgets",
+        }
+
+    def test_wrapped_functions(self, project):
+        _, graph = project
+        views = sys.modules["views"]
+
+        @functools.wraps(views.page)
+        def cached():
+            return None
+
+        cached.__module__ = "functools"
+        assert function_modules(cached, set(graph.modules)) == {"views"}
+
+    def test_route_affected(self, project):
+        module, graph = project
+        modules = set(graph.modules)
+
+        assert route_affected(module.app, "/admin/users", ["widgets"], modules)
+        assert not route_affected(module.app, "/", ["widgets"], modules)
+        # Unknown routes and clients that never said hello are reloaded
+        assert route_affected(module.app, "/missing", ["widgets"], modules)
+        assert route_affected(module.app, None, ["widgets"], modules)
+        # Changes outside the project's modules can't be traced to routes
+        assert route_affected(module.app, "/", ["badge"], modules)
+
+
+class FakeWebSocket:
+    headers: dict[str, str] = {}
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
+
+@pytest.mark.asyncio
+async def test_only_affected_tabs_reload(project, monkeypatch):
+    module, graph = project
+    home, admin, unknown = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+    monkeypatch.setattr(DevReloadHandler, "app", module.app)
+    monkeypatch.setattr(DevReloadHandler, "graph", SimpleNamespace(graph=graph))
+    monkeypatch.setattr(DevReloadHandler, "hmr_app", None)
+    monkeypatch.setattr(DevReloadHandler, "clients", {home, admin, unknown})
+    monkeypatch.setattr(DevReloadHandler, "routes", {home: "/", admin: "/admin/x"})
+
+    await DevReloadHandler.notify_reload(["widgets"])
+
+    assert home.sent == [{"type": "stale", "modules": ["widgets"]}]
+    assert admin.sent == [{"type": "reload", "modules": ["widgets"]}]
+    assert unknown.sent == [{"type": "reload", "modules": ["widgets"]}]
+
+
+@pytest.mark.asyncio
+async def test_only_affected_tabs_reload_after_restart(project, monkeypatch):
+    module, graph = project
+    home, admin = FakeWebSocket(), FakeWebSocket()
+    monkeypatch.setattr(DevReloadHandler, "app", module.app)
+    monkeypatch.setattr(DevReloadHandler, "graph", SimpleNamespace(graph=graph))
+    monkeypatch.setattr(DevReloadHandler, "hmr_app", None)
+    monkeypatch.setattr(DevReloadHandler, "routes", {})
+    monkeypatch.setattr(
+        DevReloadHandler, "restart", {"timing": {}, "modules": ["admin"]}
+    )
+    handler = object.__new__(DevReloadHandler)
+
+    for ws, path in ((home, "/"), (admin, "/admin/x")):
+        hello = {"type": "hello", "path": path, "restarted": True}
+        await handler.on_receive(ws, json.dumps(hello))
+
+    assert home.sent == [{"type": "stale", "modules": ["admin"]}]
+    assert admin.sent == [{"type": "restart", "modules": ["admin"]}]
+
+
+@pytest.mark.asyncio
+async def test_reconnect_without_stashed_restart_reloads(monkeypatch):
+    ws = FakeWebSocket()
+    monkeypatch.setattr(DevReloadHandler, "hmr_app", None)
+    monkeypatch.setattr(DevReloadHandler, "routes", {})
+    monkeypatch.setattr(DevReloadHandler, "restart", None)
+    handler = object.__new__(DevReloadHandler)
+
+    hello = {"type": "hello", "path": "/", "restarted": True}
+    await handler.on_receive(ws, json.dumps(hello))
+
+    assert ws.sent == [{"type": "restart", "modules": []}]
+
+
+def test_restart_modules(project):
+    module, graph = project
+    root = graph.root
+
+    assert graph.changed_modules([root / "admin.py", root / "notes.txt"]) == ["admin"]
+    assert graph.changed_modules([root / "admin.py", root / "app.py"]) is None
@@ -0,0 +1,120 @@
+"""Tests for readiness-aware dev startup."""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from starui.dev.process_manager import GRAPH_ENV, LATENCY_ENV, ProcessManager
+from starui.dev.startup import StartupTimeline
+
+
+class TestReadiness:
+    """Test readiness signals from process output."""
+
+    def test_ready_line_sets_event(self):
+        manager = ProcessManager()
+        script = "import time; print('Rebuilding...'); print('Done in 12ms', flush=True); time.sleep(5)"
+        manager.start_process("tailwind", [sys.executable, "-c", script])
+
+        try:
+            assert manager.wait_ready("tailwind", timeout=5)
+            assert manager.ready_at["tailwind"] <= time.perf_counter()
+        finally:
+            manager.stop_all()
+
+    def test_exit_before_ready(self):
+        manager = ProcessManager()
+        manager.start_process("uvicorn", [sys.executable, "-c", "print('boom')"])
+
+        start = time.monotonic()
+        assert not manager.wait_ready("uvicorn", timeout=5)
+        assert time.monotonic() - start < 4
+        manager.stop_all()
+
+    def test_unknown_process(self):
+        assert not ProcessManager().wait_ready("missing", timeout=0.1)
+
+
+@pytest.fixture
+def wrappers():
+    """Process managers whose wrappers and owner marks are removed afterwards."""
+    managers = []
+
+    def create():
+        managers.append(ProcessManager())
+        return managers[-1]
+
+    yield create
+    for manager in managers:
+        if manager.wrapper:
+            manager.wrapper.unlink(missing_ok=True)
+            for owner in manager.wrapper.parent.glob(f"{manager.wrapper.stem}.*.owner"):
+                owner.unlink()
+
+
+class TestWrapperReuse:
+    """Test the dev wrapper is shared across runs with the same settings."""
+
+    def test_same_settings_reuse_wrapper(self, tmp_path, wrappers):
+        app_file = tmp_path / "app.py"
+        first, second = wrappers(), wrappers()
+
+        module = first._get_app_module(app_file, True, True, True)
+        mtime = first.wrapper.stat().st_mtime_ns
+
+        assert second._get_app_module(app_file, True, True, True) == module
+        assert second.wrapper.stat().st_mtime_ns == mtime
+        assert second._get_app_module(app_file, True, False, True) != module
+
+    def test_wrapper_of_exited_run_is_removed(self, tmp_path, wrappers):
+        app_file = tmp_path / "app.py"
+        first, second = wrappers(), wrappers()
+        first._get_app_module(app_file, True, True, True)
+        exited = subprocess.Popen([sys.executable, "-c", "pass"])
+        exited.wait()
+        dead_owner = ProcessManager.owner_file(first.wrapper, exited.pid)
+        first.wrapper_owner.rename(dead_owner)
+
+        second._get_app_module(app_file, True, False, True)
+
+        assert not first.wrapper.exists()
+        assert not dead_owner.exists()
+        assert second.wrapper.exists()
+
+    def test_wrapper_of_live_run_is_kept(self, tmp_path, wrappers):
+        """Another star dev on a different port may still be using it."""
+        app_file = tmp_path / "app.py"
+        first, second = wrappers(), wrappers()
+        first._get_app_module(app_file, True, True, True)
+
+        second._get_app_module(app_file, True, False, True)
+
+        assert first.wrapper.exists()
+        assert second.wrapper.exists()
+
+    def test_wrapper_has_no_per_run_paths(self, tmp_path, wrappers):
+        manager = wrappers()
+        manager._get_app_module(tmp_path / "app.py", True, True, True)
+        source = manager.wrapper.read_text()
+
+        assert str(os.getpid()) not in source
+        assert GRAPH_ENV in source and LATENCY_ENV in source
+
+
+def test_timeline_orders_steps_by_finish():
+    timeline = StartupTimeline(started=0.0)
+    timeline.record("uvicorn start", 0.1, 0.2)
+    timeline.record("port", 0.0, 0.05)
+    timeline.mark("uvicorn ready", 1.5)
+    timeline.mark("tailwind build", None)
+
+    assert [name for name, _, _ in timeline.ordered()] == [
+        "port",
+        "uvicorn start",
+        "uvicorn ready",
+    ]
+    assert timeline.total == 1.5
+    assert timeline.summary().startswith("Started in 1.50s (port 50ms")
@@ -0,0 +1,156 @@
+"""Tests for cn's cached fast path and Tailwind conflict merging."""
+
+import timeit
+from typing import Any
+
+import pytest
+
+from starui.registry.components import utils
+from starui.registry.components.utils import cn, set_cn_merge
+from starui.render.merge import tw_merge
+
+
+def reference_cn(*classes: Any) -> str:
+    """cn as it was before caching."""
+    result_classes: list[str] = []
+
+    for cls in classes:
+        if not cls:
+            continue
+
+        if isinstance(cls, str):
+            result_classes.append(cls)
+        elif isinstance(cls, dict):
+            for class_name, condition in cls.items():
+                if condition:
+                    result_classes.append(str(class_name))
+        elif isinstance(cls, list | tuple):
+            result_classes.append(reference_cn(*cls))
+        else:
+            result_classes.append(str(cls))
+
+    return " ".join(result_classes)
+
+
+@pytest.fixture(autouse=True)
+def merge_off():
+    yield
+    set_cn_merge(False)
+
+
+@pytest.mark.parametrize(
+    "classes",
+    [
+        (),
+        ("a",),
+        ("a", "", None, "b"),
+        ("h-9", "h-12"),
+        ("a", {"b": True, "c": False}, ["d", ["e", ""]], ("f",), 0, 1, True),
+        ("a", [""], "b"),
+    ],
+)
+def test_matches_reference_without_merge(classes):
+    assert cn(*classes) == reference_cn(*classes)
+    assert cn(*classes) == reference_cn(*classes)  # Cached
+
+
+def test_string_calls_are_cached():
+    utils._join.cache_clear()
+
+    cn("px-4", "py-2")
+    cn("px-4", "py-2")
+
+    assert utils._join.cache_info().hits == 1
+    cn("px-4", {"py-2": True})
+    assert utils._join.cache_info().misses == 1
+
+
+class TestMerge:
+    """Test resolving conflicting Tailwind utilities."""
+
+    @pytest.mark.parametrize(
+        ("classes", "merged"),
+        [
+            ("h-9 h-12", "h-12"),
+            ("px-2 py-1 p-4", "p-4"),
+            ("p-4 px-2", "p-4 px-2"),
+            ("size-4 w-6", "size-4 w-6"),
+            ("w-6 h-6 size-4", "size-4"),
+            ("text-sm text-muted-foreground text-lg", "text-muted-foreground text-lg"),
+            ("text-left text-center", "text-center"),
+            (
+                "bg-primary hover:bg-primary/90 bg-destructive",
+                "hover:bg-primary/90 bg-destructive",
+            ),
+            ("hover:focus:bg-a focus:hover:bg-b", "focus:hover:bg-b"),
+            (
+                "border border-input border-2 border-dashed",
+                "border-input border-2 border-dashed",
+            ),
+            ("rounded-t-lg rounded-md", "rounded-md"),
+            ("rounded-md rounded-t-lg", "rounded-md rounded-t-lg"),
+            ("flex hidden md:flex", "hidden md:flex"),
+            ("flex flex-col flex-row flex-1", "flex flex-row flex-1"),
+            ("mt-2 -mt-4", "-mt-4"),
+            ("h-9 h-12!", "h-9 h-12!"),
+            ("w-[10px] w-[calc(100%-2rem)]", "w-[calc(100%-2rem)]"),
+            ("text-[14px] text-[#fff] text-base", "text-[#fff] text-base"),
+            ("[mask-type:luminance] [mask-type:alpha]", "[mask-type:alpha]"),
+            ("font-bold font-mono font-medium", "font-mono font-medium"),
+            ("ring-2 ring-ring/50 ring-[3px]", "ring-ring/50 ring-[3px]"),
+            ("bg-red-500 bg-clip-text", "bg-red-500 bg-clip-text"),
+            ("bg-clip-border bg-clip-text", "bg-clip-text"),
+            (
+                "bg-origin-border bg-red-500 bg-origin-padding",
+                "bg-red-500 bg-origin-padding",
+            ),
+            ("bg-red-500 bg-linear-to-r", "bg-red-500 bg-linear-to-r"),
+            ("bg-linear-to-r bg-radial bg-conic-180", "bg-conic-180"),
+            ("bg-gradient-to-r bg-none", "bg-none"),
+            ("bg-blue-500 bg-[url(/hero.png)]", "bg-blue-500 bg-[url(/hero.png)]"),
+            ("bg-cover bg-size-[auto_100px]", "bg-size-[auto_100px]"),
+            ("bg-repeat-x bg-no-repeat", "bg-no-repeat"),
+            ("bg-blend-multiply bg-blend-screen", "bg-blend-screen"),
+        ],
+    )
+    def test_later_utility_wins(self, classes, merged):
+        assert tw_merge(classes) == merged
+
+    def test_unknown_classes_are_kept(self):
+        classes = "btn btn-outline dropdown-menu top-bar top-0 h-header h-4"
+        assert tw_merge(classes) == classes
+
+    def test_merge_argument_and_default(self):
+        assert cn("h-9", {"h-12": True}, merge=True) == "h-12"
+        assert cn("h-9", "h-12") == "h-9 h-12"
+
+        set_cn_merge(True)
+        assert cn("h-9", "h-12") == "h-12"
+        assert cn("h-9", "h-12", merge=False) == "h-9 h-12"
+
+    def test_component_override(self):
+        from starui.registry.components.button import Button
+
+        set_cn_merge(True)
+        html = str(Button("Go", cls="h-12"))
+
+        assert "h-12" in html
+        assert " h-9 " not in html
+
+
+def test_microbenchmark():
+    """Cached calls beat joining, and merging, from scratch."""
+    classes = ("inline-flex items-center h-9 px-4", "", "bg-primary", "h-12 px-6")
+
+    def best(fn):
+        return min(timeit.repeat(fn, number=2000, repeat=5)) / 2000 * 1e6
+
+    join = best(lambda: reference_cn(*classes))
+    cached = best(lambda: cn(*classes))
+    merge = best(lambda: utils._join.__wrapped__(classes, True))
+    cached_merge = best(lambda: cn(*classes, merge=True))
+    print(
+        f"\ncn: {join:.2f}us -> {cached:.2f}us per call, "
+        f"merged: {merge:.2f}us -> {cached_merge:.2f}us"
+    )
+    assert cached_merge * 2 < merge
@@ -0,0 +1,149 @@
+"""Tests for precompiled cva lookup tables, with a microbenchmark."""
+
+import ast
+import itertools
+import timeit
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from starui.registry.components.utils import cn, cva
+
+COMPONENTS = Path(__file__).parents[2] / "src" / "starui" / "registry" / "components"
+
+
+def reference_cva(base: str = "", config: dict[str, Any] | None = None):
+    """cva as it was before lookup tables, resolving every call from scratch."""
+    if config is None:
+        config = {}
+
+    variants = config.get("variants", {})
+    compound_variants = config.get("compoundVariants", [])
+    default_variants = config.get("defaultVariants", {})
+
+    def variant_function(**props: Any) -> str:
+        classes = [base] if base else []
+        final_props = {**default_variants, **props}
+
+        for variant_key, variant_values in variants.items():
+            prop_value = final_props.get(variant_key)
+            if prop_value and prop_value in variant_values:
+                classes.append(variant_values[prop_value])
+
+        for compound in compound_variants:
+            compound_class = compound.get("class", "")
+            if not compound_class:
+                continue
+
+            matches = True
+            for key, value in compound.items():
+                if key == "class":
+                    continue
+                if final_props.get(key) != value:
+                    matches = False
+                    break
+
+            if matches:
+                classes.append(compound_class)
+
+        return cn(*classes)
+
+    return variant_function
+
+
+def shipped_tables() -> dict[str, dict[str, Any]]:
+    """Arguments of every literal cva(...) call in the bundled components."""
+    tables = {}
+    for path in sorted(COMPONENTS.glob("*.py")):
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if not (
+                isinstance(node, ast.Call) and getattr(node.func, "id", "") == "cva"
+            ):
+                continue
+            try:
+                kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in node.keywords}
+            except ValueError:
+                continue
+            tables[f"{path.stem}:{node.lineno}"] = kwargs
+    return tables
+
+
+COMPOUND = {
+    "base": "btn",
+    "config": {
+        "variants": {
+            "variant": {"default": "bg-primary", "outline": "border"},
+            "size": {"sm": "h-8", "lg": "h-10"},
+        },
+        "compoundVariants": [
+            {"variant": "outline", "size": "lg", "class": "border-2"},
+            {"tone": "muted", "class": "opacity-75"},
+            {"variant": "default", "class": ""},
+        ],
+        "defaultVariants": {"variant": "default"},
+    },
+}
+
+
+def combinations(config: dict[str, Any]):
+    values = {
+        key: [None, "unknown", *options]
+        for key, options in config.get("variants", {}).items()
+    }
+    values["tone"] = [None, "muted"]
+    for combo in itertools.product(*values.values()):
+        yield {
+            key: value
+            for key, value in zip(values, combo, strict=True)
+            if value is not None
+        }
+
+
+@pytest.mark.parametrize(
+    "table", [*shipped_tables().values(), COMPOUND], ids=[*shipped_tables(), "compound"]
+)
+def test_matches_reference_for_every_combination(table):
+    fast, reference = cva(**table), reference_cva(**table)
+
+    assert fast() == reference()
+    for props in combinations(table.get("config", {})):
+        assert fast(**props) == reference(**props), props
+        assert fast(**props) == reference(**props), props  # Served from the table
+        assert fast(**props, cls="ignored") == reference(**props, cls="ignored")
+
+
+def test_explicit_none_and_unhashable_props():
+    fast, reference = cva(**COMPOUND), reference_cva(**COMPOUND)
+
+    assert fast(variant=None) == reference(variant=None) == "btn"
+    assert fast(tone=["muted"]) == reference(tone=["muted"])
+
+
+def test_table_is_bounded(monkeypatch):
+    import starui.registry.components.utils as utils
+
+    monkeypatch.setattr(utils, "CVA_TABLE_SIZE", 2)
+    variants = utils.cva("x", {"variants": {"v": {"a": "A"}}})
+
+    assert [variants(v=str(i)) for i in range(5)] == ["x"] * 5
+    table = variants.__closure__[variants.__code__.co_freevars.index("table")]
+    assert len(table.cell_contents) == 2
+
+
+def test_microbenchmark():
+    """A cached variant lookup beats resolving the combination every call."""
+    button = shipped_tables()[
+        next(k for k in shipped_tables() if k.startswith("button:"))
+    ]
+    fast, reference = cva(**button), reference_cva(**button)
+    props = {"variant": "outline", "size": "sm"}
+
+    def best(fn):
+        return min(timeit.repeat(lambda: fn(**props), number=2000, repeat=5))
+
+    fast_time, reference_time = best(fast), best(reference)
+    print(
+        f"\ncva: {reference_time / 2000 * 1e6:.2f}us -> {fast_time / 2000 * 1e6:.2f}us per call"
+    )
+    assert fast_time * 1.5 < reference_time
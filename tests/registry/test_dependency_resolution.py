@@ -170,3 +170,59 @@ class TestDependencyChain:
         button_idx = order.index("button")
         toggle_idx = order.index("theme_toggle")
         assert button_idx < toggle_idx
+
+
+class CountingClient(RegistryClient):
+    """Registry client that counts source and metadata reads."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = []
+        self.lookups = []
+
+    def get_component_source(self, component_name):
+        self.reads.append(component_name)
+        return super().get_component_source(component_name)
+
+    def get_component_metadata(self, component_name):
+        self.lookups.append(component_name)
+        return super().get_component_metadata(component_name)
+
+
+class TestInstallPlan:
+    """Test resolving several components into one install plan."""
+
+    def test_plan_covers_all_requested(self):
+        """Test one topological order with shared dependencies listed once."""
+        plan = DependencyResolver(RegistryClient()).plan(
+            ["theme_toggle", "dialog", "badge"]
+        )
+
+        assert plan.order == ["utils", "button", "theme_toggle", "dialog", "badge"]
+        assert plan.reason("dialog") == "requested"
+        assert plan.required_by["utils"] == [
+            "theme_toggle",
+            "button",
+            "dialog",
+            "badge",
+        ]
+        assert plan.reason("button") == "required by theme_toggle, dialog"
+
+    def test_each_source_read_once(self):
+        """Test that shared dependencies are looked up and read only once."""
+        client = CountingClient()
+        loader = ComponentLoader(client)
+
+        sources = loader.load_plan(loader.plan(["theme_toggle", "dialog", "button"]))
+
+        assert list(sources) == ["utils", "button", "theme_toggle", "dialog"]
+        assert sorted(client.reads) == sorted(sources)
+        assert sorted(client.lookups) == sorted(sources)
+
+    def test_unknown_component_in_plan(self):
+        """Test that planning fails before anything is read."""
+        client = CountingClient()
+
+        with pytest.raises(FileNotFoundError, match="'nonexistent' not found"):
+            ComponentLoader(client).plan(["button", "nonexistent"])
+        assert client.reads == []
@@ -0,0 +1,58 @@
+"""Tests for the prebuilt registry index."""
+
+import json
+
+from starui.cli.list import installed_components
+from starui.registry.client import RegistryClient
+from starui.registry.component_metadata import COMPONENT_REGISTRY
+from starui.registry.index import (
+    COMPONENTS_PATH,
+    INDEX_FILE,
+    build_index,
+    load_index,
+    source_hash,
+)
+
+
+class TestRegistryIndex:
+    """Test the shipped index against the sources it is built from."""
+
+    def test_shipped_index_is_current(self):
+        """Regenerate with `python -m starui.registry.index` if this fails."""
+        shipped = json.loads((COMPONENTS_PATH / INDEX_FILE).read_text())
+        assert shipped["components"] == build_index()
+
+    def test_index_matches_component_registry(self):
+        index = load_index()
+
+        assert set(index) == set(COMPONENT_REGISTRY)
+        for name, entry in index.items():
+            metadata = COMPONENT_REGISTRY[name]
+            assert entry["description"] == metadata["description"]
+            assert entry["dependencies"] == metadata["dependencies"]
+            assert entry["handlers"] == metadata["handlers"]
+
+        source = (COMPONENTS_PATH / "button.py").read_bytes()
+        assert index["button"]["hash"] == source_hash(source)
+        assert index["button"]["size"] == len(source)
+        assert index["code_block"]["packages"] == ["starlighter"]
+
+    def test_registry_without_index(self, tmp_path):
+        (tmp_path / "__init__.py").write_text("")
+        (tmp_path / "utils.py").write_text("def cn(): ...\n")
+        (tmp_path / "widget.py").write_text('"""Widget."""\n')
+
+        client = RegistryClient(tmp_path)
+        assert client.list_components() == ["widget"]
+        assert client.component_exists("utils")
+        assert client.get_component_metadata("widget")["dependencies"] == []
+
+
+def test_installed_components(tmp_path, monkeypatch):
+    (tmp_path / "components" / "ui").mkdir(parents=True)
+    (tmp_path / "components" / "ui" / "button.py").write_text("")
+    (tmp_path / "ui").mkdir()
+    (tmp_path / "ui" / "card.py").write_text("")
+    monkeypatch.chdir(tmp_path)
+
+    assert installed_components() >= {"button", "card"}
@@ -0,0 +1,112 @@
+"""Tests for cached, lazy discovery of vendored components."""
+
+import os
+
+import pytest
+
+from starui.registry import local
+from starui.registry.local import (
+    LazyComponent,
+    discover_components,
+    discovered_files,
+    exported_names,
+    invalidate,
+)
+
+BUTTON = """
+from pathlib import Path
+
+Path(__file__).with_suffix(".loaded").touch()
+
+SIZES = {"sm": 1}
+LABEL = "Click"
+Alias = str.upper
+
+
+def Button(text):
+    return f"<button>{text}</button>"
+
+
+class Card:
+    pass
+
+
+def helper():
+    pass
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    ui = tmp_path / "components" / "ui"
+    ui.mkdir(parents=True)
+    (ui / "__init__.py").write_text("")
+    (ui / "button.py").write_text(BUTTON)
+    yield tmp_path
+    invalidate()
+
+
+def edit(path, source):
+    stat = path.stat()
+    path.write_text(source)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_exported_names():
+    assert exported_names(BUTTON) == ["Alias", "Button", "Card"]
+
+
+class TestDiscovery:
+    """Test static discovery and lazy imports."""
+
+    def test_modules_load_on_first_call(self, project):
+        ui = project / "components" / "ui"
+
+        components = discover_components(project)
+
+        assert set(components) == {"Alias", "Button", "Card"}
+        assert isinstance(components["Button"], LazyComponent)
+        assert not (ui / "button.loaded").exists()
+
+        assert components["Button"]("Go") == "<button>Go</button>"
+        assert (ui / "button.loaded").exists()
+        assert components["Button"].__name__ == "Button"
+        assert (ui / "button.py").resolve() in discovered_files()
+
+    def test_unchanged_files_are_not_parsed_again(self, project, monkeypatch):
+        discover_components(project)
+        calls = []
+        monkeypatch.setattr(
+            local, "exported_names", lambda source: calls.append(source) or []
+        )
+
+        discover_components(project)
+        assert calls == []
+
+        edit(project / "components" / "ui" / "button.py", BUTTON)
+        discover_components(project)
+        assert len(calls) == 1
+
+    def test_invalidate_picks_up_edits(self, project):
+        button = project / "components" / "ui" / "button.py"
+        component = discover_components(project)["Button"]
+        assert component("a") == "<button>a</button>"
+
+        edit(button, BUTTON.replace("<button>", "<button class='new'>"))
+        assert component("a") == "<button>a</button>"
+
+        invalidate([button])
+        assert component("a") == "<button class='new'>a</button>"
+
+    def test_import_errors_are_raised_on_call(self, project):
+        (project / "components" / "ui" / "broken.py").write_text(
+            "import not_a_module\n\ndef Broken():\n    pass\n"
+        )
+
+        components = discover_components(project)
+
+        with pytest.raises(ImportError):
+            components["Broken"]()
+
+    def test_missing_directory(self, tmp_path):
+        assert discover_components(tmp_path) == {}
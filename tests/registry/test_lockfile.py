@@ -0,0 +1,109 @@
+"""Tests for the vendored component lockfile."""
+
+import pytest
+
+from starui.registry.client import RegistryClient
+from starui.registry.index import load_index, write_index
+from starui.registry.loader import ComponentLoader
+from starui.registry.lockfile import (
+    Lockfile,
+    plan_updates,
+    text_hash,
+    vendored_source,
+    write_atomic,
+)
+
+BUTTON = "from .utils import cn\n\n\ndef Button():\n    return cn('btn')\n"
+
+
+@pytest.fixture
+def registry(tmp_path):
+    path = tmp_path / "registry"
+    path.mkdir()
+    (path / "utils.py").write_text("def cn(*classes):\n    return ' '.join(classes)\n")
+    (path / "button.py").write_text(BUTTON)
+    yield path
+    load_index.cache_clear()
+
+
+def publish(registry, name, source):
+    (registry / f"{name}.py").write_text(source)
+    write_index(registry)
+    load_index.cache_clear()
+
+
+@pytest.fixture
+def project(tmp_path, registry):
+    """A project with utils and button vendored and locked."""
+    root = tmp_path / "project"
+    loader = ComponentLoader(RegistryClient(registry))
+    lock = Lockfile.load(root)
+    files = {}
+    for name, source in loader.load_plan(loader.plan(["button"])).items():
+        content = vendored_source(source)
+        files[root / "ui" / f"{name}.py"] = content
+        lock.record(name, loader.client.index[name]["hash"], content)
+    write_atomic({**files, lock.path: lock.dumps()})
+    return root
+
+
+def statuses(registry, root, names=None):
+    loader = ComponentLoader(RegistryClient(registry))
+    updates = plan_updates(loader, Lockfile.load(root), root / "ui", names)
+    return {update.name: update for update in updates}
+
+
+class TestPlanUpdates:
+    """Test comparing the registry, the lockfile and vendored files."""
+
+    def test_unchanged_components_are_not_read(self, registry, project):
+        updates = statuses(registry, project)
+
+        assert {name: u.status for name, u in updates.items()} == {
+            "utils": "unchanged",
+            "button": "unchanged",
+        }
+        assert all(update.content is None for update in updates.values())
+
+    def test_registry_change_updates_clean_files(self, registry, project):
+        publish(registry, "button", BUTTON.replace("btn", "button"))
+
+        update = statuses(registry, project)["button"]
+        assert update.status == "update"
+        assert "from starui import cn" in update.content
+
+    def test_local_edits_are_kept_until_upstream_changes(self, registry, project):
+        button = project / "ui" / "button.py"
+        button.write_text(button.read_text() + "# local tweak\n")
+        assert statuses(registry, project)["button"].status == "unchanged"
+
+        publish(registry, "button", BUTTON.replace("btn", "button"))
+        update = statuses(registry, project)["button"]
+
+        assert update.status == "modified"
+        assert "-# local tweak" in update.diff()
+        assert "+    return cn('button')" in update.diff()
+
+    def test_missing_files_and_dependencies(self, registry, project):
+        (project / "ui" / "utils.py").unlink()
+
+        assert statuses(registry, project, ["button"])["utils"].status == "missing"
+
+    def test_unlocked_identical_file(self, registry, project):
+        (project / "starui.lock").unlink()
+
+        update = statuses(registry, project)["button"]
+        assert update.status == "unchanged"
+        assert text_hash(update.content) == text_hash(
+            (project / "ui" / "button.py").read_text()
+        )
+
+
+def test_write_atomic_writes_nothing_on_failure(tmp_path):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+
+    with pytest.raises(OSError):
+        write_atomic({tmp_path / "a.py": "a", blocker / "b.py": "b"})
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["blocker"]
@@ -0,0 +1,176 @@
+"""Tests for the remote registry client against a local HTTP server."""
+
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from starui.registry.client import RegistryClient, get_registry_client
+from starui.registry.index import COMPONENTS_PATH
+from starui.registry.loader import ComponentLoader
+from starui.registry.remote import RemoteRegistryClient, RemoteRegistryError
+
+
+class Registry(ThreadingHTTPServer):
+    """Serves the bundled components with ETags, recording each request."""
+
+    def __init__(self, delay=0.0):
+        super().__init__(("127.0.0.1", 0), RegistryHandler)
+        self.files = {
+            path.name: path.read_bytes()
+            for path in COMPONENTS_PATH.iterdir()
+            if path.suffix in (".py", ".json")
+        }
+        self.delay = delay
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}/registry"
+
+
+class RegistryHandler(BaseHTTPRequestHandler):
+    server: Registry
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        time.sleep(server.delay)
+
+        name = self.path.removeprefix("/registry/")
+        content = server.files.get(name)
+        etag = f'"{hashlib.sha256(content or b"").hexdigest()[:16]}"'
+        if content is None:
+            status = 404
+        elif self.headers.get("If-None-Match") == etag:
+            status = 304
+        else:
+            status = 200
+
+        self.send_response(status)
+        if content is not None:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(content or b"")))
+        self.end_headers()
+        if status == 200:
+            self.wfile.write(content)
+
+        with server.lock:
+            server.requests.append((name, status))
+            server.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = Registry()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestRemoteRegistry:
+    """Test fetching, caching and offline use."""
+
+    def test_same_interface_as_local(self, server, tmp_path):
+        remote = RemoteRegistryClient(server.url, cache_dir=tmp_path)
+        local = RegistryClient()
+
+        assert remote.list_components() == local.list_components()
+        assert remote.get_component_metadata("theme_toggle") == (
+            local.get_component_metadata("theme_toggle")
+        )
+        assert remote.get_component_source("button") == (
+            local.get_component_source("button")
+        )
+        with pytest.raises(FileNotFoundError):
+            remote.get_component_source("nonexistent")
+
+    def test_cache_is_revalidated_and_reused(self, server, tmp_path):
+        first = RemoteRegistryClient(server.url, cache_dir=tmp_path)
+        first.get_component_sources(["utils", "button"])
+        server.requests.clear()
+
+        second = RemoteRegistryClient(server.url, cache_dir=tmp_path)
+        sources = second.get_component_sources(["utils", "button"])
+
+        assert server.requests == [("index.json", 304)]
+        assert sources == first.get_component_sources(["utils", "button"])
+
+    def test_dependency_set_is_fetched_concurrently(self, server, tmp_path):
+        server.delay = 0.2
+        loader = ComponentLoader(RemoteRegistryClient(server.url, cache_dir=tmp_path))
+        plan = loader.plan(["theme_toggle", "dialog", "badge", "card"])
+
+        sources = loader.load_plan(plan)
+
+        assert list(sources) == plan.order
+        assert server.max_active > 1
+        assert sorted(name for name, _ in server.requests) == sorted(
+            ["index.json", *(f"{name}.py" for name in plan.order)]
+        )
+
+    def test_offline(self, server, tmp_path):
+        RemoteRegistryClient(server.url, cache_dir=tmp_path).get_component_source(
+            "button"
+        )
+        server.requests.clear()
+
+        offline = RemoteRegistryClient(server.url, cache_dir=tmp_path, offline=True)
+        assert "def Button" in offline.get_component_source("button")
+        with pytest.raises(RemoteRegistryError, match="not cached"):
+            offline.get_component_source("card")
+        assert server.requests == []
+
+    def test_unreachable_registry_uses_cache(self, server, tmp_path):
+        url = server.url
+        RemoteRegistryClient(url, cache_dir=tmp_path).get_component_source("button")
+        server.shutdown()
+        server.server_close()
+
+        client = RemoteRegistryClient(url, cache_dir=tmp_path, timeout=1)
+        assert "def Button" in client.get_component_source("button")
+        with pytest.raises(RemoteRegistryError, match="Failed to fetch"):
+            client.get_component_source("card")
+
+    def test_source_must_match_index(self, server, tmp_path):
+        server.files["button.py"] += b"# tampered\n"
+
+        client = RemoteRegistryClient(server.url, cache_dir=tmp_path)
+        with pytest.raises(RemoteRegistryError, match="does not match"):
+            client.get_component_source("button")
+
+    @pytest.mark.parametrize("name", ["../../evil", "/etc/cron", "Button", ""])
+    def test_component_names_are_validated(self, server, tmp_path, name):
+        index = json.loads(server.files["index.json"])
+        index["components"][name] = index["components"]["button"]
+        server.files["index.json"] = json.dumps(index).encode()
+
+        client = RemoteRegistryClient(server.url, cache_dir=tmp_path / "cache")
+        with pytest.raises(RemoteRegistryError, match="Invalid component name"):
+            client.list_components()
+        assert not (tmp_path / "evil.py").exists()
+
+
+def test_registry_url_from_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("STARUI_REGISTRY_URL", "http://registry.invalid/ui")
+    monkeypatch.setenv("STARUI_OFFLINE", "1")
+
+    client = get_registry_client()
+    assert isinstance(client, RemoteRegistryClient)
+    assert client.offline
+
+    monkeypatch.delenv("STARUI_REGISTRY_URL")
+    assert type(get_registry_client()) is RegistryClient
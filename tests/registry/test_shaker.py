@@ -0,0 +1,154 @@
+"""Tests for tree-shaken vendoring."""
+
+import ast
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from starui.cli.main import app
+from starui.registry.shaker import module_usage, project_usage, shake, shake_components
+
+SOURCE = '''"""Card component."""
+
+from typing import Any
+
+from rusty_tags import Div, Span
+
+from starui import cn, cva
+
+card_variants = cva(base="card")
+
+HEADER = "card-header"
+
+
+def _slot(name):
+    return f"card-{name}"
+
+
+def Card(*children, **attrs: Any):
+    return Div(*children, cls=cn(card_variants()), data_slot=_slot("card"))
+
+
+# Header of a card
+def CardHeader(*children):
+    return Div(*children, cls=HEADER)
+
+
+def CardBadge(text):
+    return Span(text)
+'''
+
+
+def defined(source):
+    return {
+        node.name
+        for node in ast.parse(source).body
+        if isinstance(node, ast.FunctionDef)
+    }
+
+
+class TestShake:
+    """Test reducing a module to what its used names need."""
+
+    def test_keeps_reachable_definitions_and_tables(self):
+        shaken = shake(SOURCE, ["Card"])
+
+        assert defined(shaken) == {"_slot", "Card"}
+        assert "card_variants = cva(" in shaken
+        assert "HEADER" not in shaken
+        assert "from rusty_tags import Div\n" in shaken
+        assert "from starui import cn, cva" in shaken
+        compile(shaken, "card.py", "exec")
+
+    def test_keeps_original_text_and_comments(self):
+        shaken = shake(SOURCE, ["CardHeader"])
+
+        assert shaken.startswith("# Tree-shaken by `star add --shake` for: CardHeader")
+        assert '"""Card component."""' in shaken
+        assert "# Header of a card\ndef CardHeader" in shaken
+        assert "from typing import Any" not in shaken
+        assert "cva" not in shaken
+
+    def test_filters_all(self):
+        source = SOURCE + '\n__all__ = ["Card", "CardHeader", "CardBadge"]\n'
+
+        assert '__all__ = ["CardBadge"]' in shake(source, ["CardBadge"])
+
+
+class TestUsage:
+    """Test finding the names a project uses from component modules."""
+
+    def usage(self, source):
+        return module_usage(ast.parse(source), {"card", "button"})
+
+    def test_from_imports(self):
+        source = "from components.ui.card import Card, CardHeader as H\n"
+        assert self.usage(source) == {"card": {"Card", "CardHeader"}}
+
+    def test_module_attributes(self):
+        source = "from components.ui import card\n\ncard.Card(card.CardHeader())\n"
+        assert self.usage(source) == {"card": {"Card", "CardHeader"}}
+
+    def test_star_import_and_escaping_module_use_everything(self):
+        assert self.usage("from components.ui.card import *\n") == {"card": None}
+        source = "import components.ui.button as b\n\nregister(b)\n"
+        assert self.usage(source) == {"button": None}
+
+    def test_project_usage_skips_excluded_dirs(self, tmp_path):
+        (tmp_path / "app.py").write_text("from components.ui.card import Card\n")
+        vendored = tmp_path / "components" / "ui"
+        vendored.mkdir(parents=True)
+        (vendored / "other.py").write_text("from .card import CardBadge\n")
+
+        usage = project_usage(tmp_path, {"card"}, exclude=vendored)
+
+        assert usage == {"card": {"Card"}}
+
+
+def test_shake_components_follows_sibling_imports():
+    sources = {
+        "utils": "def cn(*c):\n    return ' '.join(c)\n",
+        "card": SOURCE,
+        "panel": "from .card import CardHeader\n\n\ndef Panel():\n    return CardHeader()\n",
+        "unused": "def Unused():\n    pass\n",
+    }
+
+    shaken = shake_components(sources, {"panel": {"Panel"}})
+
+    assert list(shaken) == ["utils", "card", "panel"]
+    assert shaken["utils"] == (sources["utils"], None)
+    assert shaken["card"][1] == ["CardHeader"]
+    assert defined(shaken["card"][0]) == {"CardHeader"}
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo"\n')
+    (tmp_path / "app.py").write_text(
+        "from components.ui.dropdown_menu import DropdownMenu\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_add_shake_is_rerunnable_as_usage_grows(project):
+    vendored = project / "components" / "ui" / "dropdown_menu.py"
+
+    result = CliRunner().invoke(app, ["add", "dropdown-menu", "--shake"])
+    assert result.exit_code == 0, result.output
+    assert defined(vendored.read_text()) == {"DropdownMenu"}
+    lock = json.loads((project / "starui.lock").read_text())
+    assert lock["components"]["dropdown_menu"]["names"] == ["DropdownMenu"]
+    assert "button" not in lock["components"]
+
+    with open(project / "app.py", "a") as f:
+        f.write("from components.ui.dropdown_menu import DropdownMenuTrigger\n")
+    result = CliRunner().invoke(app, ["update"])
+    assert result.exit_code == 0, result.output
+
+    assert defined(vendored.read_text()) == {"DropdownMenu", "DropdownMenuTrigger"}
+    result = CliRunner().invoke(app, ["add", "dropdown-menu", "--shake"])
+    assert result.exit_code == 0, result.output
+    assert "existing files" not in result.output
+    assert (project / "components" / "ui" / "button.py").exists()
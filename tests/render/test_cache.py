@@ -0,0 +1,161 @@
+"""Tests for memoized rendering of pure components."""
+
+import threading
+import timeit
+
+import pytest
+from rusty_tags import Span
+
+from starui.icons.sprite import icon_sprite
+from starui.registry.components.badge import Badge
+from starui.registry.components.button import Button
+from starui.registry.components.utils import Icon, set_cn_merge
+from starui.render import cache
+from starui.render.cache import (
+    memoized,
+    render_cache_clear,
+    render_cache_info,
+    set_render_cache,
+)
+from starui.render.ids import new_id
+
+
+@pytest.fixture(autouse=True)
+def render_cache():
+    set_render_cache(True)
+    render_cache_clear()
+    yield
+    set_render_cache(False)
+    set_cn_merge(False)
+
+
+def test_repeated_calls_are_served_from_cache():
+    first = Button("Save", variant="outline", cls="w-full")
+
+    assert Button("Save", variant="outline", cls="w-full") is first
+    assert Button("Save", variant="ghost", cls="w-full") is not first
+    assert render_cache_info()[:3] == (1, 2, 0)
+
+
+def test_rendered_children_are_keyed_by_markup():
+    first = Badge(Span("New"), variant="secondary")
+
+    assert Badge(Span("New"), variant="secondary") is first
+    assert str(Badge(Span("Old"), variant="secondary")) != str(first)
+
+
+def test_unhashable_arguments_bypass_the_cache():
+    Button("Go", data_items=["a"])
+
+    assert render_cache_info().bypasses == 1
+    assert render_cache_info().currsize == 0
+
+
+def test_generated_ids_bypass_the_cache():
+    @memoized
+    def Field(label):
+        return Span(label, id=f"field_{new_id()}")
+
+    @memoized
+    def Row(label):
+        return Span(Field(label))
+
+    assert str(Row("Name")) != str(Row("Name"))
+    assert render_cache_info()[:3] == (0, 0, 4)
+
+
+def test_ids_generated_elsewhere_meanwhile_dont_bypass():
+    started, release = threading.Event(), threading.Event()
+
+    @memoized
+    def Slow(label):
+        started.set()
+        release.wait(5)
+        return Span(label)
+
+    thread = threading.Thread(target=Slow, args=("a",))
+    thread.start()
+    started.wait(5)
+    new_id()  # In another render, concurrently
+    release.set()
+    thread.join()
+
+    assert render_cache_info()[:3] == (0, 1, 0)
+
+
+def test_sprite_icons_bypass_the_cache():
+    @memoized
+    def Done():
+        return Button(Icon("check"), "Done")
+
+    for _ in range(2):
+        with icon_sprite() as sheet:
+            Done()
+        assert list(sheet.icons) == ["check"]
+
+    assert render_cache_info().bypasses == 2
+
+
+def test_merge_default_is_part_of_the_key():
+    assert "h-9" in str(Button("Go", cls="h-12"))
+
+    set_cn_merge(True)
+    assert "h-9" not in str(Button("Go", cls="h-12"))
+
+
+def test_cache_is_bounded_lru(monkeypatch):
+    monkeypatch.setattr(cache, "RENDER_CACHE_SIZE", 2)
+
+    a = Badge("a")
+    Badge("b")
+    assert Badge("a") is a  # Refreshes "a"
+    Badge("c")  # Evicts "b"
+
+    assert Badge("a") is a
+    assert render_cache_info().currsize == 2
+    assert render_cache_info().misses == 3
+    Badge("b")
+    assert render_cache_info().misses == 4
+
+
+def test_hits_survive_concurrent_evictions(monkeypatch):
+    monkeypatch.setattr(cache, "RENDER_CACHE_SIZE", 1)
+    errors = []
+
+    def render(label):
+        try:
+            for _ in range(2000):
+                Badge(label)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=render, args=(c,)) for c in "abcd"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert render_cache_info().currsize == 1
+
+
+def test_off_by_default():
+    set_render_cache(False)
+
+    assert Button("Save") is not Button("Save")
+    assert render_cache_info() == (0, 0, 0, cache.RENDER_CACHE_SIZE, 0)
+
+
+def test_microbenchmark():
+    """A cached nav button beats rendering it every call."""
+    nav = ("Dashboard",)
+    attrs = {"variant": "ghost", "size": "sm", "cls": "justify-start"}
+
+    def best(fn):
+        return min(timeit.repeat(fn, number=2000, repeat=5)) / 2000 * 1e6
+
+    cached = best(lambda: Button(*nav, **attrs))
+    set_render_cache(False)
+    uncached = best(lambda: Button(*nav, **attrs))
+    print(f"\nButton: {uncached:.2f}us -> {cached:.2f}us per call")
+    assert cached < uncached
@@ -0,0 +1,143 @@
+"""Tests for collecting and hoisting scripts and styles per response."""
+
+import asyncio
+
+import pytest
+from rusty_tags import Body, Div, Head, Html, Script, Style, Title
+
+from starui.registry.components.utils import Icon
+from starui.render.cache import memoized, render_cache_info, set_render_cache
+from starui.render.context import render_context, require_asset, with_render_context
+from starui.render.ids import new_id
+from starui.render.stream import stream
+
+
+def Widget(label):
+    return Div(
+        require_asset("widget-styles", Style(".widget{color:red}")),
+        require_asset("widget-script", Script("initWidgets()"), "body"),
+        label,
+        id=f"widget_{new_id()}",
+        cls="widget",
+    )
+
+
+def page(*content):
+    return Html(Head(Title("Page")), Body(*content))
+
+
+def test_inline_outside_a_context():
+    markup = str(Div(Widget("a"), Widget("b")))
+
+    assert markup.count("<style>") == 2
+    assert markup.count("<script>") == 2
+
+
+def test_collected_once_and_hoisted():
+    with render_context() as context:
+        body = page(Widget("a"), Widget("b"))
+    markup = str(context.hoist(body))
+
+    assert markup.count("<style>") == 1
+    assert markup.count("<script>") == 1
+    assert markup.index("<style>") < markup.index("</head>")
+    assert markup.index("</div><script>") < markup.index("</body>")
+    assert 'id="widget_1"' in markup
+    assert 'id="widget_2"' in markup
+
+
+def test_fragments_without_head_or_body():
+    with render_context() as context:
+        fragment = Widget("a")
+    markup = str(context.hoist(fragment))
+
+    assert markup.startswith("<style>")
+    assert markup.endswith("</div><script>initWidgets()</script>")
+
+
+def test_responses_are_byte_stable():
+    @with_render_context
+    def route():
+        return page(Widget("a"), Div(Widget("b"), data_show="true", title="t"))
+
+    assert str(route()) == str(route())
+
+
+def test_every_response_gets_its_assets():
+    @with_render_context
+    def route():
+        return page(Widget("a"))
+
+    assert str(route()).count("<style>") == 1
+    assert str(route()).count("<style>") == 1  # Not lost after the first request
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_collect_their_own():
+    @with_render_context
+    async def route(name, delay):
+        first = require_asset(f"{name}-early", Style(f".{name}{{}}"))
+        await asyncio.sleep(delay)
+        return page(first, Widget(name), require_asset(f"{name}-late", Style("")))
+
+    a, b = await asyncio.gather(route("a", 0.02), route("b", 0.01))
+
+    for markup, name, other in [(str(a), "a", "b"), (str(b), "b", "a")]:
+        assert f".{name}{{}}" in markup
+        assert f".{other}{{}}" not in markup
+        assert markup.count("<style>") == 3
+        assert 'id="widget_1"' in markup
+
+
+def test_handler_scripts_per_response():
+    from starui.registry.dependencies import require_handler
+
+    for _ in range(2):
+        with render_context() as context:
+            assert require_handler("scroll") is None
+            assert require_handler("scroll") is None
+        assert str(context.hoist(page())).count("starui-scroll-handler") == 1
+    assert require_handler("scroll") is not None
+
+
+def test_calendar_styles_once_per_page():
+    from starui.registry.components.calendar import Calendar
+    from starui.render.context import _markup
+
+    with render_context() as context:
+        calendars = "".join(_markup(Calendar()) for _ in range(3))
+
+    assert "<style" not in calendars
+    assert str(context.hoist(calendars)).count("<style") == 1
+
+
+def test_sprite_sheet_is_hoisted():
+    @with_render_context(sprite=True)
+    def route():
+        return page(Icon("check"), Icon("check"))
+
+    markup = str(route())
+    assert markup.count("<symbol") == 1
+    assert markup.index("<symbol") < markup.index("</body>")
+
+
+def test_memoized_components_requiring_assets_are_not_cached():
+    Cached = memoized(lambda label: Div(require_asset("x", Style("")), label))
+    set_render_cache(True)
+    try:
+        for _ in range(2):
+            with render_context() as context:
+                Cached("a")
+            assert context.assets["head"]
+        assert render_cache_info().hits == 0
+    finally:
+        set_render_cache(False)
+
+
+def test_streamed_pages_are_rejected():
+    @with_render_context
+    def route():
+        return stream(Body, iter([Widget("a")]))
+
+    with pytest.raises(TypeError, match="HtmlStream"):
+        route()
@@ -0,0 +1,38 @@
+"""Tests for deterministic attribute order."""
+
+from rusty_tags import Div, Input, Script
+
+from starui.render.html import sort_attributes
+
+
+def test_attributes_are_sorted_by_name():
+    markup = str(Div(Input(type="checkbox", checked=True), id="a", cls="x", title="t"))
+
+    assert sort_attributes(markup) == (
+        '<div class="x" id="a" title="t"><input checked type="checkbox"></input></div>'
+    )
+
+
+def test_values_comments_and_raw_text_are_kept():
+    markup = (
+        '<a z="1" data-on:click="a > b && c" b=\'x y\'>'
+        "<!-- <b z a> -->"
+        '<script z a>if (a<b) { s = "<i z a>" }</script>'
+        "<style>p>a{}</style></a>"
+    )
+
+    assert sort_attributes(markup) == (
+        '<a b=\'x y\' data-on:click="a > b && c" z="1">'
+        "<!-- <b z a> -->"
+        '<script a z>if (a<b) { s = "<i z a>" }</script>'
+        "<style>p>a{}</style></a>"
+    )
+
+
+def test_unparseable_tags_are_left_alone():
+    markup = '<p title="say "hi"" id="x">t</p>'
+
+    assert sort_attributes(markup) == markup
+    assert sort_attributes(str(Script("x", src="s", type="module"))) == (
+        '<script src="s" type="module">x</script>'
+    )
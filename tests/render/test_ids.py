@@ -0,0 +1,77 @@
+"""Tests for request-scoped ID and signal name generation."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from starui.render.context import render_context
+from starui.render.html import sort_attributes
+from starui.render.ids import counter_ids, id_scope, new_id
+
+COMPONENTS = Path(__file__).parents[2] / "src" / "starui" / "registry" / "components"
+
+
+def page() -> str:
+    from starui.registry.components.accordion import Accordion, AccordionItem
+    from starui.registry.components.checkbox import Checkbox
+    from starui.registry.components.input import InputWithLabel
+    from starui.registry.components.select import (
+        Select,
+        SelectContent,
+        SelectItem,
+        SelectTrigger,
+    )
+    from starui.registry.components.tabs import Tabs, TabsContent, TabsList
+
+    return "".join(
+        map(
+            str,
+            [
+                Accordion(AccordionItem("Body", summary="Q")),
+                Checkbox(),
+                InputWithLabel("Name"),
+                Select(SelectTrigger(), SelectContent(SelectItem("a", "A"))),
+                Tabs(TabsList(), TabsContent("Panel", id="one"), default_id="one"),
+            ],
+        )
+    )
+
+
+def render() -> str:
+    with render_context() as context:
+        content = page()
+    return str(context.hoist(content))
+
+
+def test_counter_is_scoped():
+    with id_scope():
+        assert [new_id(), new_id()] == ["1", "2"]
+        with id_scope(counter_ids("frag")):
+            assert new_id() == "frag1"
+        assert new_id() == "3"
+
+    assert re.fullmatch(r"[0-9a-f]{8}", new_id())
+
+
+def test_custom_generator():
+    with id_scope(lambda: "fixed") as generator:
+        assert new_id() == generator() == "fixed"
+
+
+def test_pages_render_the_same_bytes_per_response():
+    first = render()
+
+    assert render() == first
+    assert "accordion-item-1" in first
+    assert "tabs_7" in first
+    assert sort_attributes(page()) != sort_attributes(page())  # Random IDs
+
+
+@pytest.mark.parametrize("path", sorted(COMPONENTS.glob("*.py")), ids=lambda p: p.stem)
+def test_components_use_new_id(path):
+    source = path.read_text(encoding="utf-8")
+
+    if path.stem != "utils":
+        assert "uuid" not in source
+    assert "itertools import count" not in source
@@ -0,0 +1,134 @@
+"""Tests for streaming rendering of containers with iterable children."""
+
+import time
+import tracemalloc
+
+import pytest
+from rusty_tags import Body, Div, Head, Html, Link, Title
+
+from starui.registry.components.card import Card, CardContent, CardHeader
+from starui.registry.components.table import (
+    Table,
+    TableBody,
+    TableCell,
+    TableHead,
+    TableHeader,
+    TableRow,
+)
+from starui.render.html import sort_attributes
+from starui.render.stream import HtmlStream, stream
+
+ROWS = 5000
+
+
+def rows(n=ROWS):
+    for i in range(n):
+        yield TableRow(TableCell(f"Row {i}"), TableCell(f"{i * 7}"))
+
+
+async def arows(n=ROWS):
+    for row in rows(n):
+        yield row
+
+
+def page(body_rows):
+    return stream(
+        Html,
+        Head(Title("Report"), Link(rel="stylesheet", href="/static/css/starui.css")),
+        stream(
+            Body,
+            Table(
+                TableHeader(TableRow(TableHead("Name"), TableHead("Value"))),
+                TableBody(body_rows),
+            ),
+        ),
+    )
+
+
+def test_streams_the_same_markup():
+    streamed = page(rows(50))
+    direct = Html(
+        Head(Title("Report"), Link(rel="stylesheet", href="/static/css/starui.css")),
+        Body(
+            Table(
+                TableHeader(TableRow(TableHead("Name"), TableHead("Value"))),
+                TableBody(*rows(50)),
+            )
+        ),
+    )
+
+    assert isinstance(streamed, HtmlStream)
+    markup = str(streamed)
+    assert sort_attributes(markup) == sort_attributes(str(direct))
+    assert markup.count("<tr") == 51
+    assert markup.index("</head>") < markup.index("Row 0") < markup.index("Row 49")
+    assert markup.endswith("</table></div></body></html>")
+
+
+def test_head_is_flushed_before_rows_are_built():
+    pulled = []
+
+    def tracked():
+        for row in rows(3):
+            pulled.append(row)
+            yield row
+
+    chunks = iter(page(tracked()))
+    first = next(chunks)
+
+    assert "</head>" in first
+    assert 'href="/static/css/starui.css"' in first
+    assert "<tbody" in first
+    assert not pulled
+    assert "Row 2" in "".join(chunks)
+
+
+@pytest.mark.asyncio
+async def test_async_children():
+    chunks = [chunk async for chunk in page(arows(100))]
+
+    assert "Row 99" in chunks[-1]
+    assert "".join(chunks).count("<tr") == 101
+    with pytest.raises(TypeError, match="async for"):
+        str(page(arows(1)))
+
+
+def test_static_children_render_as_usual():
+    assert not isinstance(Card(CardHeader("Title"), CardContent("Body")), HtmlStream)
+    nested = Card(CardHeader("Title"), CardContent(Div(f"item {i}") for i in range(3)))
+    assert isinstance(nested, HtmlStream)
+    assert "item 2</div></div></div>" in str(nested)
+
+
+def test_containers_must_render_streams_once():
+    with pytest.raises(ValueError, match="exactly once"):
+        stream(lambda *children: Div(*children, *children), iter([]))
+    with pytest.raises(ValueError, match="exactly once"):
+        stream(lambda *children: Div(), iter([]))
+
+
+def test_first_byte_and_peak_memory():
+    """A 5,000-row table starts sooner and peaks lower when streamed."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    full = len(str(page(list(rows()))))
+    full_time = time.perf_counter() - start
+    full_peak = tracemalloc.get_traced_memory()[1]
+
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    chunks = iter(page(rows()))
+    next(chunks)
+    first_byte = time.perf_counter() - start
+    size = sum(map(len, chunks))
+    stream_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(
+        f"\n{ROWS} rows: first byte {full_time * 1e3:.1f}ms -> "
+        f"{first_byte * 1e3:.2f}ms, peak {full_peak >> 10}KiB -> "
+        f"{stream_peak >> 10}KiB"
+    )
+    assert size < full  # The first chunk was consumed above
+    assert first_byte * 10 < full_time
+    assert stream_peak * 4 < full_peak
@@ -0,0 +1,213 @@
+"""Tests for hoisting static subtrees out of component calls."""
+
+import timeit
+
+import pytest
+from rusty_tags import H1, A, Aside, Div, Footer, Header, HtmlString, Main, Nav, P
+
+from starui.icons.sprite import icon_sprite
+from starui.registry.components.badge import Badge
+from starui.registry.components.button import Button
+from starui.registry.components.card import (
+    Card,
+    CardContent,
+    CardDescription,
+    CardFooter,
+    CardHeader,
+    CardTitle,
+)
+from starui.registry.components.separator import Separator
+from starui.registry.components.utils import Icon, set_cn_merge
+from starui.render.html import sort_attributes
+from starui.render.ids import new_id
+from starui.render.template import template
+
+SECTIONS = ["Getting started", "Components", "Blocks", "Themes"]
+
+
+def layout(title, body, user, active="Components"):
+    """A docs-style page: header, sidebar, a card and a footer around 3 slots."""
+    return Div(
+        Header(
+            Nav(
+                *(
+                    Button(label, variant="secondary" if label == active else "ghost")
+                    for label in SECTIONS
+                ),
+                cls="flex items-center gap-2",
+            ),
+            Div(Icon("search", cls="size-4"), Badge(user), cls="ml-auto flex gap-2"),
+            cls="sticky top-0 z-50 flex h-14 items-center border-b px-6",
+        ),
+        Div(
+            Aside(
+                *(
+                    Div(
+                        P(section, cls="mb-1 text-sm font-semibold"),
+                        *(
+                            A(
+                                f"{section} {i}",
+                                href=f"/docs/{section.lower()}/{i}",
+                                cls="block rounded-md px-2 py-1 text-sm hover:bg-accent",
+                            )
+                            for i in range(8)
+                        ),
+                        Separator(cls="my-2"),
+                    )
+                    for section in SECTIONS
+                ),
+                cls="w-64 shrink-0 border-r p-4",
+            ),
+            Main(
+                H1(title, cls="text-3xl font-bold tracking-tight"),
+                Card(
+                    CardHeader(
+                        CardTitle(title), CardDescription("Rendered from a template")
+                    ),
+                    CardContent(body),
+                    CardFooter(
+                        Button("Previous", variant="outline"),
+                        Button("Next", cls="ml-auto"),
+                    ),
+                ),
+                cls="flex-1 p-8",
+            ),
+            cls="flex",
+        ),
+        Footer(
+            P("Built with StarHTML", cls="text-sm text-muted-foreground"),
+            cls="border-t py-6 text-center",
+        ),
+        data_page=title,
+    )
+
+
+Page = template("title", "body", "user")(layout)
+
+
+def test_renders_like_the_component():
+    body = P("Hello <b>there</b>")
+    for active in ["Components", "Themes"]:
+        hoisted = str(Page("Cards", body, "ada", active=active))
+        direct = str(layout("Cards", body, "ada", active=active))
+
+        assert sort_attributes(hoisted) == sort_attributes(direct)
+        assert hoisted.count("ada") == direct.count("ada") == 1
+        assert 'data-page="Cards"' in hoisted
+    assert Page.cache_info().currsize == 2
+
+
+def test_holes_fill_positionally_by_keyword_and_by_default():
+    @template("label", "href")
+    def Link(label, href="#", cls=""):
+        return A(label, href=href, cls=f"link {cls}")
+
+    home = str(Link("Home"))
+    assert home.startswith("<a") and home.endswith(">Home</a>")
+    assert 'href="#"' in home
+    assert "Docs" in str(Link(label="Docs", href="/docs", cls="x"))
+    assert 'href="/docs"' in str(Link("Docs", "/docs"))
+    assert Link.cache_info().misses == 2  # cls="" and cls="x"
+
+
+def test_unfillable_values_fall_back_to_a_full_render():
+    Page.cache_clear()
+
+    assert "list-item" in str(Page("T", [HtmlString("<i>list-item</i>")], "u"))
+    assert Page.cache_info().currsize == 0
+    with pytest.raises(TypeError):
+        Page("T", "body")
+
+
+def test_errors_raised_by_the_component_propagate():
+    calls = []
+
+    @template("label")
+    def Sized(label, size=1):
+        calls.append(label)
+        if isinstance(size, str):
+            raise TypeError("size must be a number")
+        return Div(label, data_size=str(size))
+
+    with pytest.raises(TypeError, match="size"):
+        Sized("a", size="big")
+    assert calls == ["\x000\x00"]  # Raised while compiling, not retried
+
+    assert 'data-size="[1]"' in str(Sized("b", size=[1]))  # Unhashable
+    assert calls[1:] == ["b"]
+
+
+def test_holes_used_in_logic_are_rejected():
+    @template("variant")
+    def Styled(variant):
+        return Button("Go", variant=variant)
+
+    with pytest.raises(ValueError, match="variant"):
+        Styled("outline")
+
+
+def test_named_parameters_only():
+    with pytest.raises(TypeError, match="no parameter"):
+        template("missing")(layout)
+    with pytest.raises(TypeError, match="named parameters"):
+        template("cls")(Button)
+
+
+def test_generated_ids_and_sprites_are_not_hoisted():
+    @template("label")
+    def Field(label):
+        return Div(label, id=f"field_{new_id()}")
+
+    assert str(Field("a")) != str(Field("a"))
+    Page.cache_clear()
+    for _ in range(2):
+        with icon_sprite() as sheet:
+            assert "<use" in str(Page("T", "B", "u"))
+        assert list(sheet.icons) == ["search"]
+    assert Page.cache_info().currsize == 0
+    assert "<use" not in str(Page("T", "B", "u"))
+
+
+def test_sprite_renders_are_not_compiled_twice():
+    calls = []
+
+    @template("label")
+    def Search(label):
+        calls.append(label)
+        return Div(Icon("search"), label)
+
+    for _ in range(3):
+        with icon_sprite():
+            assert "<use" in str(Search("a"))
+    # One failed compile, then one render per call
+    assert len(calls) == 4
+    calls.clear()
+    assert "<use" not in str(Search("a"))
+    assert "<use" not in str(Search("b"))
+    assert calls == ["\x000\x00"]  # Compiled once outside the sheet
+
+
+def test_recompiles_when_merge_default_changes():
+    @template("label")
+    def Tall(label):
+        return Button(label, cls="h-12")
+
+    assert "h-9" in str(Tall("Go"))
+    set_cn_merge(True)
+    try:
+        assert "h-9" not in str(Tall("Go"))
+    finally:
+        set_cn_merge(False)
+
+
+def test_microbenchmark():
+    """A hoisted layout beats rebuilding the tree on every request."""
+    body = P("Per-request content")
+
+    def best(fn):
+        return min(timeit.repeat(fn, number=200, repeat=5)) / 200 * 1e6
+
+    direct = best(lambda: layout("Cards", body, "ada"))
+    hoisted = best(lambda: Page("Cards", body, "ada"))
+    print(f"\nlayout: {direct:.1f}us -> {hoisted:.1f}us per render")
+    assert hoisted * 5 < direct
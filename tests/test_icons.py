@@ -0,0 +1,200 @@
+"""Tests for server-side icon rendering."""
+
+import ast
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from starui.icons import (
+    build_index,
+    icon_body,
+    icon_name,
+    load_icons,
+    render_icon,
+    write_index,
+)
+from starui.icons.sprite import icon_sprite, sprite_file, with_icon_sprite
+from starui.registry.components.utils import Icon
+
+DOCS = Path(__file__).parents[1] / "docs"
+
+
+def test_index_is_consistent():
+    index = load_icons()
+
+    assert index["icons"]
+    for alias, target in index["aliases"].items():
+        assert alias not in index["icons"]
+        assert target in index["icons"], alias
+
+
+def test_names_resolve_prefixes_and_aliases():
+    assert icon_name("check") == "check"
+    assert icon_name("lucide:x-circle") == "circle-x"
+    assert icon_name("loader-2") == "loader-circle"
+    assert icon_name("ph:moon-bold") is None
+    assert icon_body("not-an-icon") is None
+
+
+def test_render_icon():
+    svg = str(render_icon("check", cls="h-4 w-4", width="16", data_slot="icon"))
+
+    assert svg.startswith("<svg")
+    assert '<path d="M20 6 9 17l-5-5" />' in svg
+    assert 'class="lucide lucide-check h-4 w-4"' in svg
+    assert 'width="16"' in svg
+    assert 'height="24"' in svg
+    assert 'data-slot="icon"' in svg
+    assert 'aria-hidden="true"' in svg
+
+
+def test_rendered_markup_is_cached_per_attributes():
+    assert render_icon("x", cls="a") is render_icon("x", cls="a")
+    assert render_icon("x", cls="a") is not render_icon("x", cls="b")
+    assert str(render_icon("x", hidden=True)) != str(render_icon("x", hidden=1))
+
+
+def test_icon_needs_no_script():
+    assert "<script" not in str(Icon("chevron-right", cls="size-4"))
+    fallback = str(Icon("ph:moon-bold"))
+    assert 'data-lucide="ph:moon-bold"' in fallback
+
+
+def test_index_loads_lazily():
+    code = (
+        "import json, starui.icons as icons\n"
+        "before = icons.load_icons.cache_info().currsize\n"
+        "icons.render_icon('check')\n"
+        "print(json.dumps([before, icons.load_icons.cache_info().currsize]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert json.loads(result.stdout) == [0, 1]
+
+
+def test_build_index_from_svg_files(tmp_path):
+    (tmp_path / "dot.svg").write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24">\n'
+        '  <circle cx="12" cy="12" r="1" />\n'
+        '  <path d="M0 0" />\n'
+        "</svg>\n"
+    )
+
+    index = build_index(tmp_path, {"point": "dot"})
+    path = write_index(index, tmp_path / "icons.json")
+
+    assert index["icons"] == {
+        "dot": '<circle cx="12" cy="12" r="1" /><path d="M0 0" />'
+    }
+    assert load_icons(path)["aliases"] == {"point": "dot"}
+
+
+def docs_icon_calls():
+    """Literal Icon(...) calls on the docs pages, as (name, attrs) pairs."""
+    calls = []
+    for path in sorted(DOCS.rglob("*.py")):
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.Call) and getattr(node.func, "id", "") == "Icon":
+                try:
+                    name = ast.literal_eval(node.args[0])
+                    attrs = {k.arg: ast.literal_eval(k.value) for k in node.keywords}
+                except (IndexError, ValueError):
+                    continue
+                calls.append((name, attrs))
+    return calls
+
+
+def pages():
+    from starui.registry.components.accordion import Accordion, AccordionItem
+    from starui.registry.components.select import (
+        Select,
+        SelectContent,
+        SelectItem,
+        SelectTrigger,
+    )
+
+    calls = docs_icon_calls()
+    return {
+        "docs icons": lambda: "".join(str(Icon(n, **a)) for n, a in calls),
+        "100 selects": lambda: "".join(
+            str(
+                Select(
+                    SelectTrigger(signal=f"s{i}"),
+                    SelectContent(SelectItem("a", "A"), signal=f"s{i}"),
+                    signal=f"s{i}",
+                )
+            )
+            for i in range(100)
+        ),
+        "accordion": lambda: str(
+            Accordion(*(AccordionItem("Body", summary=f"Q{i}") for i in range(20)))
+        ),
+        "table actions": lambda: "".join(
+            str(Icon(name, cls="size-4"))
+            for _ in range(200)
+            for name in ("eye", "pencil", "trash-2")
+        ),
+    }
+
+
+class TestSprite:
+    """Test rendering icons as references to a sprite sheet."""
+
+    def test_icons_reference_one_sheet(self):
+        with icon_sprite() as sheet:
+            first = str(Icon("check", cls="h-4"))
+            Icon("lucide:x")
+            Icon("check", cls="h-5")
+
+        assert '<use href="#icon-check"></use>' in first
+        assert "<path" not in first
+        assert list(sheet.icons) == ["check", "x"]
+        markup = str(sheet.render())
+        assert markup.count("<symbol") == 2
+        assert 'id="icon-check"' in markup
+        assert "<path" in str(Icon("check", cls="h-4"))  # Inline again outside
+
+    def test_external_sprite(self):
+        with icon_sprite("/static/icons.svg") as sheet:
+            markup = str(Icon("x"))
+
+        assert 'href="/static/icons.svg#icon-x"' in markup
+        assert str(sheet.render()) == ""
+        document = sprite_file(["x", "lucide:check", "ph:moon-bold"])
+        assert document.count("<symbol") == 2
+        assert sprite_file().count("<symbol") == len(load_icons()["icons"])
+
+    def test_drawing_overrides_stay_inline(self):
+        with icon_sprite() as sheet:
+            markup = str(Icon("x", stroke_width="1.5"))
+
+        assert "<path" in markup
+        assert 'stroke-width="1.5"' in markup
+        assert not sheet.icons
+
+    @pytest.mark.asyncio
+    async def test_route_decorator(self):
+        @with_icon_sprite
+        def page():
+            return Icon("x")
+
+        @with_icon_sprite
+        async def async_page():
+            return Icon("check")
+
+        assert str(page()).count("icon-x") == 2
+        assert "<symbol" in str(await async_page())
+
+    def test_sprite_shrinks_pages(self):
+        """Before/after bytes for pages with repeated icons."""
+        for label, render in pages().items():
+            inline = len(render())
+            with icon_sprite() as sheet:
+                body = render()
+            sprite = len(body) + len(str(sheet.render()))
+            print(f"\n{label}: {inline} -> {sprite} bytes")
+            assert sprite < inline
@@ -1,5 +1,7 @@
 """Test package initialization and basic functionality."""
 
+import pytest
+
 
 def test_package_importable():
     """Test that starui package can be imported."""
@@ -31,3 +33,56 @@ def test_package_has_entry_point():
     assert scripts["star"] == "starui.cli.main:app", (
         "CLI entry point has incorrect target"
     )
+
+
+def _import_in_subprocess(code: str) -> list[str]:
+    import json
+    import subprocess
+    import sys
+
+    script = f"import json, sys\n{code}\nprint(json.dumps(sorted(sys.modules)))\n"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_import_is_lazy():
+    """Test that importing a component only loads its own module."""
+    modules = _import_in_subprocess("import starui\nfrom starui import Button")
+
+    starui_modules = {m for m in modules if m.startswith("starui")}
+    assert starui_modules == {
+        "starui",
+        "starui.registry",
+        "starui.registry.components",
+        "starui.registry.components.button",
+        "starui.registry.components.utils",
+        "starui.render",
+        "starui.render.cache",
+        "starui.render.tracking",
+    }
+    for heavy in ("starhtml", "fastcore", "starlighter", "pydantic"):
+        assert heavy not in modules
+
+
+def test_lazy_exports_resolve():
+    """Test that every name in __all__ resolves, components before HTML tags."""
+    import rusty_tags
+
+    import starui
+    from starui.registry import components
+    from starui.registry.components import typography
+
+    assert set(components._MODULES) | set(components._ALIASES) == set(
+        components.__all__
+    )
+    for name in starui.__all__:
+        assert getattr(starui, name) is not None, name
+
+    assert starui.P is typography.P
+    assert starui.Div is rusty_tags.Div
+    assert components.CodeInlineCode is components.code_block.InlineCode
+
+    with pytest.raises(AttributeError):
+        _ = starui.NotAComponent